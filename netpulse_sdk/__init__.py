@@ -4,10 +4,13 @@ NetPulse SDK - Python client for NetPulse Network Automation Platform
 
 from importlib.metadata import version, PackageNotFoundError
 
+from .async_client import AsyncNetPulseClient
+from .async_job import AsyncJob, AsyncJobGroup
 from .client import NetPulseClient
 from .enums import DriverName, JobStatus, QueueStrategy, TaskStatus
 from .error import (
     AuthError,
+    CircuitOpenError,
     Error,
     JobFailedError,
     NetPulseError,
@@ -16,9 +19,11 @@ from .error import (
 )
 from .job import Job, JobGroup
 from .result import (
+    CompactResult,
     ConnectionTestResult,
     DetachedTaskInfo,
     DetachedTaskLog,
+    ErrorMatcher,
     JobProgress,
     Result,
     WebhookEvent,
@@ -38,7 +43,17 @@ from .types import (
     RenderingConfig,
     WebhookConfig,
 )
+from .spill import SpilledResults, SpillStore
+from .transport import (
+    AdaptiveConcurrency,
+    CircuitBreakers,
+    EndpointPool,
+    HedgePolicy,
+    RateLimit,
+    RetryPolicy,
+)
 from .utils import setup_logging, enable_debug
+from .webhook import WebhookReceiver
 
 # 保持向后兼容，导出为 NetPulse
 NetPulse = NetPulseClient
@@ -52,6 +67,7 @@ __all__ = [
     # Client
     "NetPulseClient",
     "NetPulse",
+    "AsyncNetPulseClient",
     # Enums
     "DriverName",
     "QueueStrategy",
@@ -60,17 +76,31 @@ __all__ = [
     # Job and Results
     "Job",
     "JobGroup",
+    "AsyncJob",
+    "AsyncJobGroup",
     "Result",
+    "CompactResult",
     "JobProgress",
     "ConnectionTestResult",
     "WorkerInfo",
     "DetachedTaskInfo",
     "DetachedTaskLog",
     "WebhookEvent",
+    "WebhookReceiver",
+    "ErrorMatcher",
+    "SpillStore",
+    "SpilledResults",
+    "RateLimit",
+    "AdaptiveConcurrency",
+    "HedgePolicy",
+    "EndpointPool",
+    "CircuitBreakers",
+    "RetryPolicy",
     # Errors
     "NetPulseError",
     "AuthError",
     "NetworkError",
+    "CircuitOpenError",
     "RequestTimeoutError",
     "JobFailedError",
     "Error",
@@ -0,0 +1,625 @@
+"""
+Asyncio NetPulse client
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Callable, Dict, List, Literal, Optional, Tuple, Union
+
+from .async_job import AsyncJob, AsyncJobGroup
+from .client import _ClientBase
+from .result import ConnectionTestResult, DetachedTaskInfo, DetachedTaskLog, WorkerInfo
+from .transport import AsyncHTTPClient
+
+log = logging.getLogger(__name__)
+
+
+class AsyncNetPulseClient(_ClientBase):
+    """NetPulse SDK client for asyncio
+
+    Mirrors NetPulseClient on top of httpx.AsyncClient: submissions and polls are
+    coroutines, so one event loop can keep thousands of requests in flight without
+    a thread per request. Accepts the same constructor arguments and config file
+    profiles as NetPulseClient.
+
+    Example::
+
+        async with AsyncNetPulseClient(base_url="http://localhost:9000", api_key="...") as np:
+            group = await np.collect(["10.1.1.1", "10.1.1.2"], "show version")
+            await group.wait()
+            print(group.stdout)
+
+    File transfer shortcuts (upload, download, fetch_staged_file) are only
+    available on NetPulseClient.
+    """
+
+    _http_class = AsyncHTTPClient
+    _job_class = AsyncJob
+    _group_class = AsyncJobGroup
+    _poll_scheduler_class = None
+
+    max_concurrency = 50
+
+    async def __aenter__(self) -> "AsyncNetPulseClient":
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - close connections"""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close HTTP connection pool (and the embedded webhook receiver, if any)"""
+        self._stop_webhook_receiver()
+        await self._http.close()
+
+    async def ping(self) -> bool:
+        """Check if NetPulse API is reachable"""
+        try:
+            await self._http.get("/health")
+            return True
+        except Exception:
+            return False
+
+    async def get_health(self) -> dict:
+        """Get system health status"""
+        return await self._http.get("/health")
+
+    async def test_connection(
+        self,
+        device: str,
+        connection_args: Optional[dict] = None,
+        driver: Optional[str] = None,
+        credential: Optional[dict] = None,
+    ) -> ConnectionTestResult:
+        """Test device connection (see NetPulseClient.test_connection)"""
+        use_driver = driver or self.driver
+        payload = self._build_connection_test_payload(
+            device, connection_args, use_driver, credential
+        )
+
+        try:
+            resp = await self._http.post("/device/test", json=payload)
+            return self._parse_connection_test(resp, device, use_driver)
+        except Exception as e:
+            return self._failed_connection_test(device, use_driver, e)
+
+    async def test_connections(
+        self,
+        devices: List[str],
+        connection_args: Optional[dict] = None,
+        driver: Optional[str] = None,
+        credential: Optional[dict] = None,
+    ) -> List[ConnectionTestResult]:
+        """Test multiple device connections concurrently
+
+        Results are returned in the same order as ``devices``.
+        """
+        semaphore = asyncio.Semaphore(self._http.fanout_limit(len(devices), self.max_concurrency))
+
+        async def _test(device: str) -> ConnectionTestResult:
+            async with semaphore:
+                try:
+                    return await self.test_connection(
+                        device,
+                        connection_args=connection_args,
+                        driver=driver,
+                        credential=credential,
+                    )
+                except Exception as e:
+                    # Create a failed result if something crashed
+                    return self._failed_connection_test(device, driver, e)
+
+        return list(await asyncio.gather(*(_test(device) for device in devices)))
+
+    async def run(
+        self,
+        devices: Union[List[str], str, List[dict]],
+        command: Union[List[str], str] = None,
+        config: Union[List[str], str] = None,
+        mode: Literal["auto", "exec", "bulk"] = "auto",
+        ttl: int = 300,
+        execution_timeout: Optional[int] = None,
+        connection_args: Optional[dict] = None,
+        driver: Optional[str] = None,
+        driver_args: Optional[dict] = None,
+        credential: Optional[dict] = None,
+        rendering: Optional[dict] = None,
+        parsing: Optional[dict] = None,
+        queue_strategy: Optional[Literal["fifo", "pinned"]] = None,
+        result_ttl: Optional[int] = None,
+        webhook: Optional[dict] = None,
+        file_transfer: Optional[dict] = None,
+        detach: bool = False,
+        push_interval: Optional[int] = None,
+        staged_file_id: Optional[str] = None,
+        local_upload_file: Optional[str] = None,
+        enable_mode: Optional[bool] = None,
+        save: Optional[bool] = None,
+        audit_mode: Optional[Literal["full", "metadata", "none"]] = None,
+        callback: Optional[Callable] = None,
+        auto_retry: bool = True,
+    ) -> Union[AsyncJob, AsyncJobGroup]:
+        """Execute operations on devices (see NetPulseClient.run)
+
+        Returns:
+            AsyncJob or AsyncJobGroup instance
+        """
+        was_list = isinstance(devices, list)
+        devices = [devices] if isinstance(devices, str) else devices
+
+        operation, operation_type = self._resolve_operation(command, config)
+
+        job = await self._execute(
+            devices=devices,
+            operation=operation,
+            operation_type=operation_type,
+            mode=mode,
+            ttl=ttl,
+            execution_timeout=execution_timeout,
+            connection_args=connection_args,
+            driver=driver,
+            driver_args=driver_args,
+            credential=credential,
+            rendering=rendering,
+            parsing=parsing,
+            queue_strategy=queue_strategy,
+            result_ttl=result_ttl,
+            webhook=webhook,
+            file_transfer=file_transfer,
+            detach=detach,
+            push_interval=push_interval,
+            staged_file_id=staged_file_id,
+            local_upload_file=local_upload_file,
+            enable_mode=enable_mode,
+            save=save,
+            audit_mode=audit_mode,
+            return_group=was_list or mode == "bulk",
+            auto_retry=auto_retry,
+        )
+
+        if callback and not detach:
+            await job.wait(callback=callback)
+
+        return job
+
+    async def collect(
+        self,
+        devices: Union[List[str], str, List[dict]],
+        command: Union[List[str], str, None] = None,
+        ttl: int = 300,
+        execution_timeout: Optional[int] = None,
+        connection_args: Optional[dict] = None,
+        driver: Optional[str] = None,
+        driver_args: Optional[dict] = None,
+        credential: Optional[dict] = None,
+        rendering: Optional[dict] = None,
+        parsing: Optional[dict] = None,
+        queue_strategy: Optional[Literal["fifo", "pinned"]] = None,
+        result_ttl: Optional[int] = None,
+        webhook: Optional[dict] = None,
+        file_transfer: Optional[dict] = None,
+        detach: bool = False,
+        push_interval: Optional[int] = None,
+        staged_file_id: Optional[str] = None,
+        local_upload_file: Optional[str] = None,
+        enable_mode: bool = False,
+        save: bool = False,
+        audit_mode: Optional[Literal["full", "metadata", "none"]] = None,
+        callback: Optional[Callable] = None,
+    ) -> Union[AsyncJob, AsyncJobGroup]:
+        """Information Gathering and Audit, read-only (see NetPulseClient.collect)"""
+        # Enforce read-only constraints
+        self._validate_collect(command, file_transfer, save)
+
+        was_list = isinstance(devices, list)
+        job = await self._execute(
+            devices=devices,
+            operation=command,
+            operation_type="command",
+            ttl=ttl,
+            execution_timeout=execution_timeout,
+            connection_args=connection_args,
+            driver=driver,
+            driver_args=driver_args,
+            credential=credential,
+            rendering=rendering,
+            parsing=parsing,
+            queue_strategy=queue_strategy,
+            result_ttl=result_ttl,
+            webhook=webhook,
+            file_transfer=file_transfer,
+            detach=detach,
+            push_interval=push_interval,
+            staged_file_id=staged_file_id,
+            local_upload_file=local_upload_file,
+            enable_mode=enable_mode,
+            save=save,
+            audit_mode=audit_mode,
+            return_group=was_list,
+        )
+
+        if callback and not detach:
+            await job.wait(callback=callback)
+
+        return job
+
+    async def _execute(
+        self,
+        devices: Union[List[str], str, List[dict]],
+        operation: Union[List[str], str] = None,
+        operation_type: Literal["command", "config"] = "command",
+        mode: Literal["auto", "exec", "bulk"] = "auto",
+        ttl: int = 300,
+        execution_timeout: Optional[int] = None,
+        connection_args: Optional[dict] = None,
+        driver: Optional[str] = None,
+        driver_args: Optional[dict] = None,
+        credential: Optional[dict] = None,
+        rendering: Optional[dict] = None,
+        parsing: Optional[dict] = None,
+        queue_strategy: Optional[Literal["fifo", "pinned"]] = None,
+        result_ttl: Optional[int] = None,
+        webhook: Optional[dict] = None,
+        file_transfer: Optional[dict] = None,
+        detach: bool = False,
+        push_interval: Optional[int] = None,
+        staged_file_id: Optional[str] = None,
+        local_upload_file: Optional[str] = None,
+        enable_mode: Optional[bool] = None,
+        save: Optional[bool] = None,
+        audit_mode: Optional[Literal["full", "metadata", "none"]] = None,
+        return_group: bool = False,
+        auto_retry: bool = True,
+    ) -> Union[AsyncJob, AsyncJobGroup]:
+        """Internal execute dispatcher"""
+        webhook, receiver = self._auto_webhook(webhook, detach)
+        prepared = self._prepare_execute(
+            devices=devices,
+            operation=operation,
+            connection_args=connection_args,
+            driver=driver,
+            credential=credential,
+            enable_mode=enable_mode,
+            save=save,
+            file_transfer=file_transfer,
+            local_upload_file=local_upload_file,
+        )
+        devices = prepared["devices"]
+        optional = dict(
+            driver_args=driver_args,
+            credential=prepared["credential"],
+            rendering=rendering,
+            parsing=parsing,
+            queue_strategy=queue_strategy,
+            result_ttl=result_ttl,
+            webhook=webhook,
+            file_transfer=file_transfer,
+            detach=detach,
+            push_interval=push_interval,
+            staged_file_id=staged_file_id,
+            enable_mode=prepared["enable_mode"],
+            save=prepared["save"],
+            audit_mode=audit_mode,
+        )
+
+        if self._select_api(devices, mode) == "bulk":
+            payload = self._build_bulk_payload(
+                devices=devices,
+                operation=prepared["operation"],
+                operation_type=operation_type,
+                ttl=ttl,
+                connection_args=prepared["connection_args"],
+                driver=prepared["driver"],
+                **optional,
+            )
+            group = await self._call_bulk_api(devices, prepared["operation"], payload, auto_retry)
+            return self._attach_receiver(group, receiver)
+
+        device = devices[0]
+        device_host = device if isinstance(device, str) else device.get("host")
+        payload = self._build_exec_payload(
+            device=device_host,
+            operation=prepared["operation"],
+            operation_type=operation_type,
+            ttl=ttl,
+            connection_args=prepared["connection_args"],
+            driver=prepared["driver"],
+            execution_timeout=execution_timeout,
+            **optional,
+        )
+        job = await self._call_exec_api(
+            device_host, prepared["operation"], payload, local_upload_file
+        )
+        self._attach_receiver(job, receiver)
+        if return_group:
+            return self._group_class(jobs=[job])
+        return job
+
+    async def _call_exec_api(
+        self,
+        device: str,
+        operation: List[str],
+        payload: dict,
+        local_upload_file: Optional[str] = None,
+    ) -> AsyncJob:
+        """Call POST /device/exec
+
+        Returns single AsyncJob
+        """
+        if local_upload_file is not None:
+            if not os.path.exists(local_upload_file):
+                raise ValueError(f"File {local_upload_file} does not exist")
+
+            with open(local_upload_file, "rb") as f:
+                log.debug(
+                    f"Calling multipart exec API for device: {device} with file: {local_upload_file}"
+                )
+                resp = await self._http.post_multipart(
+                    "/device/exec",
+                    data={"request": json.dumps(payload)},
+                    files={"file": (os.path.basename(local_upload_file), f)},
+                )
+        else:
+            log.debug(f"Calling exec API for device: {device}")
+            resp = await self._http.post("/device/exec", json=payload)
+
+        # 0.4.0: resp is JobInResponse
+        return self._job_class(client=self, job_data=resp, device_name=device, command=operation)
+
+    async def _call_bulk_api(
+        self,
+        devices: List[Union[str, dict]],
+        operation: List[str],
+        payload: dict,
+        auto_retry: bool = True,
+    ) -> AsyncJobGroup:
+        """Call POST /device/bulk
+
+        Returns AsyncJobGroup (manages multiple AsyncJobs)
+        """
+        chunks = self._bulk_chunks(payload)
+        log.debug(
+            f"Calling bulk API for {len(payload['devices'])} devices in {len(chunks)} chunk(s)"
+        )
+
+        if len(chunks) == 1:
+            succeeded, failed, retried_hosts = await self._submit_bulk_chunk(payload, auto_retry)
+        else:
+            semaphore = asyncio.Semaphore(self.bulk_concurrency)
+
+            async def _submit(chunk: dict):
+                async with semaphore:
+                    return await self._submit_bulk_chunk(chunk, auto_retry)
+
+            outcomes = await asyncio.gather(
+                *(_submit(chunk) for chunk in chunks), return_exceptions=True
+            )
+            succeeded, failed, retried_hosts = self._merge_bulk_chunks(chunks, outcomes)
+
+        return self._build_bulk_group(devices, operation, succeeded, failed, retried_hosts)
+
+    async def _submit_bulk_chunk(
+        self, payload: dict, auto_retry: bool
+    ) -> Tuple[list, list, List[str]]:
+        """POST one bulk payload, retrying failed devices with backoff if auto_retry is set"""
+        resp = await self._http.post("/device/bulk", json=payload)
+
+        # 0.4.0: resp is BatchSubmitJobResponse {succeeded, failed}
+        succeeded = resp.get("succeeded", [])
+        failed = resp.get("failed", [])
+        retried_hosts: List[str] = []
+
+        retry = 0
+        while auto_retry:
+            plan = self._plan_bulk_retry(payload, succeeded, failed, retry)
+            if plan is None:
+                break
+            retry_devices, delay = plan
+            retried_hosts.extend(
+                h for h in (d.get("host", "") for d in retry_devices) if h not in retried_hosts
+            )
+            await asyncio.sleep(delay)
+
+            retry_resp = await self._http.post(
+                "/device/bulk", json={**payload, "devices": retry_devices}
+            )
+            retry_succeeded = retry_resp.get("succeeded", [])
+            if retry_succeeded:
+                succeeded.extend(retry_succeeded)
+                log.info(f"Retry succeeded for {len(retry_succeeded)} devices")
+
+            failed = retry_resp.get("failed", [])
+            retry += 1
+
+        return succeeded, failed, retried_hosts
+
+    async def render_template(
+        self,
+        template: str,
+        context: dict,
+        name: str = "jinja2",
+        **kwargs,
+    ) -> str:
+        """Render a configuration template (see NetPulseClient.render_template)"""
+        payload = {
+            "name": name,
+            "template": template,
+            "context": context,
+            **kwargs,
+        }
+        resp = await self._http.post("/template/render", json=payload)
+        return self._parse_rendered(resp)
+
+    async def parse_template(
+        self,
+        output: str,
+        name: str = "ttp",
+        template: Optional[str] = None,
+        **kwargs,
+    ) -> Union[dict, list]:
+        """Parse device output using templates (see NetPulseClient.parse_template)"""
+        payload = {
+            "name": name,
+            "context": output,
+            **kwargs,
+        }
+        if template:
+            payload["template"] = template
+
+        return await self._http.post("/template/parse", json=payload)
+
+    async def get_job(self, job_id: str) -> AsyncJob:
+        """Get Job by ID (GET /jobs/{id})"""
+        resp = await self._http.get(f"/jobs/{job_id}")
+        return self._job_from_response(resp)
+
+    async def list_jobs(
+        self,
+        status: Optional[str] = None,
+        queue: Optional[str] = None,
+        node: Optional[str] = None,
+        host: Optional[str] = None,
+    ) -> List[AsyncJob]:
+        """List jobs with optional filters (GET /jobs)"""
+        params = self._filter_params(queue=queue, status=status, node=node, host=host)
+        resp = await self._http.get("/jobs", params=params)
+        # 0.4.0+: resp is List[JobInResponse]
+        return self._jobs_from_list(resp)
+
+    async def _fetch_job_data(self, job_ids: List[str]) -> Dict[str, dict]:
+        """Fetch many JobInResponse payloads with batched GET /jobs?id=... queries"""
+        found: Dict[str, dict] = {}
+        if not self._batch_poll_supported:
+            return found
+        first, *rest = self._job_id_batches(job_ids)
+        # Check the filter on one batch before sending the rest concurrently
+        responses = [await self._http.get("/jobs", params={"id": first})]
+        if rest and self._collect_job_data(responses[0], first, {}):
+            responses += await asyncio.gather(
+                *(self._http.get("/jobs", params={"id": b}) for b in rest)
+            )
+        for batch, resp in zip([first, *rest], responses):
+            if not self._collect_job_data(resp, batch, found):
+                self._disable_batch_poll()
+                break
+        return found
+
+    async def cancel_job(self, job_id: str) -> bool:
+        """Cancel/Delete a job (DELETE /jobs/{id})"""
+        await self._http.delete(f"/jobs/{job_id}")
+        return True
+
+    async def cancel_jobs(
+        self,
+        queue: Optional[str] = None,
+        host: Optional[str] = None,
+    ) -> List[str]:
+        """Cancel multiple queued jobs"""
+        params = self._filter_params(queue=queue, host=host)
+        return await self._http.delete("/jobs", params=params)
+
+    async def list_workers(
+        self,
+        queue: Optional[str] = None,
+        node: Optional[str] = None,
+        host: Optional[str] = None,
+    ) -> List[WorkerInfo]:
+        """List workers with optional filters"""
+        params = self._filter_params(queue=queue, node=node, host=host)
+        resp = await self._http.get("/workers", params=params)
+        return [WorkerInfo.model_validate(w) for w in resp]
+
+    async def delete_worker(self, name: str) -> bool:
+        """Delete a single worker by name (DELETE /workers/{name})"""
+        await self._http.delete(f"/workers/{name}")
+        return True
+
+    async def delete_workers(
+        self,
+        queue: Optional[str] = None,
+        node: Optional[str] = None,
+        host: Optional[str] = None,
+    ) -> list:
+        """Delete multiple workers with filters (DELETE /workers)"""
+        params = self._filter_params(queue=queue, node=node, host=host)
+        return await self._http.delete("/workers", params=params)
+
+    # =========================================================================
+    # Detached Tasks (Task Recovery)
+    # =========================================================================
+
+    async def list_detached_tasks(self, status: Optional[str] = None) -> List[DetachedTaskInfo]:
+        """List all active detached tasks in the server registry"""
+        params = {}
+        if status:
+            params["status"] = status
+        resp = await self._http.get("/detached-tasks", params=params)
+        return [DetachedTaskInfo.model_validate(t) for t in resp]
+
+    async def get_detached_task(
+        self, task_id: str, offset: Optional[int] = None
+    ) -> DetachedTaskLog:
+        """Query a detached task's logs and status (GET /detached-tasks/{task_id})"""
+        params = {}
+        if offset is not None:
+            params["offset"] = offset
+        resp = await self._http.get(f"/detached-tasks/{task_id}", params=params)
+        return DetachedTaskLog.model_validate(resp)
+
+    async def tail_detached_task(
+        self,
+        task_id: str,
+        poll_interval: float = 3.0,
+        callback: Optional[Callable] = None,
+    ) -> str:
+        """Stream incremental logs from a running detached task until it finishes.
+
+        Args:
+            task_id: Detached task ID (from job.task_id after run(..., detach=True))
+            poll_interval: Seconds between polls (default 3.0)
+            callback: Optional function(log_chunk: str) called with each new log chunk.
+
+        Returns:
+            Full accumulated log output.
+        """
+        offset = 0
+        full_output = []
+
+        while True:
+            snap = await self.get_detached_task(task_id, offset=offset)
+            if snap.output:
+                full_output.append(snap.output)
+                if callback:
+                    callback(snap.output)
+            offset = snap.next_offset
+
+            if not snap.is_running:
+                break
+
+            await asyncio.sleep(poll_interval)
+
+        return "".join(full_output)
+
+    async def cancel_detached_task(self, task_id: str) -> bool:
+        """Terminate a detached task on the remote host"""
+        await self._http.delete(f"/detached-tasks/{task_id}")
+        return True
+
+    async def discover_detached_tasks(
+        self,
+        device: str,
+        driver: str = "paramiko",
+        connection_args: Optional[dict] = None,
+        credential: Optional[dict] = None,
+    ) -> List[DetachedTaskInfo]:
+        """Scan a device for background tasks and sync them into the server registry"""
+        payload = self._build_discover_payload(device, driver, connection_args, credential)
+        resp = await self._http.post("/detached-tasks/discover", json=payload)
+        return self._parse_discovered_tasks(resp)
+
+    async def discover_jobs(self, status: str = "running") -> List[AsyncJob]:
+        """Recover Job objects for existing detached tasks"""
+        return self._jobs_from_detached_tasks(await self.list_detached_tasks(status=status))
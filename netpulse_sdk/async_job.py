@@ -0,0 +1,298 @@
+"""
+Asyncio Job and JobGroup implementation (used by AsyncNetPulseClient)
+"""
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator, Optional
+
+from .error import JobFailedError
+from .job import Job, JobGroup
+from .result import Result
+
+if TYPE_CHECKING:
+    from .async_client import AsyncNetPulseClient
+
+log = logging.getLogger(__name__)
+
+
+class AsyncJob(Job):
+    """Single job wrapper for AsyncNetPulseClient
+
+    refresh(), wait(), cancel(), first(), one() and stream() are coroutines.
+    Result accessors (stdout, parsed, succeeded(), ...) never block: they require
+    the job to be done, so ``await job.wait()`` (or ``await job``) first.
+    """
+
+    _client: "AsyncNetPulseClient"
+
+    async def refresh(self) -> "AsyncJob":
+        """Refresh job status from API (GET /jobs/{id})"""
+        resp = await self._client._http.get(f"/jobs/{self.id}")
+        # 0.4.0+: resp is JobInResponse
+        self._apply_data(resp)
+        return self
+
+    async def _await_update(self, interval: float, remaining: Optional[float] = None) -> None:
+        """Wait for a webhook push (polling as slow fallback), or sleep then poll"""
+        receiver = self._receiver
+        if receiver is None:
+            await asyncio.sleep(interval)
+            await self.refresh()
+            return
+
+        wait_s = receiver.fallback_interval
+        if remaining is not None:
+            wait_s = max(min(wait_s, remaining), 0)
+        event = (await receiver.wait_any_async([self.id], wait_s)).get(self.id)
+        if event is None or not self._apply_webhook(event):
+            await self.refresh()
+
+    async def wait(
+        self,
+        timeout: Optional[int] = None,
+        poll_interval: float = 0.5,
+        callback: Optional[Callable] = None,
+    ) -> "AsyncJob":
+        """Wait for job completion by polling GET /jobs/{id}
+
+        Completes on the push event if the job was submitted with a webhook receiver.
+
+        Args:
+            timeout: Maximum wait time in seconds (None for infinite)
+            poll_interval: Polling frequency in seconds (default 0.5)
+            callback: Optional progress callback function(JobProgress)
+        """
+        start_time = time.time()
+        interval = poll_interval
+        max_interval = 5.0
+        backoff_factor = 1.5
+
+        if callback:
+            callback(self.progress())
+
+        while not self.is_done():
+            elapsed = time.time() - start_time
+            if timeout and elapsed > timeout:
+                raise JobFailedError(f"Job {self.id} timed out", job_id=self.id)
+
+            await self._await_update(interval, timeout - elapsed if timeout else None)
+
+            if callback:
+                callback(self.progress())
+
+            interval = min(interval * backoff_factor, max_interval)
+
+        return self
+
+    def __await__(self):
+        """``await job`` is shorthand for ``await job.wait()``"""
+        return self.wait().__await__()
+
+    def _ensure_done(self) -> None:
+        """Accessors must not block the event loop: require a finished job"""
+        if not self.is_done():
+            raise RuntimeError(f"Job {self.id} is not done yet; await job.wait() first")
+
+    async def cancel(self) -> bool:
+        """Cancel job (only queued status can be canceled)"""
+        if self.status != "queued":
+            log.warning(f"Job {self.id} status is {self.status}, cannot cancel")
+            return False
+
+        await self._client._http.delete(f"/jobs/{self.id}")
+        try:
+            await self.refresh()
+        except Exception:
+            # Backend may delete the job on cancel; update status locally
+            self._apply_data({**self._data, "status": "canceled"})
+        return True
+
+    async def first(self) -> Result:
+        """Return the first result, waiting for completion if needed"""
+        await self.wait()
+        return super().first()
+
+    async def one(self) -> Result:
+        """Return the single result, raising if there is not exactly one"""
+        await self.wait()
+        return super().one()
+
+    async def stream(self, poll_interval: float = 0.5) -> AsyncIterator[Result]:
+        """Stream results (waits until completion)"""
+        await self.wait(poll_interval=poll_interval)
+        for result in self.results():
+            yield result
+
+    def __aiter__(self) -> AsyncIterator[Result]:
+        """Support ``async for result in job``"""
+        return self.stream()
+
+    def __iter__(self) -> Iterator[Result]:
+        """Iterate results of a finished job"""
+        self._ensure_done()
+        return iter(self.results())
+
+
+class AsyncJobGroup(JobGroup):
+    """Multiple job aggregation manager for AsyncNetPulseClient
+
+    All jobs are refreshed concurrently on the event loop (bounded by
+    ``max_concurrency``) instead of through a thread pool.
+    """
+
+    max_concurrency = 50
+
+    async def refresh(self, batched: Optional[bool] = None) -> "AsyncJobGroup":
+        """Refresh unfinished job statuses concurrently (see JobGroup.refresh)"""
+        pending = self._begin_refresh()
+        if pending and (self.batch_refresh if batched is None else batched):
+            client = pending[0]._client
+            states = await client._fetch_job_data([job.id for job in pending])
+            pending = self._apply_batch(pending, states)
+
+        if pending:
+            workers = pending[0]._client._http.fanout_limit(len(pending), self.max_concurrency)
+            semaphore = asyncio.Semaphore(workers)
+
+            async def _refresh(job: AsyncJob) -> None:
+                async with semaphore:
+                    await job.refresh()
+
+            await asyncio.gather(*(_refresh(job) for job in pending))
+
+        self._settle()
+        return self
+
+    async def _await_update(self, interval: float, remaining: Optional[float] = None) -> None:
+        """Wait for webhook pushes from pending jobs (slow polling fallback), or sleep and poll"""
+        receiver = self._webhook_receiver()
+        if receiver is None:
+            await asyncio.sleep(interval)
+            await self.refresh()
+            return
+
+        wait_s = receiver.fallback_interval
+        if remaining is not None:
+            wait_s = max(min(wait_s, remaining), 0)
+        events = await receiver.wait_any_async([job.id for job in self.pending], wait_s)
+        if not events or not self._apply_events(events):
+            await self.refresh()
+        else:
+            self._settle()
+
+    async def wait(
+        self,
+        timeout: Optional[int] = None,
+        poll_interval: float = 0.5,
+        callback: Optional[Callable] = None,
+    ) -> "AsyncJobGroup":
+        """Wait for all jobs to complete by polling GET /jobs/{id}"""
+        start_time = time.time()
+        interval = poll_interval
+        max_interval = 5.0
+        backoff_factor = 1.5
+
+        if callback:
+            callback(self.progress())
+
+        while not self.is_done():
+            elapsed = time.time() - start_time
+            if timeout and elapsed > timeout:
+                raise JobFailedError("JobGroup wait timeout")
+
+            await self._await_update(interval, timeout - elapsed if timeout else None)
+
+            if callback:
+                callback(self.progress())
+
+            interval = min(interval * backoff_factor, max_interval)
+
+        self._settle()
+        return self
+
+    def __await__(self):
+        """``await group`` is shorthand for ``await group.wait()``"""
+        return self.wait().__await__()
+
+    def _ensure_done(self) -> None:
+        """Accessors must not block the event loop: require all jobs to be done"""
+        if not self.is_done():
+            raise RuntimeError("JobGroup is not done yet; await group.wait() first")
+
+    async def cancel(self) -> None:
+        """Cancel all jobs"""
+        for job in self.jobs:
+            try:
+                await job.cancel()
+            except Exception as e:
+                log.warning(f"Failed to cancel Job {job.id}: {e}")
+
+    async def _iter_completed(self, poll_interval: float = 0.5) -> AsyncIterator[AsyncJob]:
+        """Yield each job once, as soon as it reaches a terminal status"""
+        interval = poll_interval
+        max_interval = 5.0
+        backoff_factor = 1.5
+        waiting = list(self.jobs)
+
+        while True:
+            still_waiting = []
+            for job in waiting:
+                if job.is_done():
+                    yield job
+                else:
+                    still_waiting.append(job)
+            waiting = still_waiting
+            if not waiting:
+                return
+
+            await self._await_update(interval)
+            interval = min(interval * backoff_factor, max_interval)
+
+    async def stream(self, poll_interval: float = 0.5) -> AsyncIterator[Result]:
+        """Stream results as jobs complete (each job's results once, when it finishes)"""
+        async for job in self._iter_completed(poll_interval):
+            for result in job.results():
+                yield result
+
+    async def iter_json_lines(
+        self, release: bool = False, poll_interval: float = 0.5
+    ) -> AsyncIterator[bytes]:
+        """Yield one JSON document per result, job by job as they complete
+
+        See JobGroup.iter_json_lines.
+        """
+        async for job in self._iter_completed(poll_interval):
+            for line in self._json_lines(job, release):
+                yield line
+
+    async def write_ndjson(self, fp, release: bool = False, poll_interval: float = 0.5) -> int:
+        """Write results to a file object as NDJSON (see JobGroup.write_ndjson)"""
+        import io
+
+        text = isinstance(fp, io.TextIOBase)
+        count = 0
+        async for line in self.iter_json_lines(release=release, poll_interval=poll_interval):
+            fp.write(line.decode("utf-8") + "\n" if text else line + b"\n")
+            count += 1
+        return count
+
+    async def first(self) -> Result:
+        """Return the first result across all jobs, waiting for completion if needed"""
+        await self.wait()
+        return super().first()
+
+    async def one(self) -> Result:
+        """Return the single result, raising if there is not exactly one"""
+        await self.wait()
+        return super().one()
+
+    def __aiter__(self) -> AsyncIterator[Result]:
+        """Support ``async for result in group`` (streams as jobs complete)"""
+        return self.stream()
+
+    def __iter__(self) -> Iterator[Result]:
+        """Iterate results of a finished group"""
+        self._ensure_done()
+        return iter(self.results())
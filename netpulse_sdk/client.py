@@ -4,9 +4,11 @@ NetPulse client
 
 import logging
 import os
-from typing import Callable, List, Literal, Optional, Union
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Literal, Optional, Tuple, Union
 
-from .error import NetPulseError
+from .error import AuthError, CircuitOpenError, NetPulseError
 from .job import Job, JobGroup
 from .result import (
     ConnectionTestResult,
@@ -16,13 +18,37 @@ from .result import (
     Result,
     WorkerInfo,
 )
-from .transport import HTTPClient
+from .scheduler import PollScheduler
+from .spill import SpillStore
+from .transport import (
+    AdaptiveConcurrency,
+    CircuitBreakers,
+    EndpointPool,
+    HedgePolicy,
+    HTTPClient,
+    RateLimit,
+    RetryPolicy,
+)
+from .transport.timeouts import TimeoutSpec
+from .webhook import WebhookReceiver
 
 log = logging.getLogger(__name__)
 
+# Resubmission of failed bulk devices when no retry policy is configured
+_BULK_RETRY = RetryPolicy(max_attempts=2)
 
-class NetPulseClient:
-    """NetPulse SDK client"""
+
+class _ClientBase:
+    """Configuration and request building shared by the sync and async clients"""
+
+    _http_class = HTTPClient
+    _job_class = Job
+    _group_class = JobGroup
+    # Shared status poller behind poll_scheduler=True (None: not supported)
+    _poll_scheduler_class: Optional[type] = PollScheduler
+
+    # Maximum job IDs per batched GET /jobs status query
+    STATUS_BATCH_SIZE = 200
 
     DEFAULT_DRIVER_ARGS = {
         "read_timeout": 60,
@@ -32,9 +58,9 @@ class NetPulseClient:
 
     def __init__(
         self,
-        base_url: Optional[str] = None,
+        base_url: Union[None, str, List[str]] = None,
         api_key: Optional[str] = None,
-        timeout: Optional[int] = None,
+        timeout: Optional[TimeoutSpec] = None,
         driver: Optional[str] = None,
         default_connection_args: Optional[dict] = None,
         pool_connections: Optional[int] = None,
@@ -46,24 +72,87 @@ class NetPulseClient:
         save: bool = False,
         api_key_name: Optional[str] = None,
         default_credential: Optional[dict] = None,
+        batch_poll: Optional[bool] = None,
+        webhook_receiver: Optional[WebhookReceiver] = None,
+        bulk_chunk_size: Optional[int] = None,
+        bulk_concurrency: Optional[int] = None,
+        poll_scheduler: Optional[bool] = None,
+        json_codec: Optional[str] = None,
+        spill_dir: Optional[str] = None,
+        http2: Optional[bool] = None,
+        compression: Optional[str] = None,
+        compression_threshold: Optional[int] = None,
+        rate_limits: Optional[Dict[str, Union[dict, RateLimit]]] = None,
+        adaptive_concurrency: Union[None, bool, dict, AdaptiveConcurrency] = None,
+        hedging: Union[None, bool, dict, HedgePolicy] = None,
+        circuit_breaker: Union[None, bool, dict, CircuitBreakers] = None,
+        timeouts: Optional[Dict[str, TimeoutSpec]] = None,
+        retry: Union[None, bool, dict, RetryPolicy] = None,
     ):
         """Initialize NetPulse client
 
         Args:
             base_url: NetPulse API URL. Falls back to config file, then NETPULSE_URL env var.
+                A list (or comma-separated NETPULSE_URL) of replica URLs balances requests
+                over them by fewest outstanding requests, ejecting failing replicas until
+                their /health probe succeeds and failing idempotent calls over
             api_key: API key. Falls back to config file, then NETPULSE_API_KEY env var.
-            timeout: HTTP request timeout in seconds (default 30)
+            timeout: HTTP request timeout: seconds, an httpx.Timeout, or a dict of
+                connect/read/write/pool seconds (default 30 for each)
             driver: Default driver (netmiko, napalm, pyeapi, paramiko). Default "netmiko"
             default_connection_args: Default connection arguments (username, password, etc.)
             default_credential: Default Vault credential reference (optional)
             pool_connections: HTTP connection pool count (default 10)
             pool_maxsize: Maximum connections per pool (default 200, increase to 500 for large batches)
-            max_retries: HTTP request auto-retry count (default 3)
+            max_retries: Transport-level retries of failed connection attempts (default 3)
             profile: Config profile name (default uses 'default' profile)
             config_path: Explicit config file path (optional)
             enable_mode: Default enable mode (Netmiko)
             save: Default save mode (Netmiko)
             api_key_name: API key header name (default: X-API-KEY)
+            batch_poll: Poll JobGroup statuses with batched GET /jobs queries instead of
+                one GET /jobs/{id} per job (default False). Turned off automatically
+                if the server ignores the GET /jobs id filter
+            webhook_receiver: Started WebhookReceiver registered as the webhook of jobs
+                submitted without one, so wait()/stream() complete on push events
+            bulk_chunk_size: Max devices per POST /device/bulk request; larger device
+                lists are split and merged into one JobGroup (default 1000)
+            bulk_concurrency: Bulk chunks submitted concurrently (default 4)
+            poll_scheduler: Let all waiting jobs share one adaptive status poller
+                (batched when batch_poll is on) instead of polling individually (default False; not supported by
+                AsyncNetPulseClient, which raises ValueError)
+            json_codec: JSON codec for request/response bodies: "auto" (orjson or
+                msgspec if installed, else stdlib), "orjson", "msgspec" or "json"
+            spill_dir: Directory where JobGroups spill finished job payloads to a
+                memory-mapped segment file instead of keeping them in RAM (default off)
+            http2: Multiplex requests over HTTP/2 connections (HTTPS only, requires
+                ``pip install 'netpulse-sdk[http2]'``, default False)
+            compression: Compress large JSON request bodies (bulk submissions) with
+                "gzip" or "zstd" (zstd requires ``netpulse-sdk[zstd]``, default None)
+            compression_threshold: Minimum body size in bytes to compress (default 16384)
+            rate_limits: Client-side limits per endpoint class ("submit", "poll",
+                "download"), each a RateLimit or {"rate", "burst", "max_in_flight"} dict
+            adaptive_concurrency: Adapt the number of concurrent requests to server
+                capacity (AIMD): True, an AdaptiveConcurrency, or its kwargs as a dict.
+                Fan-out helpers then size their pools to its max_limit (default off)
+            hedging: Duplicate slow GET /jobs/{id}, /detached-tasks/{id} and /workers
+                requests after a p95-based delay and use the first answer: True, a
+                HedgePolicy, or its kwargs as a dict (default off). Costs up to
+                min(pool_maxsize, 50) request threads plus max_hedge_ratio times as
+                many duplicate threads
+            circuit_breaker: Per-host circuit breaker: once the error rate of a host is
+                high, requests to it raise CircuitOpenError immediately instead of
+                waiting out timeouts: True, a CircuitBreakers, or CircuitBreaker kwargs
+                as a dict (default off)
+            timeouts: Per-operation timeout profiles overriding timeout, keyed by
+                "submit", "poll", "download" or "template"; each value is seconds, an
+                httpx.Timeout or a dict of fields to override, e.g.
+                {"poll": 5, "submit": {"read": 120}} (default none)
+            retry: Retry failed requests (transport errors, 429/502/503/504) with jittered
+                exponential backoff, honouring Retry-After; POST/PATCH only if nothing
+                reached the server or idempotency_keys is enabled. True, a RetryPolicy,
+                or its kwargs as a dict (default off). Also paces the resubmission of
+                devices that failed bulk submission (auto_retry)
         """
         # Load config file
         from .config import load_config, get_config_value
@@ -112,14 +201,62 @@ class NetPulseClient:
         max_retries = (
             max_retries if max_retries is not None else get_config_value(config, "max_retries", 3)
         )
+        batch_poll = (
+            batch_poll if batch_poll is not None else get_config_value(config, "batch_poll", False)
+        )
+        bulk_chunk_size = (
+            bulk_chunk_size
+            if bulk_chunk_size is not None
+            else get_config_value(config, "bulk_chunk_size", 1000)
+        )
+        bulk_concurrency = (
+            bulk_concurrency
+            if bulk_concurrency is not None
+            else get_config_value(config, "bulk_concurrency", 4)
+        )
+        poll_scheduler = (
+            poll_scheduler
+            if poll_scheduler is not None
+            else get_config_value(config, "poll_scheduler", False)
+        )
+        json_codec = json_codec or get_config_value(config, "json_codec", "auto")
+        spill_dir = spill_dir or get_config_value(config, "spill_dir")
+        http2 = http2 if http2 is not None else get_config_value(config, "http2", False)
+        compression = compression or get_config_value(config, "compression")
+        compression_threshold = (
+            compression_threshold
+            if compression_threshold is not None
+            else get_config_value(config, "compression_threshold", 16384)
+        )
+        rate_limits = rate_limits or get_config_value(config, "rate_limits")
+        adaptive_concurrency = (
+            adaptive_concurrency
+            if adaptive_concurrency is not None
+            else get_config_value(config, "adaptive_concurrency")
+        )
+        hedging = hedging if hedging is not None else get_config_value(config, "hedging")
+        timeouts = timeouts if timeouts is not None else get_config_value(config, "timeouts")
+        retry = retry if retry is not None else get_config_value(config, "retry")
+        circuit_breaker = (
+            circuit_breaker
+            if circuit_breaker is not None
+            else get_config_value(config, "circuit_breaker")
+        )
+
+        if isinstance(base_url, str) and "," in base_url:
+            base_url = [url.strip() for url in base_url.split(",") if url.strip()]
 
         # Improved error messages
         if not base_url:
             raise ValueError("base_url is required (pass to client, or set NETPULSE_URL)")
         if not api_key:
             raise ValueError("api_key is required (pass to client, or set NETPULSE_API_KEY)")
+        if bulk_chunk_size < 1 or bulk_concurrency < 1:
+            raise ValueError("bulk_chunk_size and bulk_concurrency must be >= 1")
+        if poll_scheduler and self._poll_scheduler_class is None:
+            raise ValueError(f"poll_scheduler is not supported by {type(self).__name__}")
 
-        self._http = HTTPClient(
+        self._http = self._http_class(
             base_url=base_url,
             api_key=api_key,
             api_key_name=api_key_name,
@@ -127,12 +264,664 @@ class NetPulseClient:
             pool_connections=pool_connections,
             pool_maxsize=pool_maxsize,
             max_retries=max_retries,
+            json_codec=json_codec,
+            http2=bool(http2),
+            compression=compression,
+            compression_threshold=compression_threshold,
+            rate_limits=rate_limits,
+            adaptive_concurrency=adaptive_concurrency,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            timeouts=timeouts,
+            retry=retry,
         )
         self.driver = driver
         self.default_connection_args = default_connection_args or {}
         self.default_credential = default_credential or None
         self.enable_mode = enable_mode
         self.save = save
+        self.batch_poll = bool(batch_poll)
+        # Cleared once the server is seen ignoring the GET /jobs id filter
+        self._batch_poll_supported = True
+        self.bulk_chunk_size = bulk_chunk_size
+        self.bulk_concurrency = bulk_concurrency
+        self.spill_dir = spill_dir
+        self._poll_scheduler = self._poll_scheduler_class(self) if poll_scheduler else None
+        self._webhook_receiver = webhook_receiver
+        self._owns_receiver = False
+
+    @property
+    def hedging(self) -> Optional[HedgePolicy]:
+        """Request hedging policy and its metrics (stats()), None when hedging is off"""
+        return self._http.hedging
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Request retry policy, None when retries are off"""
+        return self._http.retry
+
+    @property
+    def circuit_breakers(self) -> Optional[CircuitBreakers]:
+        """Per-host circuit breakers (stats()), None when the breaker is off"""
+        return self._http.breakers
+
+    @property
+    def endpoints(self) -> Optional[EndpointPool]:
+        """Replica pool (stats()) when several base URLs are configured, else None"""
+        return self._http.endpoints
+
+    def enable_webhook_receiver(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 0,
+        public_url: Optional[str] = None,
+        fallback_interval: float = 15.0,
+    ) -> WebhookReceiver:
+        """Start an embedded webhook receiver for push-based job completion
+
+        Jobs submitted afterwards without an explicit webhook report completion to
+        this receiver; wait()/stream() then poll only every fallback_interval seconds.
+        The receiver is stopped by close().
+
+        Args:
+            host: Bind address
+            port: Bind port (0 picks a free port)
+            public_url: Base URL the NetPulse server can reach this host on
+            fallback_interval: Seconds between safety polls while waiting for a push
+
+        Returns:
+            The running WebhookReceiver
+        """
+        if self._webhook_receiver is None:
+            self._webhook_receiver = WebhookReceiver(
+                host=host,
+                port=port,
+                public_url=public_url,
+                fallback_interval=fallback_interval,
+            ).start()
+            self._owns_receiver = True
+        return self._webhook_receiver
+
+    def _stop_webhook_receiver(self) -> None:
+        """Stop the receiver started by enable_webhook_receiver()"""
+        if self._owns_receiver and self._webhook_receiver is not None:
+            self._webhook_receiver.stop()
+            self._webhook_receiver = None
+            self._owns_receiver = False
+
+    def _auto_webhook(
+        self, webhook: Optional[dict], detach: bool
+    ) -> Tuple[Optional[dict], Optional[WebhookReceiver]]:
+        """Register the webhook receiver for jobs submitted without a webhook
+
+        Detached tasks are skipped: their webhook carries incremental log pushes.
+
+        Returns:
+            (webhook config for the payload, receiver the jobs will report to)
+        """
+        receiver = self._webhook_receiver
+        if webhook is not None or detach or receiver is None or not receiver.running:
+            return webhook, None
+        return receiver.webhook_config(), receiver
+
+    def _attach_receiver(
+        self, submitted: Union[Job, JobGroup], receiver: Optional[WebhookReceiver]
+    ) -> Union[Job, JobGroup]:
+        """Let submitted jobs wait on the receiver's push events"""
+        if receiver is not None:
+            jobs = submitted.jobs if isinstance(submitted, JobGroup) else [submitted]
+            for job in jobs:
+                job._receiver = receiver
+        return submitted
+
+    def _resolve_operation(
+        self,
+        command: Union[List[str], str, None],
+        config: Union[List[str], str, None],
+    ) -> Tuple[Union[List[str], str, None], str]:
+        """Pick the operation and its payload key (config takes precedence)"""
+        if command is not None and config is not None:
+            raise ValueError("command and config are mutually exclusive")
+
+        # Smart detection of operation type
+        if config is not None:
+            return config, "config"
+        return command, "command"
+
+    def _validate_collect(
+        self,
+        command: Union[List[str], str, None],
+        file_transfer: Optional[dict],
+        save: bool,
+    ) -> None:
+        """Enforce collect() read-only constraints"""
+        if command is None and not file_transfer:
+            raise ValueError("collect() requires a command.")
+        if save:
+            raise ValueError("collect() is read-only: save=True is not allowed. Use run() instead.")
+        if file_transfer and file_transfer.get("operation") == "upload":
+            raise ValueError(
+                "collect() is read-only: file upload is not allowed. Use run() instead."
+            )
+
+    def _prepare_execute(
+        self,
+        devices: Union[List[str], str, List[dict]],
+        operation: Union[List[str], str, None],
+        connection_args: Optional[dict],
+        driver: Optional[str],
+        credential: Optional[dict],
+        enable_mode: Optional[bool],
+        save: Optional[bool],
+        file_transfer: Optional[dict],
+        local_upload_file: Optional[str],
+    ) -> dict:
+        """Normalize execute arguments and apply client defaults
+
+        Returns:
+            dict with devices, operation, connection_args, driver, credential,
+            enable_mode and save resolved.
+        """
+        # 1. Normalize devices
+        if isinstance(devices, (str, dict)):
+            devices = [devices]
+
+        # 2. Extract driver and connection_args from first device if not provided
+        if not driver or not connection_args:
+            first_device = devices[0]
+            driver = driver or self.driver
+            if isinstance(first_device, dict):
+                driver = driver or first_device.get("driver")
+                connection_args = connection_args or first_device.get("connection_args")
+
+            # Fallback to defaults
+            connection_args = (connection_args or self.default_connection_args).copy()
+
+        if not driver:
+            raise ValueError("Driver must be specified if no default driver is set")
+
+        # 2.1 Use default credential if not provided
+        if credential is None:
+            credential = self.default_credential
+
+        # If credentials are provided, remove auth fields from connection_args
+        # to avoid validation conflicts in backend.
+        if credential and isinstance(connection_args, dict):
+            auth_fields = {
+                "username",
+                "password",
+                "secret",
+                "key_file",
+                "key_filename",
+                "pkey",
+                "passphrase",
+                "token",
+            }
+            # Only remove if it's actually in auth_fields to keep the dictionary clean
+            for field in auth_fields:
+                connection_args.pop(field, None)
+
+        # 3. Normalize operation
+        if isinstance(operation, str):
+            operation = [operation]
+
+        # 4. Handle directory-style remote_path for uploads
+        if local_upload_file and file_transfer and file_transfer.get("operation") == "upload":
+            remote_path = file_transfer.get("remote_path")
+            if remote_path and (remote_path.endswith("/") or remote_path.endswith("\\")):
+                filename = os.path.basename(local_upload_file)
+                # Join path and ensure forward slashes for cross-platform compatibility
+                full_remote_path = os.path.join(remote_path, filename).replace("\\", "/")
+                file_transfer["remote_path"] = full_remote_path
+
+        return {
+            "devices": devices,
+            "operation": operation,
+            "connection_args": connection_args or {},
+            "driver": driver,
+            "credential": credential,
+            # 5. Use effective enable_mode and save
+            "enable_mode": enable_mode if enable_mode is not None else self.enable_mode,
+            "save": save if save is not None else self.save,
+        }
+
+    def _select_api(
+        self, devices: List[str], mode: Literal["auto", "exec", "bulk"]
+    ) -> Literal["exec", "bulk"]:
+        """Select exec or bulk API
+
+        Strategy:
+        - mode=exec: Single device only, raises error if multiple
+        - mode=bulk: Use bulk API
+        - mode=auto: exec for single device, bulk for multiple devices
+        """
+        if mode == "exec":
+            if len(devices) != 1:
+                raise ValueError("exec mode only supports single device")
+            return "exec"
+
+        if mode == "bulk":
+            return "bulk"
+
+        if len(devices) == 1:
+            return "exec"
+        else:
+            return "bulk"
+
+    def _add_optional_params(self, payload: dict, **kwargs) -> dict:
+        """Add non-None kwargs to payload"""
+        for key, value in kwargs.items():
+            if value is not None:
+                payload[key] = value
+        return payload
+
+    def _filter_params(self, **filters) -> Optional[dict]:
+        """Build query params from non-empty filters (None if no filter is set)"""
+        params = {k: v for k, v in filters.items() if v}
+        return params if params else None
+
+    def _build_exec_payload(
+        self,
+        device: str,
+        operation: List[str],
+        operation_type: str,
+        ttl: int,
+        connection_args: dict,
+        driver: str,
+        execution_timeout: Optional[int] = None,
+        **optional,
+    ) -> dict:
+        """Build the POST /device/exec request body"""
+        payload = {
+            "driver": driver,
+            "connection_args": {
+                **connection_args,
+                "host": device,
+            },
+            operation_type: operation,
+            "ttl": ttl,
+        }
+        if execution_timeout is not None:
+            payload["execution_timeout"] = execution_timeout
+
+        return self._add_optional_params(payload, **optional)
+
+    def _build_bulk_payload(
+        self,
+        devices: List[Union[str, dict]],
+        operation: List[str],
+        operation_type: str,
+        ttl: int,
+        connection_args: dict,
+        driver: str,
+        execution_timeout: Optional[int] = None,
+        **optional,
+    ) -> dict:
+        """Build the POST /device/bulk request body"""
+        normalized_devices = []
+        for device in devices:
+            if isinstance(device, str):
+                normalized_devices.append({"host": device})
+            elif isinstance(device, dict):
+                normalized_devices.append(device)
+            else:
+                raise ValueError(f"Unsupported device type: {type(device)}")
+
+        payload = {
+            "driver": driver,
+            "connection_args": connection_args,
+            "devices": normalized_devices,
+            operation_type: operation,
+            "ttl": ttl,
+        }
+        if execution_timeout is not None:
+            payload["execution_timeout"] = execution_timeout
+
+        return self._add_optional_params(payload, **optional)
+
+    def _bulk_chunks(self, payload: dict) -> List[dict]:
+        """Split a bulk payload into payloads of at most bulk_chunk_size devices"""
+        devices = payload["devices"]
+        size = self.bulk_chunk_size
+        if len(devices) <= size:
+            return [payload]
+        return [
+            {**payload, "devices": devices[i : i + size]} for i in range(0, len(devices), size)
+        ]
+
+    def _merge_bulk_chunks(
+        self, chunks: List[dict], outcomes: list
+    ) -> Tuple[list, list, List[str]]:
+        """Merge per-chunk (succeeded, failed, retried_hosts) outcomes
+
+        A chunk that raised is reported as failed devices, unless every chunk raised,
+        in which case the first error is re-raised. Unless the request was never sent
+        or was refused (CircuitOpenError, AuthError), the server may still have queued
+        the chunk's jobs, so its entries are marked ``"indeterminate": True`` with a
+        reason starting with ``"unknown: "``; resubmitting them may create duplicates.
+
+        Returns:
+            (succeeded, failed, retried_hosts) across all chunks
+        """
+        errors = [o for o in outcomes if isinstance(o, BaseException)]
+        if errors and len(errors) == len(outcomes):
+            raise errors[0]
+
+        succeeded, failed, retried_hosts = [], [], []
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, BaseException):
+                log.warning(f"Bulk chunk of {len(chunk['devices'])} devices failed: {outcome}")
+                if isinstance(outcome, (CircuitOpenError, AuthError)):
+                    failed.extend(
+                        {"host": d.get("host", ""), "reason": str(outcome)}
+                        for d in chunk["devices"]
+                    )
+                else:
+                    failed.extend(
+                        {
+                            "host": d.get("host", ""),
+                            "reason": f"unknown: {outcome}",
+                            "indeterminate": True,
+                        }
+                        for d in chunk["devices"]
+                    )
+                continue
+            chunk_succeeded, chunk_failed, chunk_retried = outcome
+            succeeded.extend(chunk_succeeded)
+            failed.extend(chunk_failed)
+            retried_hosts.extend(chunk_retried)
+        return succeeded, failed, retried_hosts
+
+    def _bulk_retry_devices(self, payload: dict, failed: list) -> List[dict]:
+        """Select the payload devices matching a bulk response's failed entries"""
+        failed_hosts = set()
+        for item in failed:
+            if isinstance(item, str):
+                failed_hosts.add(item)
+            elif isinstance(item, dict):
+                failed_hosts.add(item.get("host") or item.get("device", ""))
+
+        return [d for d in payload["devices"] if d.get("host") in failed_hosts]
+
+    def _plan_bulk_retry(
+        self, payload: dict, succeeded: list, failed: list, retry: int
+    ) -> Optional[Tuple[List[dict], float]]:
+        """Devices to resubmit after a partly failed bulk submission, and the wait before
+
+        Failed devices are only resubmitted when some devices succeeded (a submission
+        that failed entirely points at the request, not at transient errors), up to
+        the retry policy's max_attempts (one retry without a policy), after a jittered
+        exponential backoff.
+
+        Returns:
+            (devices, delay), or None when nothing should be retried
+        """
+        policy = self._http.retry or _BULK_RETRY
+        if not (failed and succeeded) or retry + 1 >= policy.max_attempts:
+            return None
+        devices = self._bulk_retry_devices(payload, failed)
+        if not devices:
+            return None
+        delay = policy.backoff_delay(retry)
+        hosts = [d.get("host", "") for d in devices]
+        log.info(f"Auto-retrying {len(devices)} failed devices in {delay:.2f}s: {hosts}")
+        return devices, delay
+
+    def _build_bulk_group(
+        self,
+        devices: List[Union[str, dict]],
+        operation: List[str],
+        succeeded: list,
+        failed: list,
+        retried_hosts: List[str],
+    ) -> JobGroup:
+        """Wrap a BatchSubmitJobResponse into a JobGroup"""
+        if failed:
+            log.warning(f"Some devices failed to submit: {failed}")
+
+        if not succeeded:
+            raise NetPulseError(f"All devices failed to submit: {failed}")
+
+        jobs = []
+        used_indices = set()
+
+        for job_data in succeeded:
+            device_name = None
+
+            if isinstance(job_data, dict):
+                conn_args = job_data.get("connection_args", {})
+                if isinstance(conn_args, dict):
+                    device_name = conn_args.get("host")
+
+                if not device_name:
+                    device_name = job_data.get("device") or job_data.get("host")
+
+            if not device_name:
+                for idx, d in enumerate(devices):
+                    if idx not in used_indices:
+                        if isinstance(d, str):
+                            device_name = d
+                        elif isinstance(d, dict):
+                            device_name = d.get("host") or d.get("device")
+                        if device_name:
+                            used_indices.add(idx)
+                            break
+                if not device_name and len(jobs) < len(devices):
+                    idx = len(jobs)
+                    if idx < len(devices):
+                        d = devices[idx]
+                        if isinstance(d, str):
+                            device_name = d
+                        elif isinstance(d, dict):
+                            device_name = d.get("host") or d.get("device")
+                        used_indices.add(idx)
+
+            if not device_name:
+                device_name = "unknown"
+
+            jobs.append(
+                self._job_class(
+                    client=self, job_data=job_data, device_name=device_name, command=operation
+                )
+            )
+
+        return self._group_class(
+            jobs=jobs,
+            failed_devices=failed,
+            retried_devices=retried_hosts,
+            batch_refresh=self.batch_poll,
+            spill=SpillStore(self.spill_dir) if self.spill_dir else None,
+        )
+
+    def _build_connection_test_payload(
+        self,
+        device: str,
+        connection_args: Optional[dict],
+        driver: str,
+        credential: Optional[dict],
+    ) -> dict:
+        """Build the POST /device/test request body"""
+        conn_args = {**self.default_connection_args}
+        if connection_args:
+            conn_args.update(connection_args)
+        conn_args["host"] = device
+
+        payload = {
+            "driver": driver,
+            "connection_args": conn_args,
+        }
+        if credential:
+            payload["credential"] = credential
+        return payload
+
+    def _parse_connection_test(self, resp: dict, device: str, driver: str) -> ConnectionTestResult:
+        """Convert a ConnectionTestResponse into ConnectionTestResult"""
+        # 0.4.0+: resp is ConnectionTestResponse
+
+        # Extract standard fields
+        ts_str = resp.get("timestamp")
+        ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00")) if ts_str else datetime.now()
+
+        # Flatten 0.4.0+ 'result' object for better SDK experience
+        result_inner = resp.get("result") or {}
+        # Collect extra fields not already handled as explicit params
+        explicit_keys = {"success", "latency", "error", "timestamp", "result", "host", "driver"}
+        extra_data = {k: v for k, v in resp.items() if k not in explicit_keys}
+        if isinstance(result_inner, dict):
+            extra_data.update({k: v for k, v in result_inner.items() if k not in explicit_keys})
+
+        return ConnectionTestResult(
+            ok=resp.get("success", False),
+            host=device,
+            latency=resp.get("latency"),
+            error=resp.get("error"),
+            driver=driver,
+            timestamp=ts,
+            **extra_data,
+        )
+
+    def _failed_connection_test(
+        self, device: str, driver: Optional[str], error: Exception
+    ) -> ConnectionTestResult:
+        """Build a failed ConnectionTestResult from an exception"""
+        return ConnectionTestResult(
+            ok=False,
+            host=device,
+            latency=None,
+            error=str(error),
+            driver=driver or self.driver or "unknown",
+            timestamp=datetime.now(),
+        )
+
+    def _job_from_response(self, resp: dict) -> Job:
+        """Wrap a single JobInResponse (GET /jobs/{id}) into a Job"""
+        # 0.4.0+: Use device_name and command from response if available
+        device_name = resp.get("device_name")
+        command = resp.get("command")
+
+        # Fallback to results if not in top level
+        if not device_name or not command:
+            result = resp.get("result")
+            if result and result.get("retval"):
+                first_res = result["retval"][0]
+                if not device_name:
+                    device_name = (
+                        first_res.get("metadata", {}).get("host")
+                        or first_res.get("device_name")
+                        or "unknown"
+                    )
+                if not command:
+                    command = [r.get("command") for r in result["retval"] if r.get("command")]
+
+        return self._job_class(
+            client=self, job_data=resp, device_name=device_name or "unknown", command=command
+        )
+
+    def _jobs_from_list(self, resp: list) -> List[Job]:
+        """Wrap a List[JobInResponse] (GET /jobs) into Jobs"""
+        return [
+            self._job_class(
+                client=self,
+                job_data=job_data,
+                device_name=job_data.get("device_name") or "unknown",
+                command=job_data.get("command"),
+            )
+            for job_data in resp
+        ]
+
+    def _job_id_batches(self, job_ids: List[str]) -> List[List[str]]:
+        """Split job IDs into chunks for batched GET /jobs?id=... queries"""
+        size = self.STATUS_BATCH_SIZE
+        return [job_ids[i : i + size] for i in range(0, len(job_ids), size)]
+
+    def _collect_job_data(self, resp, batch: List[str], found: Dict[str, dict]) -> bool:
+        """Pick the requested jobs out of a GET /jobs?id=... response
+
+        Terminal entries without a ``result`` are skipped so the caller fetches them
+        individually.
+
+        Returns:
+            False if the response does not honour the ``id`` filter (not a list, other
+            jobs, or more entries than requested); nothing is collected then
+        """
+        wanted = set(batch)
+        if not isinstance(resp, list) or len(resp) > len(wanted):
+            return False
+        if any(not isinstance(d, dict) or d.get("id") not in wanted for d in resp):
+            return False
+        for job_data in resp:
+            if job_data.get("status") in ("finished", "failed") and "result" not in job_data:
+                continue
+            found[job_data["id"]] = job_data
+        return True
+
+    def _disable_batch_poll(self) -> None:
+        """Stop batched status queries after the server ignored the id filter"""
+        if self._batch_poll_supported:
+            log.warning(
+                "GET /jobs ignored the id filter; falling back to per-job status polling"
+            )
+        self._batch_poll_supported = False
+        self.batch_poll = False
+
+    def _jobs_from_detached_tasks(self, tasks: List[DetachedTaskInfo]) -> List[Job]:
+        """Recover Job objects from detached task metadata"""
+        jobs = []
+        for task in tasks:
+            if not task.task_id:
+                continue
+
+            job_data = {
+                "id": f"task_{task.task_id}",
+                "status": "started" if task.status == "running" else "finished",
+                "task_id": task.task_id,
+                "created_at": task.created_at,
+                "command": task.command,
+                "driver": task.driver,
+            }
+
+            device_name = task.host or "recovered_host"
+            command = task.command or []
+
+            jobs.append(self._job_class(self, job_data, device_name, command))
+        return jobs
+
+    def _build_discover_payload(
+        self,
+        device: str,
+        driver: str,
+        connection_args: Optional[dict],
+        credential: Optional[dict],
+    ) -> dict:
+        """Build the POST /detached-tasks/discover request body"""
+        payload = {
+            "driver": driver,
+            "connection_args": {
+                **(connection_args or self.default_connection_args),
+                "host": device,
+            },
+        }
+        if credential:
+            payload["credential"] = credential
+        return payload
+
+    def _parse_discovered_tasks(self, resp) -> List[DetachedTaskInfo]:
+        """Convert a discover response into DetachedTaskInfo objects"""
+        if isinstance(resp, list):
+            return [DetachedTaskInfo.model_validate(t) for t in resp]
+        return resp
+
+    def _parse_rendered(self, resp) -> str:
+        """Extract the rendered string from a /template/render response"""
+        # Backend returns rendered string directly
+        if isinstance(resp, str):
+            return resp
+        # Fallback for dict response (future-proofing)
+        return resp.get("rendered", resp) if isinstance(resp, dict) else str(resp)
+
+
+class NetPulseClient(_ClientBase):
+    """NetPulse SDK client"""
 
     def __enter__(self) -> "NetPulseClient":
         """Context manager entry"""
@@ -143,7 +932,10 @@ class NetPulseClient:
         self.close()
 
     def close(self) -> None:
-        """Close HTTP connection pool"""
+        """Close HTTP connection pool (and the embedded webhook receiver, if any)"""
+        self._stop_webhook_receiver()
+        if self._poll_scheduler is not None:
+            self._poll_scheduler.close()
         self._http.close()
 
     def ping(self) -> bool:
@@ -176,56 +968,16 @@ class NetPulseClient:
         Returns:
             ConnectionTestResult with success, latency, error info
         """
-        from .result import ConnectionTestResult
-        from datetime import datetime
-
         use_driver = driver or self.driver
-        conn_args = {**self.default_connection_args}
-        if connection_args:
-            conn_args.update(connection_args)
-        conn_args["host"] = device
-
-        payload = {
-            "driver": use_driver,
-            "connection_args": conn_args,
-        }
-        if credential:
-            payload["credential"] = credential
+        payload = self._build_connection_test_payload(
+            device, connection_args, use_driver, credential
+        )
 
         try:
             resp = self._http.post("/device/test", json=payload)
-            # 0.4.0+: resp is ConnectionTestResponse
-
-            # Extract standard fields
-            ts_str = resp.get("timestamp")
-            ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00")) if ts_str else datetime.now()
-
-            # Flatten 0.4.0+ 'result' object for better SDK experience
-            result_inner = resp.get("result") or {}
-            # Collect extra fields not already handled as explicit params
-            explicit_keys = {"success", "latency", "error", "timestamp", "result", "host", "driver"}
-            extra_data = {k: v for k, v in resp.items() if k not in explicit_keys}
-            if isinstance(result_inner, dict):
-                extra_data.update({k: v for k, v in result_inner.items() if k not in explicit_keys})
-
-            return ConnectionTestResult(
-                ok=resp.get("success", False),
-                host=device,
-                latency=resp.get("latency"),
-                error=resp.get("error"),
-                driver=use_driver,
-                timestamp=ts,
-                **extra_data,
-            )
+            return self._parse_connection_test(resp, device, use_driver)
         except Exception as e:
-            return ConnectionTestResult(
-                ok=False,
-                host=device,
-                latency=None,
-                error=str(e),
-                driver=use_driver,
-                timestamp=datetime.now(),
-            )
+            return self._failed_connection_test(device, use_driver, e)
 
     def test_connections(
         self,
@@ -248,7 +1000,8 @@ class NetPulseClient:
         import concurrent.futures
 
         results = [None] * len(devices)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(devices), 50)) as executor:
+        workers = self._http.fanout_limit(len(devices))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
             future_to_index = {
                 executor.submit(
                     self.test_connection,
@@ -266,16 +1019,7 @@ class NetPulseClient:
                     results[idx] = future.result()
                 except Exception as e:
                     # Create a failed result if something crashed
-                    from datetime import datetime
-                    from .result import ConnectionTestResult
-
-                    results[idx] = ConnectionTestResult(
-                        ok=False,
-                        host=devices[idx],
-                        error=str(e),
-                        driver=driver or self.driver or "unknown",
-                        timestamp=datetime.now(),
-                    )
+                    results[idx] = self._failed_connection_test(devices[idx], driver, e)
 
         return results
 
@@ -313,8 +1057,9 @@ class NetPulseClient:
         whether to use 'config' or 'command' mode based on the input.
 
         Args:
-            auto_retry: Automatically retry devices that fail bulk submission once (default True).
-                Set to False to disable silent retries. Retried devices are recorded in
+            auto_retry: Automatically retry devices that fail bulk submission, after a jittered
+                backoff: once, or up to the client's retry policy (default True). Set to False
+                to disable silent retries. Retried devices are recorded in
                 JobGroup.retried_devices.
             audit_mode: Mongo audit storage mode. full stores the complete result, metadata stores
                 request/job metadata only, none skips Mongo audit logging.
@@ -325,16 +1070,7 @@ class NetPulseClient:
         was_list = isinstance(devices, list)
         devices = [devices] if isinstance(devices, str) else devices
 
-        if command is not None and config is not None:
-            raise ValueError("command and config are mutually exclusive")
-
-        # Smart detection of operation type
-        if config is not None:
-            operation = config
-            operation_type = "config"
-        else:
-            operation = command
-            operation_type = "command"
+        operation, operation_type = self._resolve_operation(command, config)
 
         job = self._execute(
             devices=devices,
@@ -424,14 +1160,7 @@ class NetPulseClient:
             callback: Progress callback function(progress_obj)
         """
         # Enforce read-only constraints
-        if command is None and not file_transfer:
-            raise ValueError("collect() requires a command.")
-        if save:
-            raise ValueError("collect() is read-only: save=True is not allowed. Use run() instead.")
-        if file_transfer and file_transfer.get("operation") == "upload":
-            raise ValueError(
-                "collect() is read-only: file upload is not allowed. Use run() instead."
-            )
+        self._validate_collect(command, file_transfer, save)
 
         was_list = isinstance(devices, list)
         job = self._execute(
@@ -465,106 +1194,62 @@ class NetPulseClient:
 
         return job
 
-    def _execute(
-        self,
-        devices: Union[List[str], str, List[dict]],
-        operation: Union[List[str], str] = None,
-        operation_type: Literal["command", "config"] = "command",
-        mode: Literal["auto", "exec", "bulk"] = "auto",
-        ttl: int = 300,
-        execution_timeout: Optional[int] = None,
-        connection_args: Optional[dict] = None,
-        driver: Optional[str] = None,
-        driver_args: Optional[dict] = None,
-        credential: Optional[dict] = None,
-        rendering: Optional[dict] = None,
-        parsing: Optional[dict] = None,
-        queue_strategy: Optional[Literal["fifo", "pinned"]] = None,
-        result_ttl: Optional[int] = None,
-        webhook: Optional[dict] = None,
-        file_transfer: Optional[dict] = None,
-        detach: bool = False,
-        push_interval: Optional[int] = None,
-        staged_file_id: Optional[str] = None,
-        local_upload_file: Optional[str] = None,
-        enable_mode: Optional[bool] = None,
-        save: Optional[bool] = None,
-        audit_mode: Optional[Literal["full", "metadata", "none"]] = None,
-        callback: Optional[Callable] = None,
-        return_group: bool = False,
-        auto_retry: bool = True,
-    ) -> Union[Job, JobGroup]:
-        """Internal execute dispatcher"""
-        # 1. Normalize devices
-        if isinstance(devices, (str, dict)):
-            devices = [devices]
-
-        # 2. Extract driver and connection_args from first device if not provided
-        if not driver or not connection_args:
-            first_device = devices[0]
-            driver = driver or self.driver
-            if isinstance(first_device, dict):
-                driver = driver or first_device.get("driver")
-                connection_args = connection_args or first_device.get("connection_args")
-
-            # Fallback to defaults
-            connection_args = (connection_args or self.default_connection_args).copy()
-
-        if not driver:
-            raise ValueError("Driver must be specified if no default driver is set")
-
-        # 2.1 Use default credential if not provided
-        if credential is None:
-            credential = self.default_credential
-
-        # If credentials are provided, remove auth fields from connection_args
-        # to avoid validation conflicts in backend.
-        if credential and isinstance(connection_args, dict):
-            auth_fields = {
-                "username",
-                "password",
-                "secret",
-                "key_file",
-                "key_filename",
-                "pkey",
-                "passphrase",
-                "token",
-            }
-            # Only remove if it's actually in auth_fields to keep the dictionary clean
-            for field in auth_fields:
-                connection_args.pop(field, None)
-
-        # 3. Normalize operation
-        if isinstance(operation, str):
-            operation = [operation]
-
-        # 4. Use effective enable_mode and save
-        eff_enable_mode = enable_mode if enable_mode is not None else self.enable_mode
-        eff_save = save if save is not None else self.save
-
-        # 5. Handle directory-style remote_path for uploads
-        if local_upload_file and file_transfer and file_transfer.get("operation") == "upload":
-            remote_path = file_transfer.get("remote_path")
-            if remote_path and (remote_path.endswith("/") or remote_path.endswith("\\")):
-                import os
-
-                filename = os.path.basename(local_upload_file)
-                # Join path and ensure forward slashes for cross-platform compatibility
-                full_remote_path = os.path.join(remote_path, filename).replace("\\", "/")
-                file_transfer["remote_path"] = full_remote_path
-
+    def _execute(
+        self,
+        devices: Union[List[str], str, List[dict]],
+        operation: Union[List[str], str] = None,
+        operation_type: Literal["command", "config"] = "command",
+        mode: Literal["auto", "exec", "bulk"] = "auto",
+        ttl: int = 300,
+        execution_timeout: Optional[int] = None,
+        connection_args: Optional[dict] = None,
+        driver: Optional[str] = None,
+        driver_args: Optional[dict] = None,
+        credential: Optional[dict] = None,
+        rendering: Optional[dict] = None,
+        parsing: Optional[dict] = None,
+        queue_strategy: Optional[Literal["fifo", "pinned"]] = None,
+        result_ttl: Optional[int] = None,
+        webhook: Optional[dict] = None,
+        file_transfer: Optional[dict] = None,
+        detach: bool = False,
+        push_interval: Optional[int] = None,
+        staged_file_id: Optional[str] = None,
+        local_upload_file: Optional[str] = None,
+        enable_mode: Optional[bool] = None,
+        save: Optional[bool] = None,
+        audit_mode: Optional[Literal["full", "metadata", "none"]] = None,
+        callback: Optional[Callable] = None,
+        return_group: bool = False,
+        auto_retry: bool = True,
+    ) -> Union[Job, JobGroup]:
+        """Internal execute dispatcher"""
+        webhook, receiver = self._auto_webhook(webhook, detach)
+        prepared = self._prepare_execute(
+            devices=devices,
+            operation=operation,
+            connection_args=connection_args,
+            driver=driver,
+            credential=credential,
+            enable_mode=enable_mode,
+            save=save,
+            file_transfer=file_transfer,
+            local_upload_file=local_upload_file,
+        )
+        devices = prepared["devices"]
+
         # 6. Use Bulk API if multiple devices, otherwise Use Exec API
         api_type = self._select_api(devices, mode)
         if api_type == "bulk":
-            return self._call_bulk_api(
+            group = self._call_bulk_api(
                 devices=devices,
-                operation=operation,
+                operation=prepared["operation"],
                 operation_type=operation_type,
                 ttl=ttl,
-                connection_args=connection_args or {},
-                driver=driver,
+                connection_args=prepared["connection_args"],
+                driver=prepared["driver"],
                 driver_args=driver_args,
-                credential=credential,
+                credential=prepared["credential"],
                 rendering=rendering,
                 parsing=parsing,
                 queue_strategy=queue_strategy,
@@ -574,25 +1259,26 @@ class NetPulseClient:
                 detach=detach,
                 push_interval=push_interval,
                 staged_file_id=staged_file_id,
-                enable_mode=eff_enable_mode,
-                save=eff_save,
+                enable_mode=prepared["enable_mode"],
+                save=prepared["save"],
                 audit_mode=audit_mode,
                 callback=callback,
                 auto_retry=auto_retry,
             )
+            return self._attach_receiver(group, receiver)
         else:
             device = devices[0]
             device_host = device if isinstance(device, str) else device.get("host")
             job = self._call_exec_api(
                 device=device_host,
-                operation=operation,
+                operation=prepared["operation"],
                 operation_type=operation_type,
                 ttl=ttl,
                 execution_timeout=execution_timeout,
-                connection_args=connection_args or {},
-                driver=driver,
+                connection_args=prepared["connection_args"],
+                driver=prepared["driver"],
                 driver_args=driver_args,
-                credential=credential,
+                credential=prepared["credential"],
                 rendering=rendering,
                 parsing=parsing,
                 queue_strategy=queue_strategy,
@@ -602,16 +1288,15 @@ class NetPulseClient:
                 detach=detach,
                 push_interval=push_interval,
                 staged_file_id=staged_file_id,
-                enable_mode=eff_enable_mode,
-                save=eff_save,
+                enable_mode=prepared["enable_mode"],
+                save=prepared["save"],
                 audit_mode=audit_mode,
                 local_upload_file=local_upload_file,
                 callback=callback,
             )
+            self._attach_receiver(job, receiver)
             if return_group:
-                from .job import JobGroup
-
-                return JobGroup(jobs=[job])
+                return self._group_class(jobs=[job])
             return job
 
     def render_template(
@@ -636,11 +1321,7 @@ class NetPulseClient:
             **kwargs,
         }
         resp = self._http.post("/template/render", json=payload)
-        # Backend returns rendered string directly
-        if isinstance(resp, str):
-            return resp
-        # Fallback for dict response (future-proofing)
-        return resp.get("rendered", resp) if isinstance(resp, dict) else str(resp)
+        return self._parse_rendered(resp)
 
     def parse_template(
         self,
@@ -674,28 +1355,7 @@ class NetPulseClient:
             job_id: Unique job identifier
         """
         resp = self._http.get(f"/jobs/{job_id}")
-
-        # 0.4.0+: Use device_name and command from response if available
-        device_name = resp.get("device_name")
-        command = resp.get("command")
-
-        # Fallback to results if not in top level
-        if not device_name or not command:
-            result = resp.get("result")
-            if result and result.get("retval"):
-                first_res = result["retval"][0]
-                if not device_name:
-                    device_name = (
-                        first_res.get("metadata", {}).get("host")
-                        or first_res.get("device_name")
-                        or "unknown"
-                    )
-                if not command:
-                    command = [r.get("command") for r in result["retval"] if r.get("command")]
-
-        return Job(
-            client=self, job_data=resp, device_name=device_name or "unknown", command=command
-        )
+        return self._job_from_response(resp)
 
     def list_jobs(
         self,
@@ -712,27 +1372,29 @@ class NetPulseClient:
             node: Filter by node name
             host: Filter by pinned host name
         """
-        params = {}
-        if queue:
-            params["queue"] = queue
-        if status:
-            params["status"] = status
-        if node:
-            params["node"] = node
-        if host:
-            params["host"] = host
-
-        resp = self._http.get("/jobs", params=params if params else None)
+        params = self._filter_params(queue=queue, status=status, node=node, host=host)
+        resp = self._http.get("/jobs", params=params)
         # 0.4.0+: resp is List[JobInResponse]
-        return [
-            Job(
-                client=self,
-                job_data=job_data,
-                device_name=job_data.get("device_name") or "unknown",
-                command=job_data.get("command"),
-            )
-            for job_data in resp
-        ]
+        return self._jobs_from_list(resp)
+
+    def _fetch_job_data(self, job_ids: List[str]) -> Dict[str, dict]:
+        """Fetch many JobInResponse payloads with batched GET /jobs?id=... queries
+
+        If the server does not support the ``id`` filter, batching is turned off for
+        this client and the remaining jobs are left for per-job refreshes.
+
+        Returns:
+            {job_id: job_data} for the jobs present in the responses
+        """
+        found: Dict[str, dict] = {}
+        if not self._batch_poll_supported:
+            return found
+        for batch in self._job_id_batches(job_ids):
+            resp = self._http.get("/jobs", params={"id": batch})
+            if not self._collect_job_data(resp, batch, found):
+                self._disable_batch_poll()
+                break
+        return found
 
     def cancel_job(self, job_id: str) -> bool:
         """Cancel/Delete a job (DELETE /jobs/{id})
@@ -758,13 +1420,8 @@ class NetPulseClient:
         Returns:
             List of cancelled job IDs
         """
-        params = {}
-        if queue:
-            params["queue"] = queue
-        if host:
-            params["host"] = host
-
-        resp = self._http.delete("/jobs", params=params if params else None)
+        params = self._filter_params(queue=queue, host=host)
+        resp = self._http.delete("/jobs", params=params)
         return resp
 
     def list_workers(
@@ -783,15 +1440,8 @@ class NetPulseClient:
         Returns:
             List of WorkerInfo objects
         """
-        params = {}
-        if queue:
-            params["queue"] = queue
-        if node:
-            params["node"] = node
-        if host:
-            params["host"] = host
-
-        resp = self._http.get("/workers", params=params if params else None)
+        params = self._filter_params(queue=queue, node=node, host=host)
+        resp = self._http.get("/workers", params=params)
         return [WorkerInfo.model_validate(w) for w in resp]
 
     def delete_worker(self, name: str) -> bool:
@@ -822,15 +1472,8 @@ class NetPulseClient:
         Returns:
             List of deleted worker info
         """
-        params = {}
-        if queue:
-            params["queue"] = queue
-        if node:
-            params["node"] = node
-        if host:
-            params["host"] = host
-
-        return self._http.delete("/workers", params=params if params else None)
+        params = self._filter_params(queue=queue, node=node, host=host)
+        return self._http.delete("/workers", params=params)
 
     # =========================================================================
     # Detached Tasks (Task Recovery)
@@ -945,79 +1588,19 @@ class NetPulseClient:
         Returns:
             List of newly discovered DetachedTaskInfo objects
         """
-        payload = {
-            "driver": driver,
-            "connection_args": {
-                **(connection_args or self.default_connection_args),
-                "host": device,
-            },
-        }
-        if credential:
-            payload["credential"] = credential
-
+        payload = self._build_discover_payload(device, driver, connection_args, credential)
         resp = self._http.post("/detached-tasks/discover", json=payload)
-        if isinstance(resp, list):
-            return [DetachedTaskInfo.model_validate(t) for t in resp]
-        return resp
+        return self._parse_discovered_tasks(resp)
 
     def discover_jobs(self, status: str = "running") -> List[Job]:
         """Recover Job objects for existing detached tasks"""
-        tasks = self.list_detached_tasks(status=status)
-        jobs = []
-        for task in tasks:
-            if not task.task_id:
-                continue
-
-            job_data = {
-                "id": f"task_{task.task_id}",
-                "status": "started" if task.status == "running" else "finished",
-                "task_id": task.task_id,
-                "created_at": task.created_at,
-                "command": task.command,
-                "driver": task.driver,
-            }
-
-            device_name = task.host or "recovered_host"
-            command = task.command or []
-
-            jobs.append(Job(self, job_data, device_name, command))
-        return jobs
+        return self._jobs_from_detached_tasks(self.list_detached_tasks(status=status))
 
     def get_health(self) -> dict:
         """Get system health status"""
         resp = self._http.get("/health")
         return resp
 
-    def _select_api(
-        self, devices: List[str], mode: Literal["auto", "exec", "bulk"]
-    ) -> Literal["exec", "bulk"]:
-        """Select exec or bulk API
-
-        Strategy:
-        - mode=exec: Single device only, raises error if multiple
-        - mode=bulk: Use bulk API
-        - mode=auto: exec for single device, bulk for multiple devices
-        """
-        if mode == "exec":
-            if len(devices) != 1:
-                raise ValueError("exec mode only supports single device")
-            return "exec"
-
-        if mode == "bulk":
-            return "bulk"
-
-        if len(devices) == 1:
-            return "exec"
-        else:
-            return "bulk"
-
-    def _add_optional_params(self, payload: dict, **kwargs) -> dict:
-        """Add non-None kwargs to payload"""
-        for key, value in kwargs.items():
-            if value is not None:
-                payload[key] = value
-        return payload
-
     def _call_exec_api(
         self,
         device: str,
@@ -1048,20 +1631,14 @@ class NetPulseClient:
 
         Returns single Job
         """
-        payload = {
-            "driver": driver,
-            "connection_args": {
-                **connection_args,
-                "host": device,
-            },
-            operation_type: operation,
-            "ttl": ttl,
-        }
-        if execution_timeout is not None:
-            payload["execution_timeout"] = execution_timeout
-
-        self._add_optional_params(
-            payload,
+        payload = self._build_exec_payload(
+            device=device,
+            operation=operation,
+            operation_type=operation_type,
+            ttl=ttl,
+            connection_args=connection_args,
+            driver=driver,
+            execution_timeout=execution_timeout,
             driver_args=driver_args,
             credential=credential,
             rendering=rendering,
@@ -1080,7 +1657,6 @@ class NetPulseClient:
 
         if local_upload_file is not None:
             import json
-            import os
 
             if not os.path.exists(local_upload_file):
                 raise ValueError(f"File {local_upload_file} does not exist")
@@ -1136,7 +1712,7 @@ class NetPulseClient:
             resp = self._http.post("/device/exec", json=payload)
 
         # 0.4.0: resp is JobInResponse
-        return Job(client=self, job_data=resp, device_name=device, command=operation)
+        return self._job_class(client=self, job_data=resp, device_name=device, command=operation)
 
     def _call_bulk_api(
         self,
@@ -1168,27 +1744,14 @@ class NetPulseClient:
 
         Returns JobGroup (manages multiple Jobs)
         """
-        normalized_devices = []
-        for device in devices:
-            if isinstance(device, str):
-                normalized_devices.append({"host": device})
-            elif isinstance(device, dict):
-                normalized_devices.append(device)
-            else:
-                raise ValueError(f"Unsupported device type: {type(device)}")
-
-        payload = {
-            "driver": driver,
-            "connection_args": connection_args,
-            "devices": normalized_devices,
-            operation_type: operation,
-            "ttl": ttl,
-        }
-        if execution_timeout is not None:
-            payload["execution_timeout"] = execution_timeout
-
-        self._add_optional_params(
-            payload,
+        payload = self._build_bulk_payload(
+            devices=devices,
+            operation=operation,
+            operation_type=operation_type,
+            ttl=ttl,
+            connection_args=connection_args,
+            driver=driver,
+            execution_timeout=execution_timeout,
             driver_args=driver_args,
             credential=credential,
             rendering=rendering,
@@ -1205,89 +1768,66 @@ class NetPulseClient:
             audit_mode=audit_mode,
         )
 
-        log.debug(f"Calling bulk API for {len(normalized_devices)} devices")
-        resp = self._http.post("/device/bulk", json=payload)
-
-        # 0.4.0: resp is BatchSubmitJobResponse {succeeded, failed}
-        succeeded = resp.get("succeeded", [])
-        failed = resp.get("failed", [])
-        retried_hosts: List[str] = []
-
-        # Retry failed devices once if auto_retry is enabled and some succeeded
-        if auto_retry and failed and succeeded:
-            # Extract failed device hosts
-            failed_hosts = set()
-            for item in failed:
-                if isinstance(item, str):
-                    failed_hosts.add(item)
-                elif isinstance(item, dict):
-                    failed_hosts.add(item.get("host") or item.get("device", ""))
-
-            retry_devices = [d for d in normalized_devices if d.get("host") in failed_hosts]
-
-            if retry_devices:
-                retried_hosts = [d.get("host", "") for d in retry_devices]
-                log.info(f"Auto-retrying {len(retry_devices)} failed devices: {retried_hosts}")
-
-                retry_payload = {**payload, "devices": retry_devices}
-                retry_resp = self._http.post("/device/bulk", json=retry_payload)
-                retry_succeeded = retry_resp.get("succeeded", [])
-                retry_failed = retry_resp.get("failed", [])
+        chunks = self._bulk_chunks(payload)
+        log.debug(
+            f"Calling bulk API for {len(payload['devices'])} devices in {len(chunks)} chunk(s)"
+        )
 
-                if retry_succeeded:
-                    succeeded.extend(retry_succeeded)
-                    log.info(f"Retry succeeded for {len(retry_succeeded)} devices")
+        if len(chunks) == 1:
+            succeeded, failed, retried_hosts = self._submit_bulk_chunk(payload, auto_retry)
+        else:
+            import concurrent.futures
 
-                failed = retry_failed
+            def _submit(chunk: dict):
+                try:
+                    return self._submit_bulk_chunk(chunk, auto_retry)
+                except Exception as e:
+                    return e
 
-        if failed:
-            log.warning(f"Some devices failed to submit: {failed}")
+            workers = min(len(chunks), self.bulk_concurrency)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(_submit, chunks))
+            succeeded, failed, retried_hosts = self._merge_bulk_chunks(chunks, outcomes)
 
-        if not succeeded:
-            raise NetPulseError(f"All devices failed to submit: {failed}")
+        return self._build_bulk_group(devices, operation, succeeded, failed, retried_hosts)
 
-        jobs = []
-        used_indices = set()
+    def _submit_bulk_chunk(self, payload: dict, auto_retry: bool) -> Tuple[list, list, List[str]]:
+        """POST one bulk payload, retrying failed devices with backoff if auto_retry is set
 
-        for job_data in succeeded:
-            device_name = None
+        Returns:
+            (succeeded, failed, retried_hosts)
+        """
+        resp = self._http.post("/device/bulk", json=payload)
 
-            if isinstance(job_data, dict):
-                conn_args = job_data.get("connection_args", {})
-                if isinstance(conn_args, dict):
-                    device_name = conn_args.get("host")
+        # 0.4.0: resp is BatchSubmitJobResponse {succeeded, failed}
+        succeeded = resp.get("succeeded", [])
+        failed = resp.get("failed", [])
+        retried_hosts: List[str] = []
 
-                if not device_name:
-                    device_name = job_data.get("device") or job_data.get("host")
+        retry = 0
+        while auto_retry:
+            plan = self._plan_bulk_retry(payload, succeeded, failed, retry)
+            if plan is None:
+                break
+            retry_devices, delay = plan
+            retried_hosts.extend(
+                h for h in (d.get("host", "") for d in retry_devices) if h not in retried_hosts
+            )
+            time.sleep(delay)
 
-            if not device_name:
-                for idx, d in enumerate(devices):
-                    if idx not in used_indices:
-                        if isinstance(d, str):
-                            device_name = d
-                        elif isinstance(d, dict):
-                            device_name = d.get("host") or d.get("device")
-                        if device_name:
-                            used_indices.add(idx)
-                            break
-                if not device_name and len(jobs) < len(devices):
-                    idx = len(jobs)
-                    if idx < len(devices):
-                        d = devices[idx]
-                        if isinstance(d, str):
-                            device_name = d
-                        elif isinstance(d, dict):
-                            device_name = d.get("host") or d.get("device")
-                        used_indices.add(idx)
+            retry_payload = {**payload, "devices": retry_devices}
+            retry_resp = self._http.post("/device/bulk", json=retry_payload)
+            retry_succeeded = retry_resp.get("succeeded", [])
+            retry_failed = retry_resp.get("failed", [])
 
-            if not device_name:
-                device_name = "unknown"
+            if retry_succeeded:
+                succeeded.extend(retry_succeeded)
+                log.info(f"Retry succeeded for {len(retry_succeeded)} devices")
 
-            jobs.append(
-                Job(client=self, job_data=job_data, device_name=device_name, command=operation)
-            )
+            failed = retry_failed
+            retry += 1
 
-        return JobGroup(jobs=jobs, failed_devices=failed, retried_devices=retried_hosts)
+        return succeeded, failed, retried_hosts
 
     def fetch_staged_file(
         self, file_id: str, dest_path: str, callback: Optional[Callable] = None
@@ -1307,7 +1847,7 @@ class NetPulseClient:
 
         # Use the internal session for consistent headers and base_url handling
         url = f"{self._http.base_url}/storage/fetch/{file_id}"
-        with self._http.session.stream("GET", url) as response:
+        with self._http.stream(url) as response:
             response.raise_for_status()
             total_size = int(response.headers.get("Content-Length", 0))
             downloaded = 0
@@ -1343,7 +1883,7 @@ class NetPulseClient:
                     # Keep the full path, just swap the host to our gateway
                     full_url = f"{self._http.base_url}/{parsed.path.lstrip('/')}"
 
-        with self._http.session.stream("GET", full_url) as response:
+        with self._http.stream(full_url) as response:
             response.raise_for_status()
             total_size = int(response.headers.get("Content-Length", 0))
             downloaded = 0
@@ -0,0 +1,131 @@
+"""
+JSON codecs (orjson / msgspec when installed, stdlib json otherwise)
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+
+class JSONCodec:
+    """JSON encoder/decoder pair
+
+    encode() returns compact UTF-8 bytes (request bodies), decode() accepts bytes
+    or str and raises ValueError on malformed input, encode_pretty() returns an
+    indented str (to_json()). encode_pretty() always uses the stdlib, so to_json()
+    output (ASCII escapes included) does not depend on which codec is installed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        encode: Callable[[Any], bytes],
+        decode: Callable[[Union[bytes, str]], Any],
+        decode_errors: tuple = (ValueError,),
+    ):
+        self.name = name
+        self._encode = encode
+        self._decode = decode
+        self._decode_errors = decode_errors
+
+    def encode(self, obj: Any) -> bytes:
+        """Serialize to compact JSON bytes"""
+        try:
+            return self._encode(obj)
+        except TypeError:
+            # e.g. integers beyond 64 bits: let the stdlib handle what it can
+            return _stdlib_encode(obj)
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """Parse JSON bytes or str
+
+        Raises:
+            ValueError: If data is not valid JSON
+        """
+        try:
+            return self._decode(data)
+        except self._decode_errors as e:
+            raise ValueError(f"Invalid JSON: {e}") from e
+
+    def encode_pretty(self, obj: Any) -> str:
+        """Serialize to human-readable JSON with 2-space indentation"""
+        return json.dumps(obj, indent=2)
+
+    def __repr__(self):
+        return f"JSONCodec({self.name})"
+
+
+def _stdlib_encode(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _make_stdlib() -> JSONCodec:
+    return JSONCodec(
+        "json",
+        encode=_stdlib_encode,
+        decode=json.loads,
+    )
+
+
+def _make_orjson() -> JSONCodec:
+    import orjson
+
+    return JSONCodec(
+        "orjson",
+        encode=lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        decode=orjson.loads,
+        decode_errors=(orjson.JSONDecodeError,),
+    )
+
+
+def _make_msgspec() -> JSONCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    return JSONCodec(
+        "msgspec",
+        encode=encoder.encode,
+        decode=decoder.decode,
+        decode_errors=(msgspec.DecodeError,),
+    )
+
+
+_FACTORIES: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _make_orjson,
+    "msgspec": _make_msgspec,
+    "json": _make_stdlib,
+}
+_codecs: Dict[str, JSONCodec] = {}
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Return a JSON codec
+
+    Args:
+        name: "orjson", "msgspec", "json", or "auto"/None for the fastest installed
+
+    Raises:
+        ValueError: If name is unknown
+        ImportError: If the requested library is not installed
+    """
+    name = name or "auto"
+    if name in _codecs:
+        return _codecs[name]
+
+    if name == "auto":
+        codec = None
+        for candidate in ("orjson", "msgspec"):
+            try:
+                codec = get_codec(candidate)
+                break
+            except ImportError:
+                continue
+        codec = codec or get_codec("json")
+    elif name in _FACTORIES:
+        codec = _FACTORIES[name]()
+    else:
+        choices = ", ".join(["auto", *_FACTORIES])
+        raise ValueError(f"Unknown JSON codec: {name} (expected one of: {choices})")
+
+    _codecs[name] = codec
+    return codec
@@ -53,14 +53,33 @@ def load_config(
 
     Returns:
         Configuration dictionary with keys:
-            - base_url: API base URL
+            - base_url: API base URL, or a list of replica URLs to balance over
             - api_key: API key
             - driver: Default driver
             - connection_args: Default connection arguments
-            - timeout: HTTP timeout
+            - timeout: HTTP timeout (seconds or {connect, read, write, pool})
+            - timeouts: Per-operation timeout profiles {submit|poll|download|template: timeout}
             - pool_connections: Connection pool size
             - pool_maxsize: Max connections per pool
             - max_retries: Retry count
+            - batch_poll: Poll JobGroup statuses with batched GET /jobs queries
+            - bulk_chunk_size: Max devices per POST /device/bulk request
+            - bulk_concurrency: Bulk chunks submitted concurrently
+            - poll_scheduler: Share one adaptive status poller between waiting jobs
+            - json_codec: JSON codec (auto, orjson, msgspec, json)
+            - spill_dir: Directory for JobGroup spill segment files
+            - http2: Multiplex requests over HTTP/2
+            - compression: Request body Content-Encoding (gzip, zstd)
+            - compression_threshold: Minimum request body size to compress
+            - rate_limits: Per endpoint class limits {submit|poll|download: {rate, burst,
+              max_in_flight}}
+            - adaptive_concurrency: AIMD request concurrency (true or {initial, min_limit,
+              max_limit, latency_tolerance, backoff})
+            - hedging: Hedge slow status GETs (true or {percentile, min_delay, max_delay, ...})
+            - circuit_breaker: Per-host circuit breaker (true or {failure_rate, min_requests,
+              window, open_seconds, half_open_requests})
+            - retry: Request retry policy (true or {max_attempts, backoff, max_backoff,
+              statuses, max_retry_after, idempotency_keys})
     """
     try:
         import yaml
@@ -38,6 +38,27 @@ class NetworkError(NetPulseError):
         super().__init__(message, detail)
 
 
+class CircuitOpenError(NetworkError):
+    """Request rejected without being sent because the host's circuit breaker is open"""
+
+    def __init__(
+        self,
+        message: str,
+        host: Optional[str] = None,
+        retry_after: Optional[float] = None,
+        detail: Optional[dict] = None,
+    ):
+        self.host = host
+        self.retry_after = retry_after
+        if detail is None:
+            detail = {}
+        if host:
+            detail["host"] = host
+        if retry_after is not None:
+            detail["retry_after"] = retry_after
+        super().__init__(message, detail)
+
+
 class RequestTimeoutError(NetPulseError):
     """Request timeout"""
 
@@ -3,16 +3,33 @@ Job and JobGroup implementation
 """
 
 import logging
+import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from .error import Error, JobFailedError
-from .result import JobProgress, Result
+from .result import CompactResult, JobProgress, Result, WebhookEvent
+from .spill import SpilledResults
 from datetime import datetime
 
 if TYPE_CHECKING:
     from .client import NetPulseClient
+    from .spill import SpillStore
+    from .webhook import WebhookReceiver
 
 log = logging.getLogger(__name__)
 
@@ -58,7 +75,7 @@ class JobInterface(ABC):
         pass
 
     @abstractmethod
-    def results(self) -> List[Result]:
+    def results(self, compact: bool = False) -> List[Result]:
         """Get all results"""
         pass
 
@@ -73,6 +90,45 @@ class JobInterface(ABC):
         pass
 
 
+class _OutputPool:
+    """Intern pool for command outputs shared by the jobs of a JobGroup
+
+    Each distinct string is counted once per job holding it, and is dropped
+    from the pool when the last of those jobs releases its payload.
+    """
+
+    __slots__ = ("_strings", "_refs", "_lock")
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+        self._refs: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, held: set, value: str) -> str:
+        """Shared copy of value, recorded in held (the calling job's pool references)"""
+        with self._lock:
+            shared = self._strings.setdefault(value, value)
+            if shared not in held:
+                held.add(shared)
+                self._refs[shared] = self._refs.get(shared, 0) + 1
+            return shared
+
+    def release(self, held: set) -> None:
+        """Drop a job's references, removing strings no other job holds"""
+        with self._lock:
+            for value in held:
+                count = self._refs[value] - 1
+                if count:
+                    self._refs[value] = count
+                else:
+                    del self._refs[value]
+                    del self._strings[value]
+            held.clear()
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
 class Job(JobInterface):
     """Single job wrapper"""
 
@@ -96,6 +152,17 @@ class Job(JobInterface):
         self._device_name = device_name
         self._command = command or []
         self._results_cache = None
+        self._compact_cache: Optional[List[CompactResult]] = None
+        self._status_cache: Optional[List[Tuple[str, bool, int]]] = None
+        self._released = False
+        # (store, offset, length, row count) once the result payload was spilled to disk
+        self._spilled: Optional[Tuple["SpillStore", int, int, int]] = None
+        # Output intern pool shared by the jobs of a JobGroup (see _iter_result_rows)
+        # and the pooled strings this job holds references to
+        self._outputs: Optional[_OutputPool] = None
+        self._pooled: set = set()
+        # Set when the job was submitted with a WebhookReceiver as its webhook
+        self._receiver: Optional["WebhookReceiver"] = None
 
     @property
     def id(self) -> str:
@@ -163,7 +230,7 @@ class Job(JobInterface):
         None if the job has not finished yet.
         Most users only need job.all_ok, but this helps diagnose retried or stopped jobs.
         """
-        result_data = self._data.get("result")
+        result_data = self._result_payload()
         if result_data is None:
             return None
         return result_data.get("type")
@@ -189,10 +256,66 @@ class Job(JobInterface):
         """
         resp = self._client._http.get(f"/jobs/{self.id}")
         # 0.4.0+: resp is JobInResponse
-        self._data = resp
-        self._results_cache = None
+        self._apply_data(resp)
         return self
 
+    def _apply_data(self, job_data: dict) -> None:
+        """Replace the job payload with a fresh JobInResponse"""
+        self._data = job_data
+        self._results_cache = None
+        self._compact_cache = None
+        self._status_cache = None
+        self._spilled = None
+
+    # Webhook result types are strings; JobInResponse uses the numeric codes
+    _WEBHOOK_RESULT_TYPES = {"success": 1, "failed": 2, "stopped": 3, "retried": 4}
+
+    def _apply_webhook(self, event: WebhookEvent) -> bool:
+        """Merge a final webhook event into the job payload
+
+        Returns:
+            False if the event could not be interpreted (caller should poll instead)
+        """
+        result = dict(event.result or {})
+        result_type = result.get("type")
+        if isinstance(result_type, str):
+            result_type = self._WEBHOOK_RESULT_TYPES.get(result_type.lower())
+            if result_type is None:
+                return False
+            result["type"] = result_type
+
+        update = {"status": event.status, "result": result or None}
+        for key in ("started_at", "ended_at", "duration"):
+            value = getattr(event, key)
+            if value is not None:
+                update[key] = value
+        self._apply_data({**self._data, **update})
+        return True
+
+    def _await_update(self, interval: float, remaining: Optional[float] = None) -> None:
+        """Block until the job may have changed, then update it
+
+        With a webhook receiver this waits for the push event and only polls every
+        receiver.fallback_interval seconds. With the client's poll scheduler it waits
+        for the shared poller; otherwise it sleeps for interval and polls.
+        """
+        receiver = self._receiver
+        if receiver is None:
+            scheduler = self._client._poll_scheduler
+            if scheduler is not None:
+                scheduler.wait_any([self], remaining)
+            else:
+                time.sleep(interval)
+                self.refresh()
+            return
+
+        wait_s = receiver.fallback_interval
+        if remaining is not None:
+            wait_s = max(min(wait_s, remaining), 0)
+        event = receiver.wait_any([self.id], wait_s).get(self.id)
+        if event is None or not self._apply_webhook(event):
+            self.refresh()
+
     def wait(
         self,
         timeout: Optional[int] = None,
@@ -201,6 +324,9 @@ class Job(JobInterface):
     ) -> "Job":
         """Wait for job completion by polling GET /jobs/{id}
 
+        If the job was submitted with a webhook receiver, completes on the push
+        event instead and polls only as a slow fallback.
+
         Args:
             timeout: Maximum wait time in seconds (None for infinite)
             poll_interval: Polling frequency in seconds (default 0.5)
@@ -215,11 +341,11 @@ class Job(JobInterface):
             callback(self.progress())
 
         while not self.is_done():
-            if timeout and (time.time() - start_time) > timeout:
+            elapsed = time.time() - start_time
+            if timeout and elapsed > timeout:
                 raise JobFailedError(f"Job {self.id} timed out", job_id=self.id)
 
-            time.sleep(interval)
-            self.refresh()
+            self._await_update(interval, timeout - elapsed if timeout else None)
 
             if callback:
                 callback(self.progress())
@@ -228,6 +354,10 @@ class Job(JobInterface):
 
         return self
 
+    def _ensure_done(self) -> None:
+        """Block until the job is done (accessors call this before reading results)"""
+        self.wait()
+
     def cancel(self) -> bool:
         """Cancel job (only queued status can be canceled)
 
@@ -243,8 +373,7 @@ class Job(JobInterface):
             self.refresh()
         except Exception:
             # Backend may delete the job on cancel; update status locally
-            self._data["status"] = "canceled"
-            self._results_cache = None
+            self._apply_data({**self._data, "status": "canceled"})
         return True
 
     def progress(self) -> JobProgress:
@@ -263,11 +392,29 @@ class Job(JobInterface):
         else:
             return JobProgress(total=total, completed=0, failed=0, running=total)
 
-    def results(self) -> List[Result]:
-        """Parse job results into standard Result list"""
+    def results(self, compact: bool = False) -> List[Result]:
+        """Parse job results into standard Result list
+
+        Args:
+            compact: Return CompactResult records (slotted, no pydantic validation)
+                instead of Result models; for very large result sets
+        """
         if not self.is_done():
             return []
 
+        if self._spilled is not None:
+            # Served from disk on every call; caching would defeat spilling
+            if compact:
+                return [CompactResult(*row) for row in self._iter_result_rows(intern=True)]
+            return self._parse_results()
+
+        if compact:
+            if self._compact_cache is None:
+                self._compact_cache = [
+                    CompactResult(*row) for row in self._iter_result_rows(intern=True)
+                ]
+            return self._compact_cache
+
         if self._results_cache is not None:
             return self._results_cache
 
@@ -277,10 +424,62 @@ class Job(JobInterface):
     def _parse_results(self) -> List[Result]:
         """Convert JobInResponse to list of Result objects"""
         results = []
+        for row in self._iter_result_rows(intern=True):
+            fields = dict(zip(CompactResult.__slots__, row))
+            results.append(Result(device_id=fields["device_name"], **fields))
+        return results
 
+    def _release(self) -> None:
+        """Drop the raw result payload (after it was exported)"""
+        if self._outputs is not None:
+            # Unpin outputs no other job holds, so release bounds memory
+            self._outputs.release(self._pooled)
+        self._apply_data({k: v for k, v in self._data.items() if k != "result"})
+        self._released = True
+
+    def _spill_to(self, store: "SpillStore") -> None:
+        """Move the result payload of a finished job to a spill store"""
+        if self._spilled is not None or self._released or not self.is_done():
+            return
         result_data = self._data.get("result")
         if not result_data:
-            return results
+            return
+        rows = sum(1 for _ in self._iter_result_rows())
+        offset, length = store.append(self._client._http.codec.encode(result_data))
+        self._apply_data({k: v for k, v in self._data.items() if k != "result"})
+        self._spilled = (store, offset, length, rows)
+
+    def _result_payload(self) -> Optional[dict]:
+        """Raw result payload, read back from the spill store if it was spilled"""
+        if self._spilled is None:
+            return self._data.get("result")
+        store, offset, length, _ = self._spilled
+        return self._client._http.codec.decode(store.read(offset, length))
+
+    def _result_count(self) -> int:
+        """Number of results without parsing a spilled payload"""
+        if self._spilled is not None:
+            return self._spilled[3]
+        return len(self.results(compact=True))
+
+    def _iter_result_rows(self, intern: bool = False) -> Iterator[tuple]:
+        """Yield one row per command from the JobInResponse without building models
+
+        Rows follow the CompactResult constructor order: (job_id, device_name,
+        command, stdout, stderr, ok, duration_ms, exit_status, download_url,
+        metadata, parsed, error).
+
+        Args:
+            intern: Replace stdout/stderr in the rows with the copy already held in
+                the group's output pool, so identical outputs from many devices share
+                one string (the payload itself is left as received)
+        """
+        outputs = self._outputs if intern else None
+        if self._released:
+            raise RuntimeError(f"Job {self.id} results were released after export")
+        result_data = self._result_payload()
+        if not result_data:
+            return
 
         retval = result_data.get("retval")
         error_data = result_data.get("error")
@@ -296,6 +495,7 @@ class Job(JobInterface):
                 retryable=self._is_retryable_error(error_data.get("type")),
             )
 
+        produced = False
         if isinstance(retval, list) and retval:
             for idx, item in enumerate(retval):
                 if isinstance(item, dict):
@@ -305,6 +505,9 @@ class Job(JobInterface):
                     )
                     stdout = str(item.get("stdout", ""))
                     stderr = str(item.get("stderr", ""))
+                    if outputs is not None:
+                        stdout = outputs.intern(self._pooled, stdout)
+                        stderr = outputs.intern(self._pooled, stderr)
                     exit_status = item.get("exit_status", 0)
                     download_url = item.get("download_url")
                     metadata = item.get("metadata", {})
@@ -328,26 +531,24 @@ class Job(JobInterface):
                         else job_duration_ms
                     )
 
-                    results.append(
-                        Result(
-                            job_id=self.id,
-                            device_id=eff_device_name,
-                            device_name=eff_device_name,
-                            command=cmd,
-                            stdout=stdout,
-                            stderr=stderr,
-                            ok=cmd_ok,
-                            duration_ms=cmd_duration_ms,
-                            exit_status=exit_status,
-                            download_url=download_url,
-                            metadata=metadata,
-                            parsed=parsed,
-                            error=error,
-                        )
+                    produced = True
+                    yield (
+                        self.id,
+                        eff_device_name,
+                        cmd,
+                        stdout,
+                        stderr,
+                        cmd_ok,
+                        cmd_duration_ms,
+                        exit_status,
+                        download_url,
+                        metadata,
+                        parsed,
+                        error,
                     )
 
         # If no results generated yet (empty retval, None, or failed job), create error result
-        if not results:
+        if not produced:
             commands_to_report = self._command if self._command else ["unknown"]
             for cmd in commands_to_report:
                 error_msg = "Job failed with no output"
@@ -356,21 +557,54 @@ class Job(JobInterface):
                 elif not ok:
                     error_msg = f"Job {self.status} with empty result"
 
-                results.append(
-                    Result(
-                        job_id=self.id,
-                        device_id=self._device_name,
-                        device_name=self._device_name,
-                        command=cmd,
-                        stdout="",
-                        stderr=error_msg,
-                        ok=ok,
-                        duration_ms=job_duration_ms,
-                        error=error,
-                    )
+                yield (
+                    self.id,
+                    self._device_name,
+                    cmd,
+                    "",
+                    error_msg,
+                    ok,
+                    job_duration_ms,
+                    0,
+                    None,
+                    {},
+                    None,
+                    error,
                 )
 
-        return results
+    def _status_rows(self) -> List[Tuple[str, bool, int]]:
+        """(command, ok, exit_status) per result, without building Result objects
+
+        Read straight from the raw retval items (same rules as _iter_result_rows,
+        including no rows without a result payload), so success checks skip
+        copying outputs and validating models.
+        """
+        if self._status_cache is not None:
+            return self._status_cache
+        if self._released:
+            raise RuntimeError(f"Job {self.id} results were released after export")
+
+        result_data = self._result_payload()
+        if not result_data:
+            return []
+        retval = result_data.get("retval")
+        ok = self.status == "finished" and result_data.get("type") == 1
+
+        rows = []
+        if isinstance(retval, list):
+            for idx, item in enumerate(retval):
+                if isinstance(item, dict):
+                    cmd = item.get("command") or (
+                        self._command[idx] if idx < len(self._command) else f"command_{idx + 1}"
+                    )
+                    exit_status = item.get("exit_status", 0)
+                    rows.append((cmd, ok and exit_status == 0, exit_status))
+        if not rows:
+            rows = [(cmd, ok, 0) for cmd in (self._command or ["unknown"])]
+
+        if self.is_done():
+            self._status_cache = rows
+        return rows
 
     def _is_retryable_error(self, error_type: str) -> bool:
         """Check if error is retryable"""
@@ -387,7 +621,7 @@ class Job(JobInterface):
 
         Equivalent to job.wait()[0].
         """
-        self.wait()
+        self._ensure_done()
         results = self.results()
         if not results:
             raise IndexError("Job has no results")
@@ -404,7 +638,7 @@ class Job(JobInterface):
             IndexError: If there are no results.
             ValueError: If there are more than one result.
         """
-        self.wait()
+        self._ensure_done()
         results = self.results()
         if not results:
             raise IndexError("Job has no results")
@@ -427,7 +661,7 @@ class Job(JobInterface):
 
     def __iter__(self) -> Iterator[Result]:
         """Support direct iteration, auto-wait and return results"""
-        self.wait()
+        self._ensure_done()
         return iter(self.results())
 
     def __len__(self) -> int:
@@ -444,7 +678,7 @@ class Job(JobInterface):
         Args:
             key: int returns single Result, str returns list of Results matching command pattern
         """
-        self.wait()
+        self._ensure_done()
         results = self.results()
         if isinstance(key, int):
             return results[key]
@@ -459,27 +693,27 @@ class Job(JobInterface):
         Returns:
             {device_name: [Result, ...]}
         """
-        self.wait()
+        self._ensure_done()
         return {self._device_name: self.results()}
 
     def succeeded(self) -> List[Result]:
         """Get all task-completed results (includes device errors)"""
-        self.wait()
+        self._ensure_done()
         return [r for r in self.results() if r.ok]
 
     def failed(self) -> List[Result]:
         """Get all task-failed results"""
-        self.wait()
+        self._ensure_done()
         return [r for r in self.results() if not r.ok]
 
     def truly_succeeded(self) -> List[Result]:
         """Get truly successful results (task completed AND device has no errors)"""
-        self.wait()
+        self._ensure_done()
         return [r for r in self.results() if r.is_success]
 
     def device_errors(self) -> List[Result]:
         """Get device error results (task completed but device returned errors)"""
-        self.wait()
+        self._ensure_done()
         return [r for r in self.results() if r.ok and r.has_device_error()]
 
     @property
@@ -489,38 +723,38 @@ class Job(JobInterface):
         Returns:
             True if all results have ok=True
         """
-        self.wait()
-        results = self.results()
-        return len(results) > 0 and all(r.ok for r in results)
+        self._ensure_done()
+        rows = self._status_rows()
+        return len(rows) > 0 and all(ok for _, ok, _ in rows)
 
     @property
     def stdout(self) -> str:
         """Get consolidated standard output (only non-empty results)"""
-        self.wait()
+        self._ensure_done()
         return "\n".join(r.stdout for r in self.results() if r.stdout.strip())
 
     @property
     def stderr(self) -> str:
         """Get consolidated standard error (only non-empty results)"""
-        self.wait()
+        self._ensure_done()
         return "\n".join(r.stderr for r in self.results() if r.stderr.strip())
 
     @property
     def parsed(self) -> Dict[str, Any]:
         """Get parsed data as a dictionary {command: parsed_data}"""
-        self.wait()
+        self._ensure_done()
         return {r.command: r.parsed for r in self.results()}
 
     @property
     def stdout_dict(self) -> Dict[str, str]:
         """Get raw standard output mapping {command: stdout}"""
-        self.wait()
+        self._ensure_done()
         return {r.command: r.stdout for r in self.results()}
 
     @property
     def stderr_dict(self) -> Dict[str, str]:
         """Get raw standard error mapping {command: stderr}"""
-        self.wait()
+        self._ensure_done()
         return {r.command: r.stderr for r in self.results()}
 
     @property
@@ -529,7 +763,7 @@ class Job(JobInterface):
 
         Unlike stdout (raw concatenation), text adds separators for readability.
         """
-        self.wait()
+        self._ensure_done()
         sections = []
         for r in self.results():
             content = r.stdout if r.stdout.strip() else "(no output)"
@@ -539,14 +773,12 @@ class Job(JobInterface):
     @property
     def failed_commands(self) -> List[str]:
         """Get a list of commands that failed in this job"""
-        self.wait()
-        return [r.command for r in self.results() if not r.ok]
+        self._ensure_done()
+        return [cmd for cmd, ok, _ in self._status_rows() if not ok]
 
     def to_json(self) -> str:
         """Convert all results to JSON string"""
-        import json
-
-        return json.dumps([r.to_dict() for r in self.results()], indent=2)
+        return self._client._http.codec.encode_pretty([r.to_dict() for r in self.results()])
 
     def raise_on_error(self) -> "Job":
         """Raise JobFailedError if any command failed. Returns self for chaining.
@@ -556,7 +788,7 @@ class Job(JobInterface):
             job = np.run("10.1.1.1", config=cmds).raise_on_error()
             # If we get here, everything succeeded
         """
-        self.wait()
+        self._ensure_done()
         if not self.all_ok:
             failed = self.failed_commands
             raise JobFailedError(
@@ -567,10 +799,10 @@ class Job(JobInterface):
 
     def summary(self) -> str:
         """Get a human-readable one-line summary of job execution"""
-        self.wait()
-        results = self.results()
-        ok_count = sum(1 for r in results if r.ok)
-        total = len(results)
+        self._ensure_done()
+        rows = self._status_rows()
+        ok_count = sum(1 for _, ok, _ in rows if ok)
+        total = len(rows)
         dur = f" in {self.duration:.1f}s" if self.duration is not None else ""
         status = "✓ ALL OK" if self.all_ok else f"✗ {total - ok_count}/{total} FAILED"
         return f"Job({self.id[:8]}...) {self.device_name} [{status}] {total} cmd(s){dur}"
@@ -585,8 +817,7 @@ class Job(JobInterface):
         """
         if not self.is_done():
             return False
-        results = self.results()
-        return len(results) > 0 and all(r.ok for r in results)
+        return self.all_ok
 
     def __repr__(self):
         cmd_count = len(self._command) if self._command else "?"
@@ -594,6 +825,37 @@ class Job(JobInterface):
         return f"Job(id={self.id[:8]}..., device={self._device_name}, cmds={cmd_count}, status={self.status}{dur})"
 
 
+class _ResultIndex:
+    """Positions of a finished group's results by device and command
+
+    Only keys and positions into the results sequence are held; Result objects
+    are fetched from it on demand, so a spilled group stays on disk.
+    """
+
+    __slots__ = ("results", "by_device", "by_command", "by_key")
+
+    def __init__(self, results: Sequence[Result], keys: Iterable[Tuple[str, str]]):
+        """Build the index
+
+        Args:
+            results: Results sequence the positions refer to
+            keys: (device_name, command) of each result, in results order
+        """
+        self.results = results
+        self.by_device: Dict[str, List[int]] = {}
+        self.by_command: Dict[str, List[int]] = {}
+        self.by_key: Dict[Tuple[str, str], int] = {}
+
+        for pos, (device, command) in enumerate(keys):
+            self.by_device.setdefault(device, []).append(pos)
+            self.by_command.setdefault(command, []).append(pos)
+            self.by_key[(device, command)] = pos
+
+    def fetch(self, positions: Iterable[int]) -> List[Result]:
+        """Results at the given positions"""
+        return [self.results[pos] for pos in positions]
+
+
 class JobGroup(JobInterface):
     """Multiple job aggregation manager"""
 
@@ -602,6 +864,8 @@ class JobGroup(JobInterface):
         jobs: List[Job],
         failed_devices: Optional[List] = None,
         retried_devices: Optional[List[str]] = None,
+        batch_refresh: bool = False,
+        spill: Optional["SpillStore"] = None,
     ):
         """Initialize JobGroup
 
@@ -609,6 +873,9 @@ class JobGroup(JobInterface):
             jobs: Job list
             failed_devices: List of devices that failed to submit (may contain error info)
             retried_devices: List of device hosts that were automatically retried on submission
+            batch_refresh: Poll statuses with batched GET /jobs queries by default
+            spill: Move each finished job's result payload to this store;
+                results_view() then returns a SpilledResults view decoded lazily from disk
         """
         if not jobs:
             raise ValueError("JobGroup requires at least one Job")
@@ -616,6 +883,19 @@ class JobGroup(JobInterface):
         self.failed_devices = failed_devices or []
         self.retried_devices: List[str] = retried_devices or []
         self._results_cache = None
+        self._index_cache: Optional[_ResultIndex] = None
+        # Non-terminal jobs; terminal jobs never change state again, so they are
+        # dropped from tracking and no longer polled.
+        self._pending: List[Job] = list(jobs)
+        self.polls_issued = 0
+        self.polls_saved = 0
+        self.batch_refresh = batch_refresh
+        self.spill = spill
+        # Identical outputs across devices share one string. Spilled payloads are
+        # decoded per access, so pooling them would only pin them in memory.
+        self._outputs: Optional[_OutputPool] = _OutputPool() if spill is None else None
+        for job in jobs:
+            job._outputs = self._outputs
 
     @property
     def id(self) -> List[str]:
@@ -642,24 +922,130 @@ class JobGroup(JobInterface):
         else:
             return "mixed"
 
-    def refresh(self) -> "JobGroup":
-        """Refresh all job statuses concurrently (GET /jobs/{id} for each job)"""
+    @property
+    def pending(self) -> List[Job]:
+        """Jobs that have not reached a terminal status yet"""
+        return [job for job in self._pending if not job.is_done()]
+
+    def _settle(self) -> None:
+        """Stop tracking jobs that reached a terminal status, spilling their payloads"""
+        still_pending = []
+        for job in self._pending:
+            if not job.is_done():
+                still_pending.append(job)
+            elif self.spill is not None:
+                job._spill_to(self.spill)
+        self._pending = still_pending
+
+    def _begin_refresh(self) -> List[Job]:
+        """Select the jobs to poll and update the poll counters"""
+        pending = self.pending
+        self.polls_issued += len(pending)
+        self.polls_saved += len(self.jobs) - len(pending)
+        if pending:
+            self._results_cache = None
+        return pending
+
+    def _apply_batch(self, pending: List[Job], states: Dict[str, dict]) -> List[Job]:
+        """Update jobs from a batched status response
+
+        Returns:
+            Jobs missing from the response, which still need an individual refresh
+        """
+        missing = []
+        for job in pending:
+            job_data = states.get(job.id)
+            if job_data is None:
+                missing.append(job)
+            else:
+                job._apply_data(job_data)
+        return missing
+
+    def refresh(self, batched: Optional[bool] = None) -> "JobGroup":
+        """Refresh unfinished job statuses concurrently (GET /jobs/{id} for each)
+
+        Jobs that are already terminal are skipped, so the cost of a refresh scales
+        with outstanding work. polls_issued / polls_saved count the GETs made and avoided.
+
+        Args:
+            batched: Fetch statuses with a few GET /jobs?id=... queries instead of one
+                request per job (defaults to batch_refresh). Jobs absent from the batch
+                response fall back to GET /jobs/{id}.
+        """
         import concurrent.futures
 
-        self._results_cache = None
+        pending = self._begin_refresh()
+        if pending and (self.batch_refresh if batched is None else batched):
+            client = pending[0]._client
+            states = client._fetch_job_data([job.id for job in pending])
+            pending = self._apply_batch(pending, states)
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(self.jobs), 50)) as executor:
-            list(executor.map(lambda j: j.refresh(), self.jobs))
+        if pending:
+            workers = pending[0]._client._http.fanout_limit(len(pending))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda j: j.refresh(), pending))
 
+        self._settle()
         return self
 
+    def _webhook_receiver(self) -> Optional["WebhookReceiver"]:
+        """Receiver shared by all pending jobs, if they were submitted with one"""
+        receivers = {job._receiver for job in self.pending}
+        if len(receivers) == 1:
+            return receivers.pop()
+        return None
+
+    def _apply_events(self, events: Dict[str, WebhookEvent]) -> bool:
+        """Apply webhook events to pending jobs. Returns False if any needs a poll."""
+        by_id = {job.id: job for job in self.pending}
+        applied = True
+        for job_id, event in events.items():
+            job = by_id.get(job_id)
+            if job is not None:
+                applied = job._apply_webhook(event) and applied
+        if events:
+            self._results_cache = None
+        return applied
+
+    def _await_update(self, interval: float, remaining: Optional[float] = None) -> None:
+        """Block until some job may have changed, then update the group
+
+        With a webhook receiver this waits for push events from any pending job and
+        only polls every receiver.fallback_interval seconds. With the client's poll
+        scheduler it waits for the shared poller; otherwise it sleeps for interval
+        and polls.
+        """
+        receiver = self._webhook_receiver()
+        if receiver is None:
+            scheduler = self.jobs[0]._client._poll_scheduler
+            if scheduler is not None:
+                scheduler.wait_any(self.pending, remaining)
+                self._results_cache = None
+                self._settle()
+            else:
+                time.sleep(interval)
+                self.refresh()
+            return
+
+        wait_s = receiver.fallback_interval
+        if remaining is not None:
+            wait_s = max(min(wait_s, remaining), 0)
+        events = receiver.wait_any([job.id for job in self.pending], wait_s)
+        if not events or not self._apply_events(events):
+            self.refresh()
+        else:
+            self._settle()
+
     def wait(
         self,
         timeout: Optional[int] = None,
         poll_interval: float = 0.5,
         callback: Optional[Callable] = None,
     ) -> "JobGroup":
-        """Wait for all jobs to complete by polling GET /jobs/{id}"""
+        """Wait for all jobs to complete by polling GET /jobs/{id}
+
+        Jobs submitted with a webhook receiver complete on their push events.
+        """
         start_time = time.time()
         interval = poll_interval
         max_interval = 5.0
@@ -669,19 +1055,24 @@ class JobGroup(JobInterface):
             callback(self.progress())
 
         while not self.is_done():
-            if timeout and (time.time() - start_time) > timeout:
+            elapsed = time.time() - start_time
+            if timeout and elapsed > timeout:
                 raise JobFailedError("JobGroup wait timeout")
 
-            time.sleep(interval)
-            self.refresh()
+            self._await_update(interval, timeout - elapsed if timeout else None)
 
             if callback:
                 callback(self.progress())
 
             interval = min(interval * backoff_factor, max_interval)
 
+        self._settle()
         return self
 
+    def _ensure_done(self) -> None:
+        """Block until all jobs are done (accessors call this before reading results)"""
+        self.wait()
+
     def cancel(self) -> None:
         """Cancel all jobs"""
         for job in self.jobs:
@@ -715,11 +1106,24 @@ class JobGroup(JobInterface):
             running=running,
         )
 
-    def results(self) -> List[Result]:
+    def results(self, compact: bool = False) -> List[Result]:
         """Aggregate results from all jobs
 
         Uses caching when all jobs are done to avoid redundant API calls.
+
+        Args:
+            compact: Return CompactResult records instead of Result models
+                (not cached at group level; each job caches its own records)
+
+        With a spill store, a finished group decodes every spilled payload into a
+        new list on each call; use results_view() to read them lazily instead.
         """
+        if self.spill is not None and self.is_done():
+            return list(self.results_view(compact=compact))
+
+        if compact:
+            return [r for job in self.jobs for r in job.results(compact=True)]
+
         # Return cached results if available and all jobs are done
         if self._results_cache is not None and self.is_done():
             return self._results_cache
@@ -734,38 +1138,181 @@ class JobGroup(JobInterface):
 
         return all_results
 
+    def results_view(self, compact: bool = False) -> Sequence[Result]:
+        """Results as a read-only sequence, without materializing a spilled group
+
+        With a spill store, a finished group returns a SpilledResults view that
+        decodes results job by job from disk. Otherwise this is results().
+
+        Args:
+            compact: Return CompactResult records instead of Result models
+        """
+        if self.spill is not None and self.is_done():
+            if compact:
+                return SpilledResults(self.jobs, compact=True)
+            if self._results_cache is None:
+                self._results_cache = SpilledResults(self.jobs)
+            return self._results_cache
+        return self.results(compact=compact)
+
+    def _index(self) -> _ResultIndex:
+        """Result index for the finished group
+
+        Rebuilt only when results_view() returns a new sequence, i.e. after a refresh
+        changed the group, so repeated lookups are O(1). For a spilled group the
+        keys are read from the raw rows instead of building every Result.
+        """
+        self._ensure_done()
+        results = self.results_view()
+        index = self._index_cache
+        if index is None or index.results is not results:
+            if isinstance(results, SpilledResults):
+                keys = (
+                    (row[1], row[2]) for job in self.jobs for row in job._iter_result_rows()
+                )
+            else:
+                keys = ((r.device_name, r.command) for r in results)
+            index = self._index_cache = _ResultIndex(results, keys)
+        return index
+
+    def get_result(self, device_name: str, command: str) -> Optional[Result]:
+        """Result of a command on a device (None if absent)
+
+        If a command ran more than once on a device, the last result is returned.
+        """
+        index = self._index()
+        pos = index.by_key.get((device_name, command))
+        return None if pos is None else index.results[pos]
+
+    def by_command(self, command: str) -> List[Result]:
+        """All results of a command across devices"""
+        index = self._index()
+        return index.fetch(index.by_command.get(command, []))
+
+    def group_by_output(self, command: str) -> Dict[str, List[str]]:
+        """Group devices by identical stdout of a command
+
+        Returns:
+            {stdout: [device_name, ...]}, largest group first, so the first key is
+            the common output and the remaining ones list the devices that differ
+        """
+        groups: Dict[str, List[str]] = {}
+        for r in self.by_command(command):
+            groups.setdefault(r.stdout, []).append(r.device_name)
+        return dict(sorted(groups.items(), key=lambda item: len(item[1]), reverse=True))
+
+    def dedup_stats(self) -> Dict[str, int]:
+        """Output deduplication statistics for the finished group
+
+        Returns:
+            results: Number of results
+            unique_outputs: Distinct stdout values
+            stored_bytes: Memory held by the distinct stdout strings
+            saved_bytes: Memory that identical outputs would use without sharing
+        """
+        self._ensure_done()
+        seen: Dict[int, str] = {}  # keeps the strings alive so ids stay unique
+        contents = set()
+        stats = {"results": 0, "unique_outputs": 0, "stored_bytes": 0, "saved_bytes": 0}
+        for r in self.results_view():
+            stats["results"] += 1
+            contents.add(r.stdout)
+            size = sys.getsizeof(r.stdout)
+            if id(r.stdout) in seen:
+                stats["saved_bytes"] += size
+            else:
+                seen[id(r.stdout)] = r.stdout
+                stats["stored_bytes"] += size
+        stats["unique_outputs"] = len(contents)
+        return stats
+
     def submission_failures(self) -> List[dict]:
         """Get devices that failed at the submission stage
 
+        Entries of a bulk chunk whose request raised (e.g. timed out) carry
+        ``"indeterminate": True``: their jobs may have been queued anyway, so check
+        list_jobs() before resubmitting them.
+
         Returns:
             List of {"host": ..., "reason": ...} dicts
         """
         return self.failed_devices
 
-    def stream(self, poll_interval: float = 0.5) -> Iterator[Result]:
-        """Stream results as they complete"""
-        seen = set()
+    def _iter_completed(self, poll_interval: float = 0.5) -> Iterator[Job]:
+        """Yield each job once, as soon as it reaches a terminal status"""
         interval = poll_interval
         max_interval = 5.0
         backoff_factor = 1.5
+        waiting = list(self.jobs)
+
+        while True:
+            self._settle()
+            still_waiting = []
+            for job in waiting:
+                if job.is_done():
+                    yield job
+                else:
+                    still_waiting.append(job)
+            waiting = still_waiting
+            if not waiting:
+                return
+
+            self._await_update(interval)
+            interval = min(interval * backoff_factor, max_interval)
 
-        while not self.is_done():
-            self.refresh()
+    def stream(self, poll_interval: float = 0.5) -> Iterator[Result]:
+        """Stream results as jobs complete
+
+        Each job's results are yielded once, as soon as that job reaches a terminal
+        status, so consumers can start while stragglers are still running.
+        """
+        for job in self._iter_completed(poll_interval):
+            yield from job.results()
+
+    def _json_lines(self, job: Job, release: bool) -> List[bytes]:
+        """Encode one job's results as NDJSON lines (optionally releasing its payload)"""
+        codec = job._client._http.codec
+        lines = [
+            codec.encode(CompactResult(*row).to_dict()) for row in job._iter_result_rows()
+        ]
+        if release:
+            job._release()
+            self._results_cache = None
+            self._index_cache = None
+        return lines
 
-            for result in self.results():
-                key = (result.job_id, result.command)
-                if key not in seen:
-                    seen.add(key)
-                    yield result
+    def iter_json_lines(self, release: bool = False, poll_interval: float = 0.5) -> Iterator[bytes]:
+        """Yield one JSON document per result (no trailing newline), job by job as they complete
 
-            time.sleep(interval)
-            interval = min(interval * backoff_factor, max_interval)
+        The full result list is never built, so memory stays bounded by the largest job.
+
+        Args:
+            release: Drop each job's raw payload once its lines are produced; its
+                results can no longer be read afterwards
+            poll_interval: Polling frequency while jobs are still running
+        """
+        for job in self._iter_completed(poll_interval):
+            yield from self._json_lines(job, release)
+
+    def write_ndjson(self, fp, release: bool = False, poll_interval: float = 0.5) -> int:
+        """Write results to a file object as newline-delimited JSON, streaming per job
 
-        for result in self.results():
-            key = (result.job_id, result.command)
-            if key not in seen:
-                seen.add(key)
-                yield result
+        Args:
+            fp: Binary or text file object
+            release: Drop each job's raw payload after writing it (see iter_json_lines)
+            poll_interval: Polling frequency while jobs are still running
+
+        Returns:
+            Number of lines written
+        """
+        import io
+
+        text = isinstance(fp, io.TextIOBase)
+        count = 0
+        for line in self.iter_json_lines(release=release, poll_interval=poll_interval):
+            fp.write(line.decode("utf-8") + "\n" if text else line + b"\n")
+            count += 1
+        return count
 
     def first(self) -> Result:
         """Return the first result across all jobs, waiting for completion if needed.
@@ -773,8 +1320,8 @@ class JobGroup(JobInterface):
         Raises:
             IndexError: If there are no results.
         """
-        self.wait()
-        results = self.results()
+        self._ensure_done()
+        results = self.results_view()
         if not results:
             raise IndexError("JobGroup has no results")
         return results[0]
@@ -786,8 +1333,8 @@ class JobGroup(JobInterface):
             IndexError: If there are no results.
             ValueError: If there are more than one result.
         """
-        self.wait()
-        results = self.results()
+        self._ensure_done()
+        results = self.results_view()
         if not results:
             raise IndexError("JobGroup has no results")
         if len(results) > 1:
@@ -798,7 +1345,23 @@ class JobGroup(JobInterface):
 
     def is_done(self) -> bool:
         """Whether all jobs are done"""
-        return all(job.is_done() for job in self.jobs)
+        return not self.pending
+
+    def close(self) -> None:
+        """Close and delete the group's spill store, if any
+
+        Results of spilled jobs can no longer be read afterwards.
+        """
+        if self.spill is not None:
+            self.spill.close()
+
+    def __enter__(self) -> "JobGroup":
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - close the spill store"""
+        self.close()
 
     def __iter__(self) -> Iterator[Result]:
         """Support direct iteration, auto-stream for batch jobs"""
@@ -821,8 +1384,8 @@ class JobGroup(JobInterface):
         Returns:
             All Result list for the device
         """
-        self.wait()
-        return [r for r in self.results() if r.device_name == device_name]
+        index = self._index()
+        return index.fetch(index.by_device.get(device_name, []))
 
     def to_dict(self) -> dict:
         """Convert to dictionary for device name access
@@ -830,13 +1393,8 @@ class JobGroup(JobInterface):
         Returns:
             {device_name: [Result, ...], ...}
         """
-        self.wait()
-        result_dict = {}
-        for result in self.results():
-            if result.device_name not in result_dict:
-                result_dict[result.device_name] = []
-            result_dict[result.device_name].append(result)
-        return result_dict
+        index = self._index()
+        return {device: index.fetch(positions) for device, positions in index.by_device.items()}
 
     def succeeded(self) -> List[Result]:
         """Get all task-completed results (includes device errors)
@@ -844,8 +1402,8 @@ class JobGroup(JobInterface):
         Returns:
             List of task-completed Result objects
         """
-        self.wait()
-        return [r for r in self.results() if r.ok]
+        self._ensure_done()
+        return [r for r in self.results_view() if r.ok]
 
     def failed(self) -> List[Result]:
         """Get all task-failed results
@@ -853,8 +1411,8 @@ class JobGroup(JobInterface):
         Returns:
             List of task-failed Result objects
         """
-        self.wait()
-        return [r for r in self.results() if not r.ok]
+        self._ensure_done()
+        return [r for r in self.results_view() if not r.ok]
 
     def truly_succeeded(self) -> List[Result]:
         """Get truly successful results (task completed AND device has no errors)
@@ -862,8 +1420,8 @@ class JobGroup(JobInterface):
         Returns:
             List of truly successful Result objects
         """
-        self.wait()
-        return [r for r in self.results() if r.is_success]
+        self._ensure_done()
+        return [r for r in self.results_view() if r.is_success]
 
     def device_errors(self) -> List[Result]:
         """Get device error results (task completed but device returned errors)
@@ -871,8 +1429,8 @@ class JobGroup(JobInterface):
         Returns:
             List of device error Result objects
         """
-        self.wait()
-        return [r for r in self.results() if r.ok and r.has_device_error()]
+        self._ensure_done()
+        return [r for r in self.results_view() if r.ok and r.has_device_error()]
 
     @property
     def all_ok(self) -> bool:
@@ -881,71 +1439,54 @@ class JobGroup(JobInterface):
         Returns:
             True if all results have ok=True
         """
-        self.wait()
-        results = self.results()
-        return len(results) > 0 and all(r.ok for r in results)
+        self._ensure_done()
+        rows = [row for job in self.jobs for row in job._status_rows()]
+        return len(rows) > 0 and all(ok for _, ok, _ in rows)
 
     @property
     def stdout(self) -> Dict[str, str]:
         """Get standard output as a dictionary {device_name: consolidated_stdout}"""
-        self.wait()
-        result_dict = {}
-        for r in self.results():
-            if r.device_name not in result_dict:
-                result_dict[r.device_name] = []
-            if r.stdout.strip():
-                result_dict[r.device_name].append(r.stdout)
-        return {k: "\n".join(v) for k, v in result_dict.items()}
+        return {
+            device: "\n".join(r.stdout for r in results if r.stdout.strip())
+            for device, results in self.to_dict().items()
+        }
 
     @property
     def stderr(self) -> Dict[str, str]:
         """Get standard error as a dictionary {device_name: consolidated_stderr}"""
-        self.wait()
-        result_dict = {}
-        for r in self.results():
-            if r.device_name not in result_dict:
-                result_dict[r.device_name] = []
-            if r.stderr.strip():
-                result_dict[r.device_name].append(r.stderr)
-        return {k: "\n".join(v) for k, v in result_dict.items()}
+        return {
+            device: "\n".join(r.stderr for r in results if r.stderr.strip())
+            for device, results in self.to_dict().items()
+        }
 
     @property
     def parsed(self) -> Dict[str, Dict[str, Any]]:
         """Get all parsed data as a nested dictionary {device_name: {command: parsed_data}}"""
-        self.wait()
-        result_dict = {}
-        for r in self.results():
-            if r.device_name not in result_dict:
-                result_dict[r.device_name] = {}
-            result_dict[r.device_name][r.command] = r.parsed
-        return result_dict
+        return {
+            device: {r.command: r.parsed for r in results}
+            for device, results in self.to_dict().items()
+        }
 
     @property
     def stdout_dict(self) -> Dict[str, Dict[str, str]]:
         """Get raw standard output as a nested dictionary {device_name: {command: stdout}}"""
-        self.wait()
-        result_dict = {}
-        for r in self.results():
-            if r.device_name not in result_dict:
-                result_dict[r.device_name] = {}
-            result_dict[r.device_name][r.command] = r.stdout
-        return result_dict
+        return {
+            device: {r.command: r.stdout for r in results}
+            for device, results in self.to_dict().items()
+        }
 
     @property
     def stderr_dict(self) -> Dict[str, Dict[str, str]]:
         """Get raw standard error as a nested dictionary {device_name: {command: stderr}}"""
-        self.wait()
-        result_dict = {}
-        for r in self.results():
-            if r.device_name not in result_dict:
-                result_dict[r.device_name] = {}
-            result_dict[r.device_name][r.command] = r.stderr
-        return result_dict
+        return {
+            device: {r.command: r.stderr for r in results}
+            for device, results in self.to_dict().items()
+        }
 
     @property
     def text(self) -> str:
         """Get consolidated execution logs from all jobs in the group"""
-        self.wait()
+        self._ensure_done()
         sections = []
         for job in self.jobs:
             header = f"=== Device: {job.device_name} (Job: {job.id}) ==="
@@ -955,14 +1496,71 @@ class JobGroup(JobInterface):
     @property
     def failed_commands(self) -> Dict[str, List[str]]:
         """Get a dictionary mapping device names to their failed commands"""
-        self.wait()
+        self._ensure_done()
         return {j.device_name: j.failed_commands for j in self.jobs if not j.all_ok}
 
     def to_json(self) -> str:
         """Convert all results to JSON string"""
-        import json
+        codec = self.jobs[0]._client._http.codec
+        return codec.encode_pretty([r.to_dict() for r in self.results_view()])
+
+    # Columns produced by to_columns()/to_arrow(), as positions in Job._iter_result_rows()
+    _COLUMNS = {
+        "job_id": 0,
+        "device_name": 1,
+        "command": 2,
+        "ok": 5,
+        "exit_status": 7,
+        "duration_ms": 6,
+        "stdout": 3,
+        "stderr": 4,
+    }
+
+    def to_columns(self) -> Dict[str, list]:
+        """Results as columns, built in one pass over the job payloads
+
+        No Result models or intermediate dicts are created; the stdout/stderr
+        strings are shared with the job payloads.
+
+        Returns:
+            {column: [value, ...]} for job_id, device_name, command, ok,
+            exit_status, duration_ms, stdout and stderr
+        """
+        self._ensure_done()
+        columns: Dict[str, list] = {name: [] for name in self._COLUMNS}
+        appenders = [(columns[name].append, idx) for name, idx in self._COLUMNS.items()]
+        for job in self.jobs:
+            for row in job._iter_result_rows():
+                for append, idx in appenders:
+                    append(row[idx])
+        return columns
+
+    def to_arrow(self):
+        """Results as a pyarrow.Table (requires pyarrow)
 
-        return json.dumps([r.to_dict() for r in self.results()], indent=2)
+        Built from to_columns(); write it with pyarrow.parquet.write_table() or
+        convert with table.to_pandas().
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "to_arrow() requires pyarrow: pip install 'netpulse-sdk[arrow]'"
+            ) from e
+
+        schema = pa.schema(
+            [
+                ("job_id", pa.string()),
+                ("device_name", pa.string()),
+                ("command", pa.string()),
+                ("ok", pa.bool_()),
+                ("exit_status", pa.int64()),
+                ("duration_ms", pa.int64()),
+                ("stdout", pa.large_string()),
+                ("stderr", pa.large_string()),
+            ]
+        )
+        return pa.Table.from_pydict(self.to_columns(), schema=schema)
 
     @property
     def devices(self) -> List[str]:
@@ -977,7 +1575,7 @@ class JobGroup(JobInterface):
             group = np.run(devices, command="show version").raise_on_error()
             # If we get here, all devices succeeded
         """
-        self.wait()
+        self._ensure_done()
         if not self.all_ok:
             failed = self.failed_commands
             failed_devices = list(failed.keys())
@@ -988,7 +1586,7 @@ class JobGroup(JobInterface):
 
     def summary(self) -> str:
         """Get a human-readable multi-line summary of group execution"""
-        self.wait()
+        self._ensure_done()
         lines = [f"JobGroup: {len(self.jobs)} device(s), status={self.status}"]
         for job in self.jobs:
             lines.append(f"  {job.summary()}")
@@ -1004,8 +1602,7 @@ class JobGroup(JobInterface):
         """
         if not self.is_done():
             return False
-        results = self.results()
-        return len(results) > 0 and all(r.ok for r in results)
+        return self.all_ok
 
     def __repr__(self):
         devices = ", ".join(j.device_name for j in self.jobs[:3])
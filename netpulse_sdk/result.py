@@ -4,7 +4,8 @@ Result and JobProgress data models
 
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -28,6 +29,83 @@ DEFAULT_DEVICE_ERROR_PATTERNS = [
 ]
 
 
+class ErrorMatcher:
+    """Compiled device error pattern set
+
+    The patterns are combined into a single case-insensitive, multiline regex so
+    output is scanned once instead of once per line and pattern. Results are
+    identical to matching each pattern against each line; pattern sets that cannot
+    be combined (e.g. inline global flags) fall back to per-line matching.
+
+    Use ErrorMatcher.get() to share compiled matchers::
+
+        matcher = ErrorMatcher.get(["^% ", "Error:"])
+        matcher.search(result.stdout)
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        self._compiled = [re.compile(p, re.IGNORECASE) for p in self.patterns]
+        self._combined = None
+        if not self.patterns:
+            return
+        try:
+            self._combined = re.compile(
+                "|".join(f"(?:{p})" for p in self.patterns), re.IGNORECASE | re.MULTILINE
+            )
+        except re.error:
+            pass
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _cached(patterns: Tuple[str, ...]) -> "ErrorMatcher":
+        return ErrorMatcher(patterns)
+
+    @classmethod
+    def get(cls, patterns: Optional[Iterable[str]] = None) -> "ErrorMatcher":
+        """Return the shared matcher for patterns (default DEFAULT_DEVICE_ERROR_PATTERNS)"""
+        return cls._cached(tuple(patterns or DEFAULT_DEVICE_ERROR_PATTERNS))
+
+    def _line_matches(self, line: str) -> bool:
+        return any(pat.search(line) for pat in self._compiled)
+
+    def search(self, text: str) -> bool:
+        """Whether any line of text matches any pattern"""
+        if self._combined is None:
+            return any(self._line_matches(line) for line in text.split("\n"))
+
+        for match in self._combined.finditer(text):
+            if "\n" not in match.group():
+                return True
+            # Match spans lines (e.g. a \s in a custom pattern): check line by line
+            return any(self._line_matches(line) for line in text.split("\n"))
+        return False
+
+    def error_lines(self, text: str) -> List[str]:
+        """Stripped lines of text that match any pattern, in order"""
+        if self._combined is None:
+            return [line.strip() for line in text.split("\n") if self._line_matches(line)]
+
+        lines = []
+        pos = 0
+        while pos <= len(text):
+            match = self._combined.search(text, pos)
+            if match is None:
+                break
+            if "\n" in match.group():
+                return [line.strip() for line in text.split("\n") if self._line_matches(line)]
+            start = text.rfind("\n", 0, match.start()) + 1
+            end = text.find("\n", match.start())
+            if end == -1:
+                end = len(text)
+            lines.append(text[start:end].strip())
+            pos = end + 1
+        return lines
+
+    def __repr__(self):
+        return f"ErrorMatcher({len(self.patterns)} patterns)"
+
+
 class WorkerInfo(BaseModel):
     """Worker status information (mirrors backend WorkerInResponse)"""
 
@@ -152,7 +230,7 @@ class Result(BaseModel):
     def has_device_error(self, patterns: Optional[List[str]] = None) -> bool:
         """Check if device output contains error indicators
 
-        Uses per-line regex matching to reduce false positives.
+        Uses per-line regex matching to reduce false positives (see ErrorMatcher).
 
         Args:
             patterns: List of regex patterns to check (case-insensitive, matched per line).
@@ -167,13 +245,7 @@ class Result(BaseModel):
         if not self.stdout:
             return False
 
-        check_patterns = patterns or DEFAULT_DEVICE_ERROR_PATTERNS
-        compiled = [re.compile(p, re.IGNORECASE) for p in check_patterns]
-
-        for line in self.stdout.split("\n"):
-            if any(pat.search(line) for pat in compiled):
-                return True
-        return False
+        return ErrorMatcher.get(patterns).search(self.stdout)
 
     @property
     def is_success(self) -> bool:
@@ -204,15 +276,7 @@ class Result(BaseModel):
         if not self.stdout:
             return []
 
-        check_patterns = patterns or DEFAULT_DEVICE_ERROR_PATTERNS
-        compiled = [re.compile(p, re.IGNORECASE) for p in check_patterns]
-
-        error_lines = []
-        for line in self.stdout.split("\n"):
-            if any(pat.search(line) for pat in compiled):
-                error_lines.append(line.strip())
-
-        return error_lines
+        return ErrorMatcher.get(patterns).error_lines(self.stdout)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for easy serialization"""
@@ -228,6 +292,132 @@ class Result(BaseModel):
         return f"Result({self.device_name}:{self.command} [{status}]{dur})"
 
 
+class CompactResult:
+    """Slotted, validation-free result record for very large result sets
+
+    Returned by Job.results(compact=True) / JobGroup.results(compact=True). Holds
+    the same fields as Result, sharing the strings and metadata dicts of the job
+    payload instead of copying them into a pydantic model. Call to_result() for a
+    full Result when needed.
+    """
+
+    __slots__ = (
+        "job_id",
+        "device_name",
+        "command",
+        "stdout",
+        "stderr",
+        "ok",
+        "duration_ms",
+        "exit_status",
+        "download_url",
+        "metadata",
+        "parsed",
+        "error",
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        device_name: str,
+        command: str,
+        stdout: str = "",
+        stderr: str = "",
+        ok: bool = False,
+        duration_ms: int = 0,
+        exit_status: int = 0,
+        download_url: Optional[str] = None,
+        metadata: Optional[dict] = None,
+        parsed: Optional[Any] = None,
+        error: Optional[Error] = None,
+    ):
+        self.job_id = job_id
+        self.device_name = device_name
+        self.command = command
+        self.stdout = stdout
+        self.stderr = stderr
+        self.ok = ok
+        self.duration_ms = duration_ms
+        self.exit_status = exit_status
+        self.download_url = download_url
+        self.metadata = metadata if metadata is not None else {}
+        self.parsed = parsed
+        self.error = error
+
+    @property
+    def device_id(self) -> str:
+        """Device IP/identifier (same as device_name)"""
+        return self.device_name
+
+    @property
+    def duration_s(self) -> float:
+        """Execution duration in seconds"""
+        return self.duration_ms / 1000.0
+
+    def has_device_error(self, patterns: Optional[List[str]] = None) -> bool:
+        """Check if device output contains error indicators (see Result.has_device_error)"""
+        if not self.ok:
+            return True
+        if not self.stdout:
+            return False
+        return ErrorMatcher.get(patterns).search(self.stdout)
+
+    def get_error_lines(self, patterns: Optional[List[str]] = None) -> List[str]:
+        """Extract error lines from output (see Result.get_error_lines)"""
+        if not self.stdout:
+            return []
+        return ErrorMatcher.get(patterns).error_lines(self.stdout)
+
+    @property
+    def is_success(self) -> bool:
+        """True success: task completed AND device returned no errors"""
+        return self.ok and not self.has_device_error()
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    def to_result(self) -> "Result":
+        """Build the equivalent Result model (without re-validation)"""
+        return Result.model_construct(
+            job_id=self.job_id,
+            device_id=self.device_name,
+            device_name=self.device_name,
+            command=self.command,
+            stdout=self.stdout,
+            stderr=self.stderr,
+            ok=self.ok,
+            duration_ms=self.duration_ms,
+            exit_status=self.exit_status,
+            download_url=self.download_url,
+            metadata=self.metadata,
+            parsed=self.parsed,
+            error=self.error,
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary (same shape as Result.to_dict())"""
+        return {
+            "job_id": self.job_id,
+            "device_id": self.device_name,
+            "device_name": self.device_name,
+            "command": self.command,
+            "stdout": self.stdout,
+            "stderr": self.stderr,
+            "ok": self.ok,
+            "duration_ms": self.duration_ms,
+            "exit_status": self.exit_status,
+            "download_url": self.download_url,
+            "metadata": self.metadata,
+            "parsed": self.parsed,
+            "error": self.error.model_dump() if self.error is not None else None,
+        }
+
+    def __repr__(self):
+        status = "OK" if self.ok else "FAILED"
+        dur = f" {self.duration_ms}ms" if self.duration_ms else ""
+        return f"CompactResult({self.device_name}:{self.command} [{status}]{dur})"
+
+
 class WebhookEvent(BaseModel):
     """Webhook event payload received from NetPulse server.
 
@@ -0,0 +1,289 @@
+"""
+Shared adaptive status polling for waiting jobs
+"""
+
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .enums import JobStatus
+
+if TYPE_CHECKING:
+    from .client import NetPulseClient
+    from .job import Job
+
+log = logging.getLogger(__name__)
+
+_TERMINAL = {JobStatus.FINISHED, JobStatus.FAILED, JobStatus.CANCELED}
+
+
+class _Entry:
+    """Polling state for one job ID"""
+
+    __slots__ = ("job_id", "jobs", "deadline", "polls", "first_seen", "started_at")
+
+    def __init__(self, job_id: str, now: float):
+        self.job_id = job_id
+        self.jobs: List["Job"] = []
+        self.deadline = now
+        self.polls = 0
+        self.first_seen = now
+        self.started_at: Optional[float] = None
+
+
+class _Waiter:
+    """One blocked wait_any() call and the poll error delivered to it"""
+
+    __slots__ = ("job_ids", "error")
+
+    def __init__(self, job_ids: Iterable[str]):
+        self.job_ids = set(job_ids)
+        self.error: Optional[Exception] = None
+
+
+class PollScheduler:
+    """Client-level status poller shared by every waiting Job and JobGroup
+
+    Instead of each wait() running its own sleep/backoff loop, waiters subscribe
+    their jobs here. A single background thread keeps a priority queue of per-job
+    poll deadlines and refreshes all jobs that are due (within coalesce_window)
+    together: with one batched GET /jobs query when the client's batch_poll is on,
+    else with concurrent GET /jobs/{id} requests.
+
+    Poll intervals adapt to an EWMA of observed job durations: queued jobs poll at
+    half the expected duration, running jobs poll faster as they approach it and
+    back off again once overdue. Until a duration has been observed, intervals
+    grow geometrically from min_interval like the plain wait() loop.
+
+    Enabled with ``NetPulseClient(poll_scheduler=True)``.
+    """
+
+    def __init__(
+        self,
+        client: "NetPulseClient",
+        min_interval: float = 0.5,
+        max_interval: float = 5.0,
+        coalesce_window: float = 0.25,
+        smoothing: float = 0.3,
+    ):
+        """Initialize scheduler (the polling thread starts on first subscription)
+
+        Args:
+            client: Client used for status queries
+            min_interval: Shortest delay between polls of one job (seconds)
+            max_interval: Longest delay between polls of one job (seconds)
+            coalesce_window: Jobs due within this many seconds are polled together
+            smoothing: EWMA weight of the latest observed job duration
+        """
+        self._client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.coalesce_window = coalesce_window
+        self.smoothing = smoothing
+
+        self.expected_duration: Optional[float] = None
+        self.polls = 0
+
+        self._entries: Dict[str, _Entry] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def subscribe(self, jobs: Iterable["Job"]) -> None:
+        """Track jobs until they reach a terminal status
+
+        Raises:
+            RuntimeError: If the scheduler was closed
+        """
+        now = time.monotonic()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("PollScheduler is closed")
+            for job in jobs:
+                if job.is_done():
+                    continue
+                entry = self._entries.get(job.id)
+                if entry is None:
+                    entry = _Entry(job.id, now)
+                    self._entries[job.id] = entry
+                    self._schedule(entry, now + self._next_interval(entry, job.status, now))
+                if not any(j is job for j in entry.jobs):
+                    entry.jobs.append(job)
+
+            if self._entries and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="netpulse-poll-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def wait_any(self, jobs: List["Job"], timeout: Optional[float] = None) -> bool:
+        """Block until any of jobs is done, or timeout
+
+        Raises:
+            NetPulseError: If polling a job failed (the error from the status query)
+
+        Returns:
+            True if a job is done, False on timeout
+        """
+        # Register before subscribing so a poll failing in between still reaches us
+        waiter = _Waiter(job.id for job in jobs)
+        with self._cond:
+            self._waiters.append(waiter)
+        try:
+            self.subscribe(jobs)
+            deadline = None if timeout is None else time.monotonic() + timeout
+            with self._cond:
+                while True:
+                    if waiter.error is not None:
+                        raise waiter.error
+                    if any(job.is_done() for job in jobs):
+                        return True
+                    if self._closed:
+                        return False
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+        finally:
+            with self._cond:
+                self._waiters.remove(waiter)
+
+    def close(self) -> None:
+        """Stop polling and release waiters"""
+        with self._cond:
+            self._closed = True
+            self._entries.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+
+    def _schedule(self, entry: _Entry, deadline: float) -> None:
+        entry.deadline = deadline
+        heapq.heappush(self._heap, (deadline, next(self._seq), entry.job_id))
+
+    def _next_interval(self, entry: _Entry, status: str, now: float) -> float:
+        """Delay until the next poll of a job"""
+        expected = self.expected_duration
+        if expected is None:
+            interval = self.min_interval * (1.5**entry.polls)
+        elif status == JobStatus.QUEUED:
+            interval = expected / 2
+        else:
+            running_for = now - (entry.started_at or entry.first_seen)
+            interval = abs(expected - running_for) / 2
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def _observe_duration(self, duration: Optional[float]) -> None:
+        if duration is None:
+            return
+        if self.expected_duration is None:
+            self.expected_duration = duration
+        else:
+            self.expected_duration += self.smoothing * (duration - self.expected_duration)
+
+    def _pop_due(self, limit: float) -> List[_Entry]:
+        """Pop entries whose deadline is before limit (caller holds the lock)"""
+        due = []
+        while self._heap and self._heap[0][0] <= limit:
+            deadline, _, job_id = heapq.heappop(self._heap)
+            entry = self._entries.get(job_id)
+            if entry is not None and entry.deadline == deadline:
+                due.append(entry)
+        return due
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed or not self._entries:
+                        self._thread = None
+                        return
+                    now = time.monotonic()
+                    if self._heap and self._heap[0][0] <= now:
+                        break
+                    self._cond.wait(self._heap[0][0] - now if self._heap else None)
+                due = self._pop_due(now + self.coalesce_window)
+            if due:
+                self._poll(due)
+
+    def _fetch(self, job_ids: List[str]) -> Tuple[Dict[str, dict], Dict[str, Exception]]:
+        """Batched status query, falling back to GET /jobs/{id} for missing jobs
+
+        Without the client's batch_poll option every job is fetched individually.
+
+        The per-job fallback fans out over a bounded thread pool like
+        JobGroup.refresh(), so a server without the id filter costs one round-trip
+        per poll cycle rather than one per job.
+        """
+        errors: Dict[str, Exception] = {}
+        try:
+            states = self._client._fetch_job_data(job_ids) if self._client.batch_poll else {}
+        except Exception as e:
+            return {}, {job_id: e for job_id in job_ids}
+
+        missing = [job_id for job_id in job_ids if job_id not in states]
+        if not missing:
+            return states, errors
+
+        http = self._client._http
+
+        def fetch_one(job_id: str):
+            try:
+                return job_id, http.get(f"/jobs/{job_id}"), None
+            except Exception as e:
+                return job_id, None, e
+
+        workers = http.fanout_limit(len(missing))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for job_id, job_data, error in executor.map(fetch_one, missing):
+                if error is not None:
+                    errors[job_id] = error
+                else:
+                    states[job_id] = job_data
+        return states, errors
+
+    def _poll(self, due: List[_Entry]) -> None:
+        states, errors = self._fetch([entry.job_id for entry in due])
+        now = time.monotonic()
+
+        with self._cond:
+            self.polls += len(due)
+            for entry in due:
+                if self._entries.get(entry.job_id) is not entry:
+                    continue
+
+                error = errors.get(entry.job_id)
+                if error is not None:
+                    log.warning(f"Status poll for Job {entry.job_id} failed: {error}")
+                    for waiter in self._waiters:
+                        if entry.job_id in waiter.job_ids:
+                            waiter.error = error
+                    del self._entries[entry.job_id]
+                    continue
+
+                job_data = states[entry.job_id]
+                for job in entry.jobs:
+                    job._apply_data(dict(job_data))
+
+                status = job_data.get("status")
+                if status in _TERMINAL:
+                    self._observe_duration(job_data.get("duration"))
+                    del self._entries[entry.job_id]
+                    continue
+
+                if status == JobStatus.STARTED and entry.started_at is None:
+                    entry.started_at = now
+                entry.polls += 1
+                self._schedule(entry, now + self._next_interval(entry, status, now))
+
+            self._cond.notify_all()
+
+    def __repr__(self):
+        return f"PollScheduler(tracking={len(self._entries)}, polls={self.polls})"
@@ -0,0 +1,168 @@
+"""
+Disk-backed storage for finished job payloads
+"""
+
+import bisect
+import logging
+import mmap
+import os
+import tempfile
+import threading
+import weakref
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .job import Job
+    from .result import Result
+
+log = logging.getLogger(__name__)
+
+
+class SpillStore:
+    """Append-only segment file holding encoded job result payloads
+
+    Finished jobs of a JobGroup created with a spill store write their raw
+    ``result`` payload here and drop it from memory. Reads go through a
+    memory-mapped view of the segment, so only the pages of the jobs being
+    accessed are resident; the OS page cache does the rest.
+
+    The segment is a temporary file removed by close() (also called by
+    JobGroup.close()), or when the store is garbage collected.
+
+    Example::
+
+        np = NetPulseClient(spill_dir="/var/tmp")  # every JobGroup spills
+        with np.collect(devices, "show running-config").wait() as group:
+            for result in group.results_view():  # decoded job by job from disk
+                ...
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """Create the segment file
+
+        Args:
+            directory: Directory for the segment file (default: system temp dir)
+        """
+        fd, self.path = tempfile.mkstemp(prefix="netpulse-spill-", suffix=".seg", dir=directory)
+        self._file = os.fdopen(fd, "w+b")
+        self._size = 0
+        # Single-slot holder so the finalizer can close the current mapping
+        self._map: List[Optional[mmap.mmap]] = [None]
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _cleanup, self._file, self.path, self._map)
+
+    @property
+    def size(self) -> int:
+        """Bytes written to the segment"""
+        return self._size
+
+    @property
+    def closed(self) -> bool:
+        """Whether the segment was closed (and deleted)"""
+        return self._file.closed
+
+    def append(self, data: bytes) -> Tuple[int, int]:
+        """Append a record
+
+        Returns:
+            (offset, length) to pass to read()
+        """
+        with self._lock:
+            if self._file.closed:
+                raise ValueError("SpillStore is closed")
+            offset = self._size
+            self._file.seek(offset)
+            self._file.write(data)
+            self._size += len(data)
+            return offset, len(data)
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Read a record written by append()"""
+        with self._lock:
+            if self._file.closed:
+                raise ValueError("SpillStore is closed")
+            if length == 0:
+                return b""
+            mapped = self._map[0]
+            if mapped is None or len(mapped) < offset + length:
+                # The segment grew since it was mapped: flush and remap
+                self._file.flush()
+                if mapped is not None:
+                    mapped.close()
+                mapped = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+                self._map[0] = mapped
+            return mapped[offset : offset + length]
+
+    def close(self) -> None:
+        """Close and delete the segment file"""
+        with self._lock:
+            self._finalizer()
+
+    def __enter__(self) -> "SpillStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self):
+        state = "closed" if self.closed else f"{self._size} bytes"
+        return f"SpillStore({self.path} [{state}])"
+
+
+def _cleanup(file, path: str, mapping: list) -> None:
+    if mapping[0] is not None:
+        mapping[0].close()
+        mapping[0] = None
+    file.close()
+    try:
+        os.unlink(path)
+    except OSError as e:
+        log.debug(f"Failed to remove spill segment {path}: {e}")
+
+
+class SpilledResults(Sequence):
+    """Read-only sequence of a finished group's results, decoded lazily per job
+
+    Returned by JobGroup.results_view() when the group spills to disk. Indexing and
+    iteration decode one job at a time from the spill segment; the most recently
+    decoded job is kept so sequential access parses each job once.
+    """
+
+    def __init__(self, jobs: List["Job"], compact: bool = False):
+        self._jobs = jobs
+        self._compact = compact
+        self._ends: List[int] = []
+        total = 0
+        for job in jobs:
+            total += job._result_count()
+            self._ends.append(total)
+        self._current: Tuple[int, list] = (-1, [])
+
+    def _job_results(self, job_idx: int) -> list:
+        idx, results = self._current
+        if idx != job_idx:
+            results = self._jobs[job_idx].results(compact=self._compact)
+            self._current = (job_idx, results)
+        return results
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("result index out of range")
+        job_idx = bisect.bisect_right(self._ends, index)
+        start = self._ends[job_idx - 1] if job_idx else 0
+        return self._job_results(job_idx)[index - start]
+
+    def __iter__(self) -> Iterator["Result"]:
+        for job in self._jobs:
+            yield from job.results(compact=self._compact)
+
+    def __repr__(self):
+        return f"SpilledResults(jobs={len(self._jobs)}, results={len(self)})"
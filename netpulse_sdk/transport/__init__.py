@@ -2,6 +2,21 @@
 HTTP transport layer
 """
 
-from .http import HTTPClient
+from .balancer import EndpointPool
+from .breaker import CircuitBreaker, CircuitBreakers
+from .http import AsyncHTTPClient, HTTPClient
+from .retry import RetryPolicy
+from .hedging import HedgePolicy
+from .ratelimit import AdaptiveConcurrency, RateLimit
 
-__all__ = ["HTTPClient"]
+__all__ = [
+    "HTTPClient",
+    "AsyncHTTPClient",
+    "RateLimit",
+    "AdaptiveConcurrency",
+    "HedgePolicy",
+    "EndpointPool",
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "RetryPolicy",
+]
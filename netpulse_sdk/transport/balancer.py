@@ -0,0 +1,135 @@
+"""
+Least-outstanding-requests balancing over several NetPulse API replicas
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Union
+
+
+class _Endpoint:
+    """Request accounting and health state of one API replica"""
+
+    __slots__ = ("url", "outstanding", "requests", "failures", "ejected_until", "probe_at")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0  # consecutive
+        self.ejected_until: Optional[float] = None
+        self.probe_at = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return self.ejected_until is None
+
+
+class EndpointPool:
+    """Replica set used by HTTPClient when several base URLs are configured
+
+    Each request goes to the healthy replica with the fewest requests in
+    flight. A replica that fails at the transport level or answers 502/503/504
+    is ejected for ``eject_seconds`` (doubling with each consecutive failure, up
+    to ``max_eject_seconds``) and only readmitted after its ``/health`` probe
+    succeeds. If every replica is ejected, the one ejected longest ago is used
+    rather than failing outright.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        eject_seconds: float = 10.0,
+        max_eject_seconds: float = 300.0,
+    ):
+        """Initialize pool
+
+        Args:
+            urls: Replica base URLs (the first one is the primary)
+            eject_seconds: Initial ejection time after a failure
+            max_eject_seconds: Upper bound of the ejection time
+        """
+        self.endpoints = [_Endpoint(url.rstrip("/")) for url in urls]
+        if not self.endpoints:
+            raise ValueError("EndpointPool requires at least one URL")
+        self.eject_seconds = eject_seconds
+        self.max_eject_seconds = max_eject_seconds
+        self._rotation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def pick(self, exclude: Iterable[_Endpoint] = ()) -> _Endpoint:
+        """Choose the replica for the next request and count it as outstanding"""
+        excluded = set(map(id, exclude))
+        with self._lock:
+            candidates = [ep for ep in self.endpoints if id(ep) not in excluded] or self.endpoints
+            healthy = [ep for ep in candidates if ep.healthy]
+            if healthy:
+                # Rotate the starting point so ties do not always favour the primary
+                self._rotation = (self._rotation + 1) % len(healthy)
+                ordered = healthy[self._rotation :] + healthy[: self._rotation]
+                endpoint = min(ordered, key=lambda ep: ep.outstanding)
+            else:
+                endpoint = min(candidates, key=lambda ep: ep.ejected_until)
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def release(self, endpoint: _Endpoint, failed: bool) -> None:
+        """Finish a request picked with pick()"""
+        with self._lock:
+            endpoint.outstanding -= 1
+            if failed:
+                self._eject(endpoint)
+            elif endpoint.healthy:
+                endpoint.failures = 0
+
+    def _eject(self, endpoint: _Endpoint) -> None:
+        """Take a replica out of rotation (caller holds the lock)"""
+        endpoint.failures += 1
+        duration = min(
+            self.eject_seconds * 2 ** (endpoint.failures - 1), self.max_eject_seconds
+        )
+        endpoint.ejected_until = time.monotonic() + duration
+        endpoint.probe_at = endpoint.ejected_until
+
+    def due_probes(self) -> List[_Endpoint]:
+        """Claim ejected replicas whose ejection has expired, for a /health probe"""
+        now = time.monotonic()
+        with self._lock:
+            due = [ep for ep in self.endpoints if not ep.healthy and ep.probe_at <= now]
+            for ep in due:
+                # One prober at a time; retry after another ejection period
+                ep.probe_at = now + self.eject_seconds
+            return due
+
+    def mark_health(self, endpoint: _Endpoint, ok: bool) -> None:
+        """Apply a /health probe result"""
+        with self._lock:
+            if ok:
+                endpoint.ejected_until = None
+                endpoint.failures = 0
+            elif endpoint.healthy:
+                self._eject(endpoint)
+            else:
+                endpoint.failures += 1
+
+    def stats(self) -> List[Dict[str, Union[str, int, bool]]]:
+        """Per-replica state: url, healthy, outstanding, requests, failures"""
+        with self._lock:
+            return [
+                {
+                    "url": ep.url,
+                    "healthy": ep.healthy,
+                    "outstanding": ep.outstanding,
+                    "requests": ep.requests,
+                    "failures": ep.failures,
+                }
+                for ep in self.endpoints
+            ]
+
+    def __repr__(self):
+        healthy = sum(1 for ep in self.endpoints if ep.healthy)
+        return f"EndpointPool({healthy}/{len(self.endpoints)} healthy)"
@@ -0,0 +1,214 @@
+"""
+Per-host circuit breakers for API requests
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Union
+
+from ..error import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Outcome:
+    """Outcome of one request admitted by a circuit breaker"""
+
+    __slots__ = ("response",)
+
+    def __init__(self):
+        self.response = None
+
+    @property
+    def failed(self) -> bool:
+        """Whether the response is a server error"""
+        return self.response is not None and self.response.status_code >= 500
+
+
+class CircuitBreaker:
+    """Closed/open/half-open state of one API host
+
+    Closed: requests pass and their outcomes are kept for ``window`` seconds.
+    Once at least ``min_requests`` were seen and the share of failures
+    (transport errors, timeouts, 5xx responses) reaches ``failure_rate``, the
+    circuit opens. Open: requests fail immediately with CircuitOpenError for
+    ``open_seconds``. Half-open: up to ``half_open_requests`` trial requests
+    are let through; a success closes the circuit, a failure opens it again.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_rate: float = 0.5,
+        min_requests: int = 5,
+        window: float = 30.0,
+        open_seconds: float = 30.0,
+        half_open_requests: int = 1,
+    ):
+        """Initialize breaker
+
+        Args:
+            host: Host (netloc) the breaker guards
+            failure_rate: Failure share (0-1] within the window that opens the circuit
+            min_requests: Requests within the window before the rate is evaluated
+            window: Seconds of outcomes the failure rate is computed over
+            open_seconds: Time requests are rejected before trial requests are allowed
+            half_open_requests: Concurrent trial requests while half-open
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+        if min_requests < 1 or half_open_requests < 1:
+            raise ValueError("min_requests and half_open_requests must be >= 1")
+        self.host = host
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.open_seconds = open_seconds
+        self.half_open_requests = half_open_requests
+
+        self.state = CLOSED
+        self.rejected = 0
+        self._outcomes: deque = deque()  # (timestamp, ok)
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until trial requests are allowed (0 unless open)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def before_request(self) -> bool:
+        """Admit a request, returning whether it is a half-open trial
+
+        Raises:
+            CircuitOpenError: If the circuit is open or all trial slots are taken
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    self._reject()
+                self.state = HALF_OPEN
+                self._trials = 0
+            if self.state == HALF_OPEN:
+                if self._trials >= self.half_open_requests:
+                    self._reject()
+                self._trials += 1
+                return True
+            return False
+
+    def _reject(self):
+        """Raise CircuitOpenError (caller holds the lock)"""
+        self.rejected += 1
+        retry_after = max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+        raise CircuitOpenError(
+            f"Circuit open for {self.host}, retry in {retry_after:.1f}s",
+            host=self.host,
+            retry_after=retry_after,
+        )
+
+    def record(self, ok: Optional[bool], trial: bool = False) -> None:
+        """Record the outcome of an admitted request (None if it was abandoned)"""
+        now = time.monotonic()
+        with self._lock:
+            if trial:
+                self._trials = max(0, self._trials - 1)
+                if self.state != HALF_OPEN or ok is None:
+                    return
+                if ok:
+                    self.state = CLOSED
+                    self._outcomes.clear()
+                    self._failures = 0
+                else:
+                    self._open(now)
+                return
+
+            # Late answers to requests sent before the circuit opened are ignored
+            if ok is None or self.state != CLOSED:
+                return
+            self._outcomes.append((now, ok))
+            if not ok:
+                self._failures += 1
+            while self._outcomes and self._outcomes[0][0] < now - self.window:
+                _, old_ok = self._outcomes.popleft()
+                if not old_ok:
+                    self._failures -= 1
+            total = len(self._outcomes)
+            if total >= self.min_requests and self._failures >= self.failure_rate * total:
+                self._open(now)
+
+    def _open(self, now: float) -> None:
+        """Trip the circuit (caller holds the lock)"""
+        self.state = OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+        self._failures = 0
+
+    def stats(self) -> Dict[str, Union[str, int, float]]:
+        """state, requests and failures in the window, rejected total, retry_after"""
+        with self._lock:
+            requests, failures = len(self._outcomes), self._failures
+        return {
+            "state": self.state,
+            "requests": requests,
+            "failures": failures,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after,
+        }
+
+    def __repr__(self):
+        return f"CircuitBreaker({self.host}, state={self.state})"
+
+
+class CircuitBreakers:
+    """CircuitBreaker per API host, created on first use with shared settings
+
+    Enabled with ``NetPulseClient(circuit_breaker=True)`` or a dict of
+    CircuitBreaker keyword arguments; inspect with
+    ``client.circuit_breakers.stats()``.
+    """
+
+    def __init__(self, **options):
+        """Initialize registry
+
+        Args:
+            **options: CircuitBreaker keyword arguments (failure_rate, min_requests,
+                window, open_seconds, half_open_requests)
+        """
+        CircuitBreaker("", **options)  # validate early
+        self.options = options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        """Breaker of a host"""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(host, CircuitBreaker(host, **self.options))
+        return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Union[str, int, float]]]:
+        """{host: CircuitBreaker.stats()}"""
+        return {host: breaker.stats() for host, breaker in list(self._breakers.items())}
+
+    def __repr__(self):
+        states = ", ".join(f"{b.host}={b.state}" for b in self._breakers.values())
+        return f"CircuitBreakers({states})"
+
+
+def build_breakers(
+    config: Union[None, bool, dict, CircuitBreakers],
+) -> Optional[CircuitBreakers]:
+    """Normalize the circuit_breaker option (False/None, True, kwargs dict or instance)"""
+    if isinstance(config, CircuitBreakers):
+        return config
+    if isinstance(config, dict):
+        return CircuitBreakers(**config)
+    return CircuitBreakers() if config else None
@@ -0,0 +1,129 @@
+"""
+Request hedging for idempotent status reads
+"""
+
+import re
+import threading
+from collections import deque
+from typing import Dict, Iterable, Optional, Union
+
+# Idempotent single-object reads hedged by default
+DEFAULT_HEDGE_PATHS = (r"/jobs/[^/]+", r"/detached-tasks/[^/]+", r"/workers")
+
+
+class HedgePolicy:
+    """When to send a duplicate GET, plus hedging metrics
+
+    If a hedgeable GET has not been answered after ``delay`` (the
+    ``percentile`` of recent latencies, clamped to [min_delay, max_delay]), a
+    second identical request is sent and the first answer wins; the other one
+    is abandoned. ``max_hedge_ratio`` caps hedges to a fraction of requests so
+    a slow cluster does not receive double load.
+
+    Enabled with ``NetPulseClient(hedging=True)`` or a dict of the constructor
+    arguments; read the metrics with ``client.hedging.stats()``.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        max_delay: float = 2.0,
+        initial_delay: float = 0.5,
+        max_hedge_ratio: float = 0.1,
+        window: int = 500,
+        paths: Iterable[str] = DEFAULT_HEDGE_PATHS,
+    ):
+        """Initialize policy
+
+        Args:
+            percentile: Latency percentile (0-1) used as the hedge delay
+            min_delay: Lower bound of the hedge delay (seconds)
+            max_delay: Upper bound of the hedge delay (seconds)
+            initial_delay: Hedge delay until 20 latencies have been observed
+            max_hedge_ratio: Maximum fraction of requests that may be hedged
+            window: Number of recent latencies the percentile is computed over
+            paths: Regular expressions for GET paths that may be hedged (full match)
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_delay = initial_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self._paths = re.compile("|".join(f"(?:{p})" for p in paths))
+
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies: deque = deque(maxlen=window)
+        self._delay: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def applies(self, method: str, path: str) -> bool:
+        """Whether a request may be hedged"""
+        return method.upper() == "GET" and self._paths.fullmatch(path.split("?", 1)[0]) is not None
+
+    @property
+    def delay(self) -> float:
+        """Current hedge delay in seconds"""
+        with self._lock:
+            if self._delay is None:
+                if len(self._latencies) < 20:
+                    return self.initial_delay
+                ordered = sorted(self._latencies)
+                value = ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)]
+                self._delay = min(max(value, self.min_delay), self.max_delay)
+            return self._delay
+
+    def should_hedge(self) -> bool:
+        """Claim a hedge if the hedge budget allows it"""
+        with self._lock:
+            if self.hedged >= self.max_hedge_ratio * (self.requests + 1):
+                return False
+            self.hedged += 1
+            return True
+
+    def record(self, latency: float, hedge_won: bool = False) -> None:
+        """Record the latency of the first answer to a hedgeable request"""
+        with self._lock:
+            self.requests += 1
+            if hedge_won:
+                self.hedge_wins += 1
+            self._latencies.append(latency)
+            self._delay = None
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Hedging metrics
+
+        Returns:
+            requests: Hedgeable requests completed
+            hedged: Duplicate requests sent
+            hedge_wins: Requests answered first by the duplicate
+            hedge_rate: hedged / requests
+            win_rate: hedge_wins / hedged
+            delay: Current hedge delay in seconds
+        """
+        delay = self.delay
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "hedge_rate": self.hedged / self.requests if self.requests else 0.0,
+                "win_rate": self.hedge_wins / self.hedged if self.hedged else 0.0,
+                "delay": delay,
+            }
+
+    def __repr__(self):
+        return f"HedgePolicy(delay={self.delay:.3f}s, hedged={self.hedged}/{self.requests})"
+
+
+def build_hedging(config: Union[None, bool, dict, HedgePolicy]) -> Optional[HedgePolicy]:
+    """Normalize the hedging option (False/None, True, kwargs dict or instance)"""
+    if isinstance(config, HedgePolicy):
+        return config
+    if isinstance(config, dict):
+        return HedgePolicy(**config)
+    return HedgePolicy() if config else None
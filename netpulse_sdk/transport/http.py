@@ -2,57 +2,285 @@
 HTTP client wrapper
 """
 
+import asyncio
+import concurrent.futures
+import gzip
 import logging
-from typing import Any, Optional, Union
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Union
+from urllib.parse import urlsplit
 
 import httpx
 
-from ..error import AuthError, NetworkError, RequestTimeoutError
+from ..codec import get_codec
+from ..error import AuthError, CircuitOpenError, NetworkError, RequestTimeoutError
+from .balancer import EndpointPool, _Endpoint
+from .breaker import CircuitBreaker, CircuitBreakers, _Outcome, build_breakers
+from .hedging import HedgePolicy, build_hedging
+from .ratelimit import (
+    AdaptiveConcurrency,
+    RateLimit,
+    build_concurrency,
+    build_limits,
+    endpoint_class,
+)
+from .retry import IDEMPOTENCY_HEADER, IDEMPOTENT_METHODS, RetryPolicy, build_retry
+from .timeouts import DEFAULT_TIMEOUT, TimeoutSpec, build_timeout, build_timeouts, operation
 
 log = logging.getLogger(__name__)
 
+# Gateway/availability errors that eject a replica
+_FAILOVER_STATUSES = {502, 503, 504}
+# Timeout of the /health probe readmitting an ejected replica
+_PROBE_TIMEOUT = 2.0
 
-class HTTPClient:
-    """HTTP client for NetPulse API communication"""
+
+def _zstd_compressor() -> Callable[[bytes], bytes]:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "compression='zstd' requires the zstandard package: pip install 'netpulse-sdk[zstd]'"
+        ) from None
+    return zstandard.ZstdCompressor(level=3).compress
+
+
+# Content-Encoding -> factory returning a compress(bytes) function
+_COMPRESSORS: Dict[str, Callable[[], Callable[[bytes], bytes]]] = {
+    "gzip": lambda: lambda data: gzip.compress(data, compresslevel=5, mtime=0),
+    "zstd": _zstd_compressor,
+}
+
+
+class _BaseHTTPClient:
+    """Shared configuration and response handling for sync and async clients"""
 
     def __init__(
         self,
-        base_url: str,
+        base_url: Union[str, List[str]],
         api_key: str,
         api_key_name: str = "X-API-KEY",
-        timeout: int = 30,
+        timeout: TimeoutSpec = DEFAULT_TIMEOUT,
         pool_connections: int = 10,
         pool_maxsize: int = 200,
         max_retries: int = 3,
+        json_codec: Optional[str] = None,
+        http2: bool = False,
+        compression: Optional[str] = None,
+        compression_threshold: int = 16384,
+        rate_limits: Optional[Dict[str, Union[dict, RateLimit]]] = None,
+        adaptive_concurrency: Union[None, bool, dict, AdaptiveConcurrency] = None,
+        hedging: Union[None, bool, dict, HedgePolicy] = None,
+        circuit_breaker: Union[None, bool, dict, CircuitBreakers] = None,
+        timeouts: Optional[Dict[str, TimeoutSpec]] = None,
+        retry: Union[None, bool, dict, RetryPolicy] = None,
     ):
         """Initialize HTTP client
 
         Args:
-            base_url: API base URL
+            base_url: API base URL, or a list of replica URLs to balance over (the first
+                is the primary, used for file downloads)
             api_key: API key
             api_key_name: API key header name (default: X-API-KEY)
-            timeout: Request timeout in seconds
+            timeout: Request timeout: seconds, an httpx.Timeout, or a dict of its
+                connect/read/write/pool fields (unset fields default to 30 seconds)
             pool_connections: Number of connection pools (for different hosts)
             pool_maxsize: Maximum connections per pool
-            max_retries: Automatic retry count
+            max_retries: Transport-level retry count for failed connection attempts
+            json_codec: JSON codec name (auto, orjson, msgspec, json; see codec.get_codec)
+            http2: Negotiate HTTP/2 (via TLS ALPN) so concurrent requests are multiplexed
+                over a few connections; requires the h2 package
+            compression: Content-Encoding for JSON request bodies ("gzip" or "zstd");
+                None sends them uncompressed
+            compression_threshold: Only compress bodies of at least this many bytes
+            rate_limits: {endpoint class: RateLimit or RateLimit kwargs} for the
+                "submit" (non-GET), "poll" (GET) and "download" (streamed) classes
+            adaptive_concurrency: AIMD limit on concurrent JSON requests: True for
+                defaults, or AdaptiveConcurrency / its constructor kwargs
+            hedging: Send a duplicate of slow idempotent status GETs and use the first
+                answer: True for defaults, or HedgePolicy / its constructor kwargs.
+                Hedgeable GETs run on a pool of up to min(pool_maxsize, 50) threads
+                (the adaptive concurrency maximum if enabled), plus a duplicate pool
+                of max_hedge_ratio times that size
+            circuit_breaker: Fail requests to a host immediately with CircuitOpenError
+                while its error rate is high: True for defaults, or CircuitBreakers /
+                CircuitBreaker kwargs
+            timeouts: {operation: timeout} overriding timeout for "submit" (non-GET),
+                "poll" (GET), "download" (streamed) or "template" (/template/*) requests;
+                dict values inherit unset fields from timeout
+            retry: Retry failed requests with jittered exponential backoff, honouring
+                Retry-After: True for defaults, or RetryPolicy / its constructor kwargs
+
+        Raises:
+            ImportError: If http2 or zstd compression is enabled but the library
+                it needs is not installed
+            ValueError: If compression, a rate_limits endpoint class or a timeouts
+                operation is unknown
         """
-        self.base_url = base_url.rstrip("/")
+        urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        if not urls:
+            raise ValueError("base_url must not be empty")
+        self.base_url = urls[0].rstrip("/")
+        self.endpoints = EndpointPool(urls) if len(urls) > 1 else None
         self.api_key = api_key
         self.api_key_name = api_key_name
-        self.timeout = timeout
+        self.timeout = build_timeout(timeout)
+        self.timeouts = build_timeouts(timeouts, self.timeout)
+        self.codec = get_codec(json_codec)
+        self.http2 = http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "http2=True requires the h2 package: pip install 'netpulse-sdk[http2]'"
+                ) from None
+
+        if compression is not None and compression not in _COMPRESSORS:
+            choices = ", ".join(_COMPRESSORS)
+            raise ValueError(f"Unknown compression: {compression} (expected one of: {choices})")
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._compress = _COMPRESSORS[compression]() if compression else None
+        self.limits = build_limits(rate_limits)
+        self.concurrency = build_concurrency(adaptive_concurrency)
+        self.hedging = build_hedging(hedging)
+        self.breakers = build_breakers(circuit_breaker)
+        self.retry = build_retry(retry)
+        self._host = urlsplit(self.base_url).netloc
+        self._max_connections = pool_maxsize
 
         limits = httpx.Limits(
             max_keepalive_connections=pool_connections,
             max_connections=pool_maxsize,
         )
-        transport = httpx.HTTPTransport(retries=max_retries, limits=limits)
+        self.session = self._create_session(limits, max_retries)
 
-        self.session = httpx.Client(
-            base_url=self.base_url,
-            headers={api_key_name: api_key},
-            timeout=timeout,
-            transport=transport,
-        )
+    def _create_session(self, limits: httpx.Limits, max_retries: int):
+        """Build the underlying httpx client"""
+        raise NotImplementedError
+
+    def _limit(self, endpoint: str) -> Optional[RateLimit]:
+        """RateLimit configured for an endpoint class, if any"""
+        return self.limits.get(endpoint)
+
+    def fanout_limit(self, tasks: int, default: int = 50) -> int:
+        """Worker count for a helper fanning out tasks requests
+
+        With adaptive concurrency the pool is sized to its maximum and the
+        controller decides how many requests actually run.
+        """
+        cap = self.concurrency.max_limit if self.concurrency else default
+        return max(1, min(tasks, cap))
+
+    @staticmethod
+    def _is_overloaded(response: httpx.Response) -> bool:
+        """Whether a response signals server overload to adaptive concurrency"""
+        return response.status_code >= 500 or response.status_code == 429
+
+    @staticmethod
+    def _is_absolute(path: str) -> bool:
+        return path.startswith(("http://", "https://"))
+
+    def _can_fail_over(self, method: str, error: Optional[Exception], tried: list) -> bool:
+        """Whether a failed attempt may be resent to a replica not yet tried"""
+        if len(tried) >= len(self.endpoints):
+            return False
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        # Nothing reached the server
+        return isinstance(error, (httpx.ConnectError, CircuitOpenError))
+
+    def _breaker(self, url: str) -> Optional[CircuitBreaker]:
+        """Circuit breaker of the host a request URL goes to"""
+        if self.breakers is None:
+            return None
+        return self.breakers.get(urlsplit(url).netloc if self._is_absolute(url) else self._host)
+
+    @contextmanager
+    def _circuit(self, url: str) -> Iterator[_Outcome]:
+        """Admit a request through its host's circuit breaker and record the outcome
+
+        Transport errors and 5xx responses (set as outcome.response) count as failures.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        breaker = self._breaker(url)
+        outcome = _Outcome()
+        if breaker is None:
+            yield outcome
+            return
+        trial = breaker.before_request()
+        ok = None
+        try:
+            yield outcome
+            ok = not outcome.failed
+        except httpx.TransportError:
+            ok = False
+            raise
+        finally:
+            breaker.record(ok, trial)
+
+    def _hedges(self, method: str, path: str) -> bool:
+        """Whether a request is sent with hedging"""
+        return self.hedging is not None and self.hedging.applies(method, path)
+
+    def _timeout(self, operation: str) -> Union[httpx.Timeout, Any]:
+        """Timeout profile of an operation, or the session default"""
+        return self.timeouts.get(operation, httpx.USE_CLIENT_DEFAULT)
+
+    def _prepare(self, method: str, path: str, kwargs: dict) -> dict:
+        """Encode the body, apply the operation's timeout profile and idempotency key"""
+        kwargs = self._encode_body(kwargs)
+        if self.timeouts:
+            kwargs["timeout"] = self._timeout(operation(method, path))
+        if (
+            self.retry is not None
+            and self.retry.idempotency_keys
+            and method.upper() not in IDEMPOTENT_METHODS
+        ):
+            headers = kwargs.get("headers") or {}
+            kwargs["headers"] = {**headers, IDEMPOTENCY_HEADER: uuid.uuid4().hex}
+        return kwargs
+
+    def _retry_delay(
+        self,
+        retry: int,
+        method: str,
+        path: str,
+        kwargs: dict,
+        error: Optional[Exception] = None,
+        response: Optional[httpx.Response] = None,
+    ) -> Optional[float]:
+        """Wait before resending a failed attempt, or None to give up"""
+        if self.retry is None:
+            return None
+        delay = self.retry.delay(retry, method, kwargs.get("headers"), error, response)
+        if delay is not None:
+            reason = error or f"HTTP {response.status_code}"
+            log.info(f"Retrying {method} {path} in {delay:.2f}s ({reason})")
+        return delay
+
+    def _encode_body(self, kwargs: dict) -> dict:
+        """Replace a json= request argument with a body encoded by the codec
+
+        Bodies of at least compression_threshold bytes are compressed when
+        compression is enabled.
+        """
+        body = kwargs.pop("json", None)
+        if body is not None:
+            content = self.codec.encode(body)
+            headers = {"Content-Type": "application/json"}
+            if self._compress is not None and len(content) >= self.compression_threshold:
+                content = self._compress(content)
+                headers["Content-Encoding"] = self.compression
+            kwargs["content"] = content
+            kwargs["headers"] = headers
+        return kwargs
 
     def _handle_response(self, response: httpx.Response) -> Union[dict, list]:
         """Handle API response"""
@@ -64,7 +292,7 @@ class HTTPClient:
 
             # Try to extract detailed error from JSON body
             try:
-                error_data = response.json()
+                error_data = self.codec.decode(response.content)
                 detail = error_data.get("detail")
                 errors = error_data.get("errors")
 
@@ -90,33 +318,205 @@ class HTTPClient:
             return {}
 
         try:
-            return response.json()
+            return self.codec.decode(response.content)
         except ValueError as e:
             raise NetworkError("Invalid JSON response") from e
 
+    def _translate_error(self, e: httpx.RequestError, path: str) -> Exception:
+        """Map an httpx transport error to the SDK error hierarchy"""
+        if isinstance(e, httpx.TimeoutException):
+            return RequestTimeoutError(f"Request timeout: {path}", url=path)
+        return NetworkError(f"Network request failed: {str(e)}")
+
+
+class HTTPClient(_BaseHTTPClient):
+    """HTTP client for NetPulse API communication"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Hedging thread pools, created on first hedgeable request
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._hedge_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._hedge_slots: Optional[threading.Semaphore] = None
+        self._executor_lock = threading.Lock()
+
+    def _create_session(self, limits: httpx.Limits, max_retries: int) -> httpx.Client:
+        transport = httpx.HTTPTransport(retries=max_retries, limits=limits, http2=self.http2)
+        return httpx.Client(
+            base_url=self.base_url,
+            headers={self.api_key_name: self.api_key},
+            timeout=self.timeout,
+            transport=transport,
+        )
+
+    def _request(self, method: str, path: str, **kwargs) -> Union[dict, list]:
+        """Send a request, retrying as the retry policy allows, and decode the response"""
+        limit = self._limit(endpoint_class(method))
+        send = self._send_hedged if self._hedges(method, path) else self._send
+        kwargs = self._prepare(method, path, kwargs)
+        retry = 0
+        while True:
+            try:
+                with limit.slot() if limit else nullcontext():
+                    response = send(method, path, kwargs)
+            except httpx.RequestError as e:
+                delay = self._retry_delay(retry, method, path, kwargs, error=e)
+                if delay is None:
+                    raise self._translate_error(e, path) from e
+            else:
+                delay = self._retry_delay(retry, method, path, kwargs, response=response)
+                if delay is None:
+                    return self._handle_response(response)
+            time.sleep(delay)
+            retry += 1
+
+    def _send(self, method: str, path: str, kwargs: dict) -> httpx.Response:
+        """Send to the least loaded healthy replica, failing over if allowed"""
+        pool = self.endpoints
+        if pool is None or self._is_absolute(path):
+            return self._dispatch(method, path, kwargs)
+
+        for endpoint in pool.due_probes():
+            pool.mark_health(endpoint, self._probe(endpoint))
+
+        tried = []
+        while True:
+            endpoint = pool.pick(exclude=tried)
+            tried.append(endpoint)
+            try:
+                response = self._dispatch(method, endpoint.url + path, kwargs)
+            except (httpx.TransportError, CircuitOpenError) as e:
+                pool.release(endpoint, failed=True)
+                if not self._can_fail_over(method, e, tried):
+                    raise
+                log.warning(f"{method} {path} failed on {endpoint.url} ({e}), failing over")
+                continue
+            except BaseException:
+                pool.release(endpoint, failed=False)
+                raise
+
+            failed = response.status_code in _FAILOVER_STATUSES
+            pool.release(endpoint, failed=failed)
+            if failed and self._can_fail_over(method, None, tried):
+                log.warning(
+                    f"{method} {path} got {response.status_code} from {endpoint.url}, failing over"
+                )
+                continue
+            return response
+
+    def _dispatch(self, method: str, url: str, kwargs: dict) -> httpx.Response:
+        """Send through the circuit breaker and adaptive concurrency controller, if enabled"""
+        with self._circuit(url) as outcome:
+            if self.concurrency is None:
+                response = self.session.request(method, url, **kwargs)
+            else:
+                with self.concurrency.slot() as sample:
+                    response = self.session.request(method, url, **kwargs)
+                    sample.overloaded = self._is_overloaded(response)
+            outcome.response = response
+            return response
+
+    def _probe(self, endpoint: _Endpoint) -> bool:
+        """GET /health on one replica"""
+        try:
+            response = self.session.get(f"{endpoint.url}/health", timeout=_PROBE_TIMEOUT)
+        except httpx.HTTPError:
+            return False
+        return response.is_success
+
+    def check_endpoints(self) -> List[dict]:
+        """Probe /health on every replica now and return EndpointPool.stats()"""
+        if self.endpoints is None:
+            return []
+        for endpoint in self.endpoints.endpoints:
+            self.endpoints.mark_health(endpoint, self._probe(endpoint))
+        return self.endpoints.stats()
+
+    def _send_hedged(self, method: str, path: str, kwargs: dict) -> httpx.Response:
+        """Send, duplicating the request if it is slower than the hedge delay
+
+        The hedge delay is measured from when the primary is dispatched, so time
+        queued locally never triggers a hedge. Duplicates run on their own pool,
+        sized to the hedge budget, and are skipped while it is busy so they never
+        queue behind the requests they should overtake.
+        """
+        policy = self.hedging
+        self._start_hedge_pools()
+        dispatched = threading.Event()
+        start = []
+
+        def send_primary() -> httpx.Response:
+            start.append(time.monotonic())
+            dispatched.set()
+            return self._send(method, path, kwargs)
+
+        primary = self._executor.submit(send_primary)
+        dispatched.wait()
+        pending = {primary}
+        remaining = policy.delay - (time.monotonic() - start[0])
+        done, _ = concurrent.futures.wait(pending, timeout=max(remaining, 0))
+        if not done and self._hedge_slots.acquire(blocking=False):
+            if policy.should_hedge():
+                hedge = self._hedge_pool.submit(self._send, method, path, kwargs)
+                hedge.add_done_callback(lambda _: self._hedge_slots.release())
+                pending.add(hedge)
+            else:
+                self._hedge_slots.release()
+
+        error = None
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    # The loser cannot be interrupted; it completes in the background
+                    policy.record(time.monotonic() - start[0], hedge_won=future is not primary)
+                    return future.result()
+                error = error or future.exception()
+        raise error
+
+    def _start_hedge_pools(self) -> None:
+        """Create the primary and duplicate request pools (on first use)
+
+        The primary pool is sized like a JobGroup.refresh() fan-out (fanout_limit),
+        the widest burst of concurrent hedgeable GETs the SDK issues, rather than to
+        pool_maxsize.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                workers = self.fanout_limit(self._max_connections)
+                hedge_workers = max(1, int(workers * self.hedging.max_hedge_ratio))
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="netpulse-request"
+                )
+                self._hedge_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=hedge_workers, thread_name_prefix="netpulse-hedge"
+                )
+                self._hedge_slots = threading.Semaphore(hedge_workers)
+
+    @contextmanager
+    def stream(self, path: str, params: Optional[dict] = None) -> Iterator[httpx.Response]:
+        """Open a streaming GET request (download endpoint class)"""
+        limit = self._limit("download")
+        with limit.slot() if limit else nullcontext(), self._circuit(path) as outcome:
+            with self.session.stream(
+                "GET", path, params=params, timeout=self._timeout("download")
+            ) as response:
+                outcome.response = response
+                yield response
+
     def get(
         self, path: str, params: Optional[dict] = None, stream: bool = False
     ) -> Union[dict, list, httpx.Response]:
         """Send GET request"""
-        try:
-            if stream:
-                return self.session.stream("GET", path, params=params)
-            response = self.session.get(path, params=params)
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise RequestTimeoutError(f"Request timeout: {path}", url=path) from e
-        except httpx.RequestError as e:
-            raise NetworkError(f"Network request failed: {str(e)}") from e
+        if stream:
+            return self.stream(path, params=params)
+        return self._request("GET", path, params=params)
 
     def post(self, path: str, json: Optional[dict] = None) -> dict:
         """Send POST request"""
-        try:
-            response = self.session.post(path, json=json)
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise RequestTimeoutError(f"Request timeout: {path}", url=path) from e
-        except httpx.RequestError as e:
-            raise NetworkError(f"Network request failed: {str(e)}") from e
+        return self._request("POST", path, json=json)
 
     def post_multipart(
         self,
@@ -126,44 +526,196 @@ class HTTPClient:
         content: Any = None,
     ) -> dict:
         """Send multipart POST request"""
-        try:
-            response = self.session.post(path, data=data, files=files, content=content)
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise RequestTimeoutError(f"Request timeout: {path}", url=path) from e
-        except httpx.RequestError as e:
-            raise NetworkError(f"Network request failed: {str(e)}") from e
+        return self._request("POST", path, data=data, files=files, content=content)
 
     def delete(self, path: str, params: Optional[dict] = None) -> Union[dict, list]:
         """Send DELETE request"""
-        try:
-            response = self.session.delete(path, params=params)
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise RequestTimeoutError(f"Request timeout: {path}", url=path) from e
-        except httpx.RequestError as e:
-            raise NetworkError(f"Network request failed: {str(e)}") from e
+        return self._request("DELETE", path, params=params)
 
     def put(self, path: str, json: Optional[dict] = None) -> dict:
         """Send PUT request"""
-        try:
-            response = self.session.put(path, json=json)
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise RequestTimeoutError(f"Request timeout: {path}", url=path) from e
-        except httpx.RequestError as e:
-            raise NetworkError(f"Network request failed: {str(e)}") from e
+        return self._request("PUT", path, json=json)
 
     def patch(self, path: str, json: Optional[dict] = None) -> dict:
         """Send PATCH request"""
-        try:
-            response = self.session.patch(path, json=json)
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise RequestTimeoutError(f"Request timeout: {path}", url=path) from e
-        except httpx.RequestError as e:
-            raise NetworkError(f"Network request failed: {str(e)}") from e
+        return self._request("PATCH", path, json=json)
 
     def close(self):
         """Close session"""
+        with self._executor_lock:
+            for pool in (self._executor, self._hedge_pool):
+                if pool is not None:
+                    pool.shutdown(wait=False)
+            self._executor = self._hedge_pool = None
         self.session.close()
+
+
+class AsyncHTTPClient(_BaseHTTPClient):
+    """Asyncio HTTP client for NetPulse API communication (httpx.AsyncClient)"""
+
+    def _create_session(self, limits: httpx.Limits, max_retries: int) -> httpx.AsyncClient:
+        transport = httpx.AsyncHTTPTransport(
+            retries=max_retries, limits=limits, http2=self.http2
+        )
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={self.api_key_name: self.api_key},
+            timeout=self.timeout,
+            transport=transport,
+        )
+
+    async def _request(self, method: str, path: str, **kwargs) -> Union[dict, list]:
+        """Send a request, retrying as the retry policy allows, and decode the response"""
+        limit = self._limit(endpoint_class(method))
+        send = self._send_hedged if self._hedges(method, path) else self._send
+        kwargs = self._prepare(method, path, kwargs)
+        retry = 0
+        while True:
+            try:
+                async with limit.async_slot() if limit else nullcontext():
+                    response = await send(method, path, kwargs)
+            except httpx.RequestError as e:
+                delay = self._retry_delay(retry, method, path, kwargs, error=e)
+                if delay is None:
+                    raise self._translate_error(e, path) from e
+            else:
+                delay = self._retry_delay(retry, method, path, kwargs, response=response)
+                if delay is None:
+                    return self._handle_response(response)
+            await asyncio.sleep(delay)
+            retry += 1
+
+    async def _send(self, method: str, path: str, kwargs: dict) -> httpx.Response:
+        """Send to the least loaded healthy replica, failing over if allowed"""
+        pool = self.endpoints
+        if pool is None or self._is_absolute(path):
+            return await self._dispatch(method, path, kwargs)
+
+        for endpoint in pool.due_probes():
+            pool.mark_health(endpoint, await self._probe(endpoint))
+
+        tried = []
+        while True:
+            endpoint = pool.pick(exclude=tried)
+            tried.append(endpoint)
+            try:
+                response = await self._dispatch(method, endpoint.url + path, kwargs)
+            except (httpx.TransportError, CircuitOpenError) as e:
+                pool.release(endpoint, failed=True)
+                if not self._can_fail_over(method, e, tried):
+                    raise
+                log.warning(f"{method} {path} failed on {endpoint.url} ({e}), failing over")
+                continue
+            except BaseException:
+                pool.release(endpoint, failed=False)
+                raise
+
+            failed = response.status_code in _FAILOVER_STATUSES
+            pool.release(endpoint, failed=failed)
+            if failed and self._can_fail_over(method, None, tried):
+                log.warning(
+                    f"{method} {path} got {response.status_code} from {endpoint.url}, failing over"
+                )
+                continue
+            return response
+
+    async def _dispatch(self, method: str, url: str, kwargs: dict) -> httpx.Response:
+        """Send through the circuit breaker and adaptive concurrency controller, if enabled"""
+        with self._circuit(url) as outcome:
+            if self.concurrency is None:
+                response = await self.session.request(method, url, **kwargs)
+            else:
+                async with self.concurrency.async_slot() as sample:
+                    response = await self.session.request(method, url, **kwargs)
+                    sample.overloaded = self._is_overloaded(response)
+            outcome.response = response
+            return response
+
+    async def _probe(self, endpoint: _Endpoint) -> bool:
+        """GET /health on one replica"""
+        try:
+            response = await self.session.get(f"{endpoint.url}/health", timeout=_PROBE_TIMEOUT)
+        except httpx.HTTPError:
+            return False
+        return response.is_success
+
+    async def check_endpoints(self) -> List[dict]:
+        """Probe /health on every replica now and return EndpointPool.stats()"""
+        if self.endpoints is None:
+            return []
+        results = await asyncio.gather(*(self._probe(ep) for ep in self.endpoints.endpoints))
+        for endpoint, ok in zip(self.endpoints.endpoints, results):
+            self.endpoints.mark_health(endpoint, ok)
+        return self.endpoints.stats()
+
+    async def _send_hedged(self, method: str, path: str, kwargs: dict) -> httpx.Response:
+        """Send, duplicating the request if it is slower than the hedge delay"""
+        policy = self.hedging
+        start = time.monotonic()
+        primary = asyncio.ensure_future(self._send(method, path, kwargs))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=policy.delay)
+            if not done and policy.should_hedge():
+                pending.add(asyncio.ensure_future(self._send(method, path, kwargs)))
+
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        policy.record(time.monotonic() - start, hedge_won=task is not primary)
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get(self, path: str, params: Optional[dict] = None) -> Union[dict, list]:
+        """Send GET request"""
+        return await self._request("GET", path, params=params)
+
+    @asynccontextmanager
+    async def stream(
+        self, path: str, params: Optional[dict] = None
+    ) -> AsyncIterator[httpx.Response]:
+        """Open a streaming GET request (use with ``async with``; download endpoint class)"""
+        limit = self._limit("download")
+        async with limit.async_slot() if limit else nullcontext():
+            with self._circuit(path) as outcome:
+                async with self.session.stream(
+                    "GET", path, params=params, timeout=self._timeout("download")
+                ) as response:
+                    outcome.response = response
+                    yield response
+
+    async def post(self, path: str, json: Optional[dict] = None) -> dict:
+        """Send POST request"""
+        return await self._request("POST", path, json=json)
+
+    async def post_multipart(
+        self,
+        path: str,
+        data: Optional[dict] = None,
+        files: Optional[dict] = None,
+        content: Any = None,
+    ) -> dict:
+        """Send multipart POST request"""
+        return await self._request("POST", path, data=data, files=files, content=content)
+
+    async def delete(self, path: str, params: Optional[dict] = None) -> Union[dict, list]:
+        """Send DELETE request"""
+        return await self._request("DELETE", path, params=params)
+
+    async def put(self, path: str, json: Optional[dict] = None) -> dict:
+        """Send PUT request"""
+        return await self._request("PUT", path, json=json)
+
+    async def patch(self, path: str, json: Optional[dict] = None) -> dict:
+        """Send PATCH request"""
+        return await self._request("PATCH", path, json=json)
+
+    async def close(self):
+        """Close session"""
+        await self.session.aclose()
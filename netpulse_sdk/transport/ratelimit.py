@@ -0,0 +1,285 @@
+"""
+Client-side rate limiting and adaptive concurrency for API requests
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, Optional, Union
+
+# Endpoint classes requests are limited by (see endpoint_class())
+ENDPOINT_CLASSES = ("submit", "poll", "download")
+
+
+def endpoint_class(method: str) -> str:
+    """Endpoint class of a JSON API request: reads poll, everything else submits"""
+    return "poll" if method.upper() == "GET" else "submit"
+
+
+class RateLimit:
+    """Token bucket plus a cap on concurrent requests for one endpoint class
+
+    ``rate`` requests per second are admitted on average, with bursts of up to
+    ``burst`` requests; at most ``max_in_flight`` requests are outstanding at
+    once. Either part can be left unset. Waiting callers are delayed, never
+    rejected, so fan-out paths (bulk chunks, JobGroup.refresh(),
+    test_connections(), downloads) flatten into a steady stream the server
+    accepts instead of bursting into 429s.
+
+    Example::
+
+        NetPulseClient(rate_limits={
+            "submit": {"rate": 20, "max_in_flight": 4},
+            "poll": {"rate": 200, "burst": 50, "max_in_flight": 32},
+        })
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        """Initialize limit
+
+        Args:
+            rate: Sustained requests per second (None for no rate limit)
+            burst: Bucket size, i.e. requests allowed back to back (default max(1, rate))
+            max_in_flight: Maximum concurrent requests (None for no cap)
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be > 0")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.max_in_flight = max_in_flight
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        # asyncio.Semaphore binds to one event loop; keep one per loop
+        self._async_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long to wait before it is valid"""
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold an admission slot for the duration of a request"""
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        try:
+            delay = self._reserve()
+            if delay > 0:
+                time.sleep(delay)
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Asyncio variant of slot()"""
+        semaphore = None
+        if self.max_in_flight:
+            loop = asyncio.get_running_loop()
+            semaphore = self._async_semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._async_semaphores[loop] = asyncio.Semaphore(self.max_in_flight)
+            await semaphore.acquire()
+        try:
+            delay = self._reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def __repr__(self):
+        return (
+            f"RateLimit(rate={self.rate}, burst={self.burst}, "
+            f"max_in_flight={self.max_in_flight})"
+        )
+
+
+def build_limits(limits: Optional[Dict[str, Union[dict, RateLimit]]]) -> Dict[str, RateLimit]:
+    """Normalize a {endpoint_class: RateLimit or kwargs dict} mapping
+
+    Raises:
+        ValueError: If an endpoint class is unknown
+    """
+    built = {}
+    for name, limit in (limits or {}).items():
+        if name not in ENDPOINT_CLASSES:
+            choices = ", ".join(ENDPOINT_CLASSES)
+            raise ValueError(f"Unknown endpoint class: {name} (expected one of: {choices})")
+        built[name] = limit if isinstance(limit, RateLimit) else RateLimit(**limit)
+    return built
+
+
+class _Sample:
+    """Outcome of one request admitted by AdaptiveConcurrency"""
+
+    __slots__ = ("overloaded",)
+
+    def __init__(self):
+        self.overloaded = False
+
+
+class AdaptiveConcurrency:
+    """AIMD controller for the number of concurrent API requests
+
+    Every request holds a slot while it is in flight. The limit grows by about
+    one slot per round trip while latency stays within ``latency_tolerance`` of
+    the baseline (the lowest recently observed latency), holds when latency
+    rises, and is multiplied by ``backoff`` when a request times out, fails at
+    the transport level or gets a 5xx/429. Only requests sent after the last
+    decrease can trigger another one, so a burst of failures from one overload
+    counts once.
+
+    Fan-out helpers (JobGroup.refresh(), test_connections(), AsyncJobGroup)
+    size their worker pools to ``max_limit`` and let this controller decide
+    how many requests actually run.
+
+    Enabled with ``NetPulseClient(adaptive_concurrency=True)`` or a dict of the
+    constructor arguments.
+    """
+
+    def __init__(
+        self,
+        initial: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5,
+    ):
+        """Initialize controller
+
+        Args:
+            initial: Starting concurrency limit
+            min_limit: Lowest limit after backoff
+            max_limit: Highest limit (also the worker pool size of fan-out helpers)
+            latency_tolerance: Latency / baseline ratio still treated as "flat"
+            backoff: Multiplicative decrease factor on overload
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+
+        self.limit = float(initial)
+        self.in_flight = 0
+        self.baseline: Optional[float] = None
+        self._last_backoff = 0.0
+        self._cond = threading.Condition()
+        self._async_waiters: list = []
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _release(self, started: float, overloaded: bool) -> None:
+        """Record a finished request and adjust the limit"""
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            latency = now - started
+            if overloaded:
+                # Requests already in flight at the last decrease report the same
+                # overload and must not shrink the limit again.
+                if started >= self._last_backoff:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._last_backoff = now
+            else:
+                if self.baseline is None or latency < self.baseline:
+                    self.baseline = latency
+                else:
+                    # Let the baseline drift up slowly so it tracks lasting changes
+                    self.baseline += 0.01 * (latency - self.baseline)
+                if latency <= self.baseline * self.latency_tolerance:
+                    self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+            self._cond.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+
+        for loop, fut in waiters:
+            loop.call_soon_threadsafe(_wake, fut)
+
+    @contextmanager
+    def slot(self) -> Iterator[_Sample]:
+        """Hold a concurrency slot; set sample.overloaded for 5xx/429 responses"""
+        with self._cond:
+            while not self._has_capacity():
+                self._cond.wait()
+            self.in_flight += 1
+
+        sample = _Sample()
+        start = time.monotonic()
+        try:
+            yield sample
+        except Exception:
+            sample.overloaded = True
+            raise
+        finally:
+            self._release(start, sample.overloaded)
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[_Sample]:
+        """Asyncio variant of slot()"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._has_capacity():
+                    self.in_flight += 1
+                    break
+                fut = loop.create_future()
+                self._async_waiters.append((loop, fut))
+            await fut
+
+        sample = _Sample()
+        start = time.monotonic()
+        try:
+            yield sample
+        except Exception:
+            sample.overloaded = True
+            raise
+        finally:
+            self._release(start, sample.overloaded)
+
+    def __repr__(self):
+        return (
+            f"AdaptiveConcurrency(limit={int(self.limit)}, in_flight={self.in_flight}, "
+            f"max={self.max_limit})"
+        )
+
+
+def build_concurrency(
+    config: Union[None, bool, dict, AdaptiveConcurrency],
+) -> Optional[AdaptiveConcurrency]:
+    """Normalize the adaptive_concurrency option (False/None, True, kwargs dict or instance)"""
+    if isinstance(config, AdaptiveConcurrency):
+        return config
+    if isinstance(config, dict):
+        return AdaptiveConcurrency(**config)
+    return AdaptiveConcurrency() if config else None
+
+
+def _wake(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
@@ -0,0 +1,137 @@
+"""
+Retry policy for API requests: jittered exponential backoff, Retry-After and idempotency
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional, Union
+
+import httpx
+
+# Methods retried after any retryable failure
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+class RetryPolicy:
+    """When and how long to wait before resending a failed API request
+
+    Transport errors and ``statuses`` responses are retried up to
+    ``max_attempts`` attempts in total. The wait before retry n (0-based) is
+    drawn uniformly from [0, min(max_backoff, backoff * 2**n)] ("full jitter"),
+    so clients recovering from the same outage spread out instead of retrying
+    in lockstep. A ``Retry-After`` header on 429/503 responses is honoured
+    instead; if it asks for more than ``max_retry_after`` seconds the error is
+    raised right away.
+
+    GET/HEAD/OPTIONS/PUT/DELETE are always retried. POST/PATCH are only
+    retried if nothing reached the server (connection failures), or when they
+    carry an ``Idempotency-Key`` header: with ``idempotency_keys=True`` one is
+    generated per request and reused across its retries, so a server that
+    deduplicates on the key never executes a submission twice.
+
+    Enabled with ``NetPulseClient(retry=True)`` or a dict of the constructor
+    arguments.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        statuses: Iterable[int] = (429, 502, 503, 504),
+        max_retry_after: float = 120.0,
+        idempotency_keys: bool = False,
+    ):
+        """Initialize policy
+
+        Args:
+            max_attempts: Attempts per request, including the first one
+            backoff: Backoff cap of the first retry in seconds (doubles per retry)
+            max_backoff: Upper bound of the backoff cap
+            statuses: Response status codes that are retried
+            max_retry_after: Longest Retry-After wait honoured (seconds)
+            idempotency_keys: Send an Idempotency-Key with POST/PATCH requests so
+                they can be retried like idempotent ones
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.max_retry_after = max_retry_after
+        self.idempotency_keys = idempotency_keys
+
+    def backoff_delay(self, retry: int) -> float:
+        """Jittered wait before retry number retry (0-based)"""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**retry))
+
+    @staticmethod
+    def retry_after(response: httpx.Response) -> Optional[float]:
+        """Seconds requested by a Retry-After header (delta-seconds or HTTP date)"""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def delay(
+        self,
+        retry: int,
+        method: str,
+        headers: Optional[dict] = None,
+        error: Optional[Exception] = None,
+        response: Optional[httpx.Response] = None,
+    ) -> Optional[float]:
+        """Wait before retrying a failed attempt, or None if it must not be retried
+
+        Args:
+            retry: Retries already made for this request
+            method: HTTP method
+            headers: Request headers passed to the client
+            error: Transport error of the attempt
+            response: Response of the attempt
+        """
+        if retry + 1 >= self.max_attempts:
+            return None
+        if response is not None and response.status_code not in self.statuses:
+            return None
+        if not self._may_resend(method, headers, error):
+            return None
+
+        if response is not None and response.status_code in (429, 503):
+            requested = self.retry_after(response)
+            if requested is not None:
+                return requested if requested <= self.max_retry_after else None
+        return self.backoff_delay(retry)
+
+    @staticmethod
+    def _may_resend(method: str, headers: Optional[dict], error: Optional[Exception]) -> bool:
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+        if headers and IDEMPOTENCY_HEADER in headers:
+            return True
+        return isinstance(error, httpx.ConnectError)
+
+    def __repr__(self):
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, backoff={self.backoff}, "
+            f"idempotency_keys={self.idempotency_keys})"
+        )
+
+
+def build_retry(config: Union[None, bool, dict, RetryPolicy]) -> Optional[RetryPolicy]:
+    """Normalize the retry option (False/None, True, kwargs dict or instance)"""
+    if isinstance(config, RetryPolicy):
+        return config
+    if isinstance(config, dict):
+        return RetryPolicy(**config)
+    return RetryPolicy() if config else None
@@ -0,0 +1,61 @@
+"""
+Request timeouts and per-operation timeout profiles
+"""
+
+from typing import Dict, Optional, Union
+
+import httpx
+
+from .ratelimit import endpoint_class
+
+# Operations a timeout profile can be set for (see operation())
+TIMEOUT_PROFILES = ("submit", "poll", "download", "template")
+
+TimeoutSpec = Union[float, dict, httpx.Timeout]
+
+# Seconds, for every phase left unset
+DEFAULT_TIMEOUT = 30.0
+
+
+def operation(method: str, path: str) -> str:
+    """Timeout profile of a JSON API request: template calls, else its endpoint class"""
+    if path.startswith("/template/"):
+        return "template"
+    return endpoint_class(method)
+
+
+def build_timeout(value: TimeoutSpec, base: Optional[httpx.Timeout] = None) -> httpx.Timeout:
+    """Normalize a timeout given as seconds, an httpx.Timeout or a dict
+
+    A dict holds httpx.Timeout fields (connect, read, write, pool); fields it
+    leaves out are taken from base (default: DEFAULT_TIMEOUT for every phase).
+
+    Raises:
+        ValueError: If a dict has fields other than connect, read, write, pool
+    """
+    if isinstance(value, httpx.Timeout):
+        return value
+    if isinstance(value, dict):
+        unknown = set(value) - {"connect", "read", "write", "pool"}
+        if unknown:
+            raise ValueError(f"Unknown timeout field(s): {', '.join(sorted(unknown))}")
+        base = base or httpx.Timeout(DEFAULT_TIMEOUT)
+        return httpx.Timeout(**{**base.as_dict(), **value})
+    return httpx.Timeout(value)
+
+
+def build_timeouts(
+    profiles: Optional[Dict[str, TimeoutSpec]], base: httpx.Timeout
+) -> Dict[str, httpx.Timeout]:
+    """Normalize a {operation: timeout} mapping (see build_timeout)
+
+    Raises:
+        ValueError: If an operation is unknown
+    """
+    built = {}
+    for name, value in (profiles or {}).items():
+        if name not in TIMEOUT_PROFILES:
+            choices = ", ".join(TIMEOUT_PROFILES)
+            raise ValueError(f"Unknown timeout profile: {name} (expected one of: {choices})")
+        built[name] = build_timeout(value, base)
+    return built
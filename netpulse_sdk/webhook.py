@@ -0,0 +1,248 @@
+"""
+Embedded webhook receiver for push-based job completion
+"""
+
+import asyncio
+import json
+import logging
+import secrets
+import socket
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from .result import WebhookEvent
+
+log = logging.getLogger(__name__)
+
+TOKEN_HEADER = "X-NetPulse-Webhook-Token"
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Accept NetPulse webhook POSTs and hand final events to the receiver"""
+
+    server: "_WebhookServer"
+
+    def do_POST(self):
+        receiver = self.server.receiver
+        if self.path.split("?", 1)[0] != receiver.path:
+            self._reply(404)
+            return
+        token = self.headers.get(TOKEN_HEADER) or ""
+        if not secrets.compare_digest(token.encode(), receiver.token.encode()):
+            self._reply(403)
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            event = WebhookEvent.model_validate(json.loads(self.rfile.read(length)))
+        except (ValueError, ValidationError) as e:
+            log.debug(f"Rejected malformed webhook payload: {e}")
+            self._reply(400)
+            return
+
+        receiver.deliver(event)
+        self._reply(204)
+
+    do_PUT = do_POST
+
+    def _reply(self, status: int) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        log.debug("webhook receiver: " + format % args)
+
+
+class _WebhookServer(ThreadingHTTPServer):
+    daemon_threads = True
+    receiver: "WebhookReceiver"
+
+
+class WebhookReceiver:
+    """Local HTTP endpoint that collects NetPulse job completion webhooks
+
+    Attach it to a client with ``NetPulseClient(webhook_receiver=...)`` or
+    ``client.enable_webhook_receiver()``. run()/collect() then register the
+    receiver as the job webhook, and Job/JobGroup wait() and stream() complete
+    on the push event, polling only every ``fallback_interval`` seconds in case
+    a delivery is lost.
+
+    Only final events are kept (detached-task log pushes are ignored). Requests
+    must carry the per-receiver token header, which is included in
+    webhook_config() automatically.
+
+    Example::
+
+        receiver = WebhookReceiver(port=8099, public_url="http://orchestrator:8099")
+        np = NetPulseClient(webhook_receiver=receiver.start())
+        np.collect(devices, "show version").wait()  # completes on push
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 0,
+        public_url: Optional[str] = None,
+        path: str = "/netpulse/webhook",
+        fallback_interval: float = 15.0,
+        max_events: int = 100000,
+    ):
+        """Initialize receiver (call start() to begin listening)
+
+        Args:
+            host: Bind address
+            port: Bind port (0 picks a free port)
+            public_url: Base URL the NetPulse server can reach this host on
+                (defaults to http://<hostname>:<port>)
+            path: URL path webhooks are posted to
+            fallback_interval: Seconds between safety polls while waiting for a push
+            max_events: Maximum unconsumed events kept (oldest are dropped)
+        """
+        self.host = host
+        self.port = port
+        self.public_url = public_url.rstrip("/") if public_url else None
+        self.path = path
+        self.fallback_interval = fallback_interval
+        self.max_events = max_events
+        self.token = secrets.token_urlsafe(24)
+
+        self._events: "OrderedDict[str, WebhookEvent]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._async_waiters: List[Tuple[set, asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._server: Optional[_WebhookServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Webhook URL registered with NetPulse jobs"""
+        if self.public_url:
+            return f"{self.public_url}{self.path}"
+        host = self.host if self.host not in ("0.0.0.0", "::", "") else socket.gethostname()
+        return f"http://{host}:{self.port}{self.path}"
+
+    @property
+    def running(self) -> bool:
+        """Whether the HTTP server is listening"""
+        return self._server is not None
+
+    def start(self) -> "WebhookReceiver":
+        """Start listening in a background thread. Returns self for chaining."""
+        if self._server is not None:
+            return self
+        server = _WebhookServer((self.host, self.port), _WebhookHandler)
+        server.receiver = self
+        self.port = server.server_address[1]
+        self._server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever, name="netpulse-webhook", daemon=True
+        )
+        self._thread.start()
+        log.debug(f"Webhook receiver listening on {self.host}:{self.port}{self.path}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the HTTP server"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
+
+    def webhook_config(self) -> dict:
+        """WebhookConfig pointing NetPulse at this receiver"""
+        return {
+            "name": "basic",
+            "url": self.url,
+            "method": "POST",
+            "headers": {TOKEN_HEADER: self.token},
+        }
+
+    def deliver(self, event: WebhookEvent) -> None:
+        """Record a webhook event and wake up waiters (called by the HTTP handler)"""
+        if not event.final:
+            return
+
+        with self._cond:
+            self._events[event.id] = event
+            self._events.move_to_end(event.id)
+            while len(self._events) > self.max_events:
+                self._events.popitem(last=False)
+            self._cond.notify_all()
+            waiters = [(loop, fut) for ids, loop, fut in self._async_waiters if event.id in ids]
+
+        for loop, fut in waiters:
+            loop.call_soon_threadsafe(_wake, fut)
+
+    def _take(self, ids: set) -> Dict[str, WebhookEvent]:
+        """Pop available events for ids (caller holds the lock)"""
+        if len(self._events) < len(ids):
+            hits = [job_id for job_id in self._events if job_id in ids]
+        else:
+            hits = [job_id for job_id in ids if job_id in self._events]
+        return {job_id: self._events.pop(job_id) for job_id in hits}
+
+    def wait_any(self, job_ids: Iterable[str], timeout: float) -> Dict[str, WebhookEvent]:
+        """Block until a final event arrives for any of job_ids, or timeout
+
+        Returns:
+            {job_id: WebhookEvent} for every matching event received (empty on timeout)
+        """
+        ids = set(job_ids)
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                hits = self._take(ids)
+                if hits:
+                    return hits
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return {}
+                self._cond.wait(remaining)
+
+    async def wait_any_async(
+        self, job_ids: Iterable[str], timeout: float
+    ) -> Dict[str, WebhookEvent]:
+        """Asyncio variant of wait_any() that does not occupy a thread"""
+        ids = set(job_ids)
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        waiter = (ids, loop, fut)
+
+        with self._cond:
+            hits = self._take(ids)
+            if hits:
+                return hits
+            self._async_waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._cond:
+                self._async_waiters.remove(waiter)
+
+        with self._cond:
+            return self._take(ids)
+
+    def __enter__(self) -> "WebhookReceiver":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def __repr__(self):
+        state = "listening" if self.running else "stopped"
+        return f"WebhookReceiver({self.url} [{state}])"
+
+
+def _wake(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
@@ -0,0 +1,78 @@
+"""
+Benchmark HTTP/1.1 against HTTP/2 for concurrent status polls
+
+Fires --requests GETs with --concurrency in flight against a NetPulse server,
+once per protocol, and reports TCP connects, TLS handshakes and latency
+percentiles. HTTP/2 is only negotiated over HTTPS.
+
+Usage: python scripts/bench_http2.py --url https://netpulse:9000 --api-key KEY
+           [--path /jobs] [--requests 5000] [--concurrency 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+from netpulse_sdk.transport.http import AsyncHTTPClient
+
+
+async def run(args, http2: bool):
+    client = AsyncHTTPClient(
+        base_url=args.url,
+        api_key=args.api_key,
+        pool_maxsize=args.concurrency,
+        http2=http2,
+    )
+    events = Counter()
+    versions = Counter()
+
+    async def trace(name, info):
+        if name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            events[name] += 1
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.session.get(args.path, extensions={"trace": trace})
+            latencies.append(time.perf_counter() - start)
+            versions[response.http_version] += 1
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(one() for _ in range(args.requests)))
+    finally:
+        await client.close()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    label = "HTTP/2" if http2 else "HTTP/1.1"
+    print(
+        f"{label:>8}: {', '.join(versions)} | "
+        f"tcp {events['connection.connect_tcp.complete']:5d}  "
+        f"tls {events['connection.start_tls.complete']:5d} | "
+        f"p50 {statistics.median(latencies) * 1000:7.1f} ms  p99 {p99 * 1000:7.1f} ms | "
+        f"{args.requests / elapsed:8.0f} req/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--api-key", required=True)
+    parser.add_argument("--path", default="/jobs")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    for http2 in (False, True):
+        asyncio.run(run(args, http2))
+
+
+if __name__ == "__main__":
+    main()
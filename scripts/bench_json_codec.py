@@ -0,0 +1,80 @@
+"""
+Benchmark the JSON codecs used by the HTTP transport
+
+Encodes a bulk submission payload and decodes a GET /jobs response with large
+stdout bodies using every installed codec.
+
+Usage: python scripts/bench_json_codec.py [--devices 20000] [--jobs 2000] [--stdout-kb 64]
+"""
+
+import argparse
+import time
+
+from netpulse_sdk.codec import get_codec
+
+
+def build_payloads(devices: int, jobs: int, stdout_kb: int):
+    bulk = {
+        "driver": "netmiko",
+        "connection_args": {"device_type": "cisco_ios", "username": "admin", "password": "x"},
+        "devices": [
+            {"host": f"10.{i // 65536}.{i // 256 % 256}.{i % 256}"} for i in range(devices)
+        ],
+        "command": ["show version", "show running-config"],
+        "ttl": 300,
+    }
+    stdout = ("interface GigabitEthernet0/1\n description uplink\n" * 1024)[: stdout_kb * 1024]
+    listing = [
+        {
+            "id": f"job-{i}",
+            "status": "finished",
+            "duration": 1.5,
+            "result": {
+                "type": 1,
+                "retval": [{"command": "show running-config", "stdout": stdout, "exit_status": 0}],
+            },
+        }
+        for i in range(jobs)
+    ]
+    return bulk, listing
+
+
+def bench(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=20000)
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--stdout-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    bulk, listing = build_payloads(args.devices, args.jobs, args.stdout_kb)
+    listing_body = get_codec("json").encode(listing)
+    print(f"bulk payload: {args.devices} devices, /jobs body: {len(listing_body) / 2**20:.1f} MiB")
+
+    baseline = None
+    for name in ("json", "msgspec", "orjson"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:>8}: not installed")
+            continue
+        encode = bench(lambda: codec.encode(bulk))
+        decode = bench(lambda: codec.decode(listing_body))
+        total = encode + decode
+        baseline = baseline or total
+        print(
+            f"{name:>8}: encode {encode * 1000:8.1f} ms  decode {decode * 1000:8.1f} ms"
+            f"  ({baseline / total:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
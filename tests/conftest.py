@@ -1,6 +1,6 @@
 import pytest
-from unittest.mock import Mock
-from netpulse_sdk import NetPulseClient
+from unittest.mock import AsyncMock, Mock
+from netpulse_sdk import AsyncNetPulseClient, NetPulseClient
 
 @pytest.fixture
 def mock_client():
@@ -23,6 +23,25 @@ def mock_client():
     client._http.session = Mock()
     return client
 
+@pytest.fixture
+def mock_async_client():
+    """Provides an AsyncNetPulseClient with its async transport methods mocked"""
+    client = AsyncNetPulseClient(
+        base_url="http://api.test",
+        api_key="test-key",
+        default_connection_args={
+            "device_type": "cisco_ios",
+            "username": "admin",
+            "password": "password"
+        }
+    )
+    client._http.get = AsyncMock()
+    client._http.post = AsyncMock()
+    client._http.delete = AsyncMock()
+    client._http.put = AsyncMock()
+    client._http.patch = AsyncMock()
+    return client
+
 @pytest.fixture
 def sample_job_data():
     """Returns a sample JobInResponse dictionary matching 0.4.0 API"""
@@ -0,0 +1,150 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from netpulse_sdk import AsyncJob, AsyncJobGroup
+from netpulse_sdk.result import ConnectionTestResult
+
+
+class TestAsyncClient:
+    def test_run_exec_mode(self, mock_async_client, sample_job_data):
+        mock_async_client._http.post.return_value = sample_job_data
+
+        job = asyncio.run(mock_async_client.run(devices="10.0.0.1", command="show version"))
+
+        assert isinstance(job, AsyncJob)
+        assert job.id == "job-123"
+        call_args = mock_async_client._http.post.call_args
+        assert call_args[0][0] == "/device/exec"
+        assert call_args[1]["json"]["command"] == ["show version"]
+        assert call_args[1]["json"]["connection_args"]["host"] == "10.0.0.1"
+
+    def test_run_bulk_mode(self, mock_async_client):
+        mock_async_client._http.post.return_value = {
+            "succeeded": [
+                {"id": "j1", "status": "queued", "connection_args": {"host": "d1"}},
+                {"id": "j2", "status": "queued", "connection_args": {"host": "d2"}},
+            ],
+            "failed": [],
+        }
+
+        group = asyncio.run(mock_async_client.run(devices=["d1", "d2"], command="show clock"))
+
+        assert isinstance(group, AsyncJobGroup)
+        assert group.devices == ["d1", "d2"]
+        assert mock_async_client._http.post.call_args[0][0] == "/device/bulk"
+
+    def test_collect_rejects_save(self, mock_async_client):
+        with pytest.raises(ValueError, match="read-only"):
+            asyncio.run(mock_async_client.collect("10.0.0.1", command="show ver", save=True))
+
+    def test_rejects_poll_scheduler(self):
+        from netpulse_sdk import AsyncNetPulseClient
+
+        with pytest.raises(ValueError, match="poll_scheduler"):
+            AsyncNetPulseClient(base_url="http://api.test", api_key="k", poll_scheduler=True)
+
+    def test_get_job_and_list_jobs(self, mock_async_client, sample_job_data):
+        mock_async_client._http.get.return_value = sample_job_data
+        job = asyncio.run(mock_async_client.get_job("job-123"))
+        assert isinstance(job, AsyncJob)
+        assert job.device_name == "router-01"
+
+        mock_async_client._http.get.return_value = [sample_job_data]
+        jobs = asyncio.run(mock_async_client.list_jobs(status="finished"))
+        assert len(jobs) == 1
+        assert mock_async_client._http.get.call_args[1]["params"] == {"status": "finished"}
+
+    def test_test_connections_keeps_order(self, mock_async_client):
+        async def fake_test(device, **kwargs):
+            if device == "broken":
+                raise RuntimeError("Driver crash")
+            return ConnectionTestResult(ok=True, host=device, driver="test")
+
+        with patch.object(mock_async_client, "test_connection", side_effect=fake_test):
+            results = asyncio.run(mock_async_client.test_connections(["a", "broken", "c"]))
+
+        assert [r.host for r in results] == ["a", "broken", "c"]
+        assert results[1].ok is False
+        assert "Driver crash" in results[1].error
+
+    def test_tail_detached_task(self, mock_async_client):
+        mock_async_client._http.get.side_effect = [
+            {"task_id": "t1", "output": "A", "is_running": True, "next_offset": 1},
+            {"task_id": "t1", "output": "B", "is_running": False, "next_offset": 2},
+        ]
+        chunks = []
+        with patch("asyncio.sleep"):
+            full = asyncio.run(mock_async_client.tail_detached_task("t1", callback=chunks.append))
+        assert full == "AB"
+        assert chunks == ["A", "B"]
+
+    def test_bulk_chunks_merge_into_one_group(self, mock_async_client):
+        async def fake_post(path, json):
+            return {
+                "succeeded": [
+                    {"id": f"j-{d['host']}", "status": "queued", "connection_args": d}
+                    for d in json["devices"]
+                ],
+                "failed": [],
+            }
+
+        mock_async_client._http.post.side_effect = fake_post
+        mock_async_client.bulk_chunk_size = 2
+
+        group = asyncio.run(mock_async_client.run(devices=["a", "b", "c"], command="show clock"))
+
+        assert mock_async_client._http.post.call_count == 2
+        assert group.devices == ["a", "b", "c"]
+
+
+class TestAsyncJob:
+    def test_wait_polls_until_done(self, mock_async_client, sample_job_data):
+        started = {**sample_job_data, "status": "started", "result": None}
+        mock_async_client._http.get.side_effect = [started, sample_job_data]
+        job = AsyncJob(mock_async_client, started, "d1", ["show version"])
+
+        async def scenario():
+            with patch("asyncio.sleep"):
+                await job
+            return await job.first()
+
+        first = asyncio.run(scenario())
+        assert first.stdout.startswith("Cisco")
+        assert mock_async_client._http.get.call_count == 2
+
+    def test_accessors_require_done(self, mock_async_client, sample_job_data):
+        started = {**sample_job_data, "status": "started", "result": None}
+        job = AsyncJob(mock_async_client, started, "d1", ["show version"])
+        with pytest.raises(RuntimeError, match="await job.wait"):
+            job.stdout
+
+    def test_group_stream(self, mock_async_client, sample_job_data):
+        started = {**sample_job_data, "status": "started", "result": None}
+        job1 = AsyncJob(mock_async_client, dict(started, id="j1"), "d1", ["show version"])
+        job2 = AsyncJob(mock_async_client, dict(sample_job_data, id="j2"), "d2", ["show version"])
+        mock_async_client._http.get.side_effect = lambda path, **kw: (
+            dict(sample_job_data, id=path.rsplit("/", 1)[-1])
+        )
+        group = AsyncJobGroup(jobs=[job1, job2])
+
+        async def scenario():
+            with patch("asyncio.sleep"):
+                return [r async for r in group]
+
+        results = asyncio.run(scenario())
+        assert sorted(r.job_id for r in results) == ["j1", "j2"]
+        assert group.all_ok is True
+
+    def test_group_batched_refresh(self, mock_async_client, sample_job_data):
+        started = {**sample_job_data, "status": "started", "result": None}
+        jobs = [AsyncJob(mock_async_client, dict(started, id=f"j{i}"), "d", ["c"]) for i in range(2)]
+        mock_async_client._http.get.side_effect = lambda path, params=None: [
+            dict(sample_job_data, id=i) for i in params["id"]
+        ]
+        group = AsyncJobGroup(jobs=jobs, batch_refresh=True)
+
+        asyncio.run(group.refresh())
+
+        assert mock_async_client._http.get.call_count == 1
+        assert group.is_done() is True
+
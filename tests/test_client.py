@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
-from netpulse_sdk import NetPulseClient, Job
-from netpulse_sdk.error import NetPulseError
+from netpulse_sdk import NetPulseClient, Job, RetryPolicy
+from netpulse_sdk.error import NetPulseError, NetworkError
 from netpulse_sdk.result import ConnectionTestResult, WorkerInfo, DetachedTaskInfo, DetachedTaskLog
 
 class TestNetPulseClient:
@@ -10,6 +10,19 @@ class TestNetPulseClient:
         assert client._http.base_url == "http://test"
         assert client._http.session.headers["X-API-KEY"] == "abc"
 
+    def test_http2_option(self):
+        client = NetPulseClient(base_url="http://api", api_key="key")
+        assert client._http.http2 is False
+
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match=r"netpulse-sdk\[http2\]"):
+                NetPulseClient(base_url="https://api", api_key="key", http2=True)
+        else:
+            client = NetPulseClient(base_url="https://api", api_key="key", http2=True)
+            assert client._http.http2 is True
+
     def test_test_connection_success(self, mock_client):
         # Mock connection test response
         mock_client._http.post.return_value = {
@@ -89,6 +102,67 @@ class TestNetPulseClient:
         call_args = mock_client._http.post.call_args[1]
         assert call_args["json"]["audit_mode"] == "none"
 
+    def test_run_bulk_mode_chunks_large_device_lists(self, mock_client):
+        def fake_post(path, json):
+            hosts = [d["host"] for d in json["devices"]]
+            if "d3" in hosts:
+                raise NetworkError("connection reset")
+            return {
+                "succeeded": [
+                    {"id": f"j-{h}", "status": "queued", "connection_args": {"host": h}}
+                    for h in hosts
+                ],
+                "failed": [],
+            }
+
+        mock_client._http.post.side_effect = fake_post
+        mock_client.bulk_chunk_size = 2
+
+        group = mock_client.run(devices=["d0", "d1", "d2", "d3", "d4"], command="show clock")
+
+        assert mock_client._http.post.call_count == 3
+        assert group.devices == ["d0", "d1", "d4"]
+        failures = group.submission_failures()
+        assert [f["host"] for f in failures] == ["d2", "d3"]
+        # The server may have accepted the chunk before the connection dropped
+        assert all(f["indeterminate"] for f in failures)
+        assert failures[0]["reason"] == "unknown: connection reset"
+
+    def test_bulk_failures_are_retried_per_device_with_backoff(self, mock_client):
+        flaky = {"d1": 2}
+
+        def fake_post(path, json):
+            succeeded, failed = [], []
+            for device in json["devices"]:
+                host = device["host"]
+                if flaky.get(host):
+                    flaky[host] -= 1
+                    failed.append({"host": host, "reason": "worker busy"})
+                else:
+                    succeeded.append(
+                        {"id": f"j-{host}", "status": "queued", "connection_args": {"host": host}}
+                    )
+            return {"succeeded": succeeded, "failed": failed}
+
+        mock_client._http.post.side_effect = fake_post
+        mock_client._http.retry = RetryPolicy(max_attempts=3, backoff=0.01)
+
+        group = mock_client.run(devices=["d0", "d1"], command="show clock")
+
+        assert mock_client._http.post.call_count == 3
+        assert [d["host"] for d in mock_client._http.post.call_args[1]["json"]["devices"]] == [
+            "d1"
+        ]
+        assert group.devices == ["d0", "d1"]
+        assert group.retried_devices == ["d1"]
+
+    def test_run_bulk_mode_all_chunks_failing_raises(self, mock_client):
+        mock_client._http.post.side_effect = NetworkError("connection reset")
+        mock_client.bulk_chunk_size = 1
+
+        with pytest.raises(NetworkError):
+            mock_client.run(devices=["d0", "d1"], command="show clock")
+
     def test_get_job(self, mock_client, sample_job_data):
         mock_client._http.get.return_value = sample_job_data
         job = mock_client.get_job("job-123")
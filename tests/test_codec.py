@@ -0,0 +1,45 @@
+import json
+import httpx
+import pytest
+from netpulse_sdk.codec import get_codec
+from netpulse_sdk.transport import HTTPClient
+
+
+class TestJSONCodec:
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+    def test_roundtrip(self, name):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            pytest.skip(f"{name} not installed")
+
+        payload = {"devices": [{"host": "10.0.0.1"}], "command": ["show 版本"], "ttl": 300}
+        assert codec.decode(codec.encode(payload)) == payload
+        assert codec.decode(codec.encode_pretty(payload)) == payload
+        # to_json() output is the same whichever codec is installed
+        assert codec.encode_pretty(payload) == json.dumps(payload, indent=2)
+        with pytest.raises(ValueError):
+            codec.decode(b"{not json")
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_codec("yaml")
+
+    def test_http_client_uses_codec(self):
+        seen = {}
+
+        def handler(request):
+            seen["content_type"] = request.headers["Content-Type"]
+            seen["body"] = request.content
+            return httpx.Response(200, content=b'{"succeeded": [], "failed": []}')
+
+        client = HTTPClient(base_url="http://api.test", api_key="k", json_codec="json")
+        client.session = httpx.Client(
+            base_url="http://api.test", transport=httpx.MockTransport(handler)
+        )
+
+        resp = client.post("/device/bulk", json={"devices": [{"host": "d1"}]})
+
+        assert resp == {"succeeded": [], "failed": []}
+        assert seen["content_type"] == "application/json"
+        assert seen["body"] == b'{"devices":[{"host":"d1"}]}'
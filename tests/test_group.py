@@ -1,3 +1,5 @@
+from unittest.mock import patch
+import pytest
 from netpulse_sdk.job import Job, JobGroup
 
 class TestJobGroup:
@@ -43,3 +45,225 @@ class TestJobGroup:
         assert len(group.succeeded()) == 2
         assert len(group.truly_succeeded()) == 1
         assert len(group.device_errors()) == 1
+
+    def test_all_ok_over_combined_results(self, mock_client, sample_job_data):
+        # A failed job without a result payload contributes no results (baseline verdict)
+        no_payload = {"id": "j2", "status": "failed", "result": None}
+        group = JobGroup(jobs=[
+            Job(mock_client, sample_job_data, "d1", ["show version"]),
+            Job(mock_client, no_payload, "d2", ["show version"]),
+        ])
+
+        assert group.all_ok is True
+        assert group.raise_on_error() is group
+
+        failed = dict(no_payload, id="j3")
+        assert JobGroup(jobs=[Job(mock_client, failed, "d3", ["x"])]).all_ok is False
+
+    def test_refresh_only_polls_pending_jobs(self, mock_client, sample_job_data):
+        started = {**sample_job_data, "status": "started", "result": None}
+        done = Job(mock_client, dict(sample_job_data, id="j1"), "d1", ["c1"])
+        running = Job(mock_client, dict(started, id="j2"), "d2", ["c1"])
+        mock_client._http.get.return_value = dict(sample_job_data, id="j2")
+
+        group = JobGroup(jobs=[done, running])
+        group.refresh()
+
+        mock_client._http.get.assert_called_once_with("/jobs/j2")
+        assert group.polls_issued == 1
+        assert group.polls_saved == 1
+        assert group.pending == []
+
+        # Terminal group: nothing left to poll
+        group.refresh()
+        assert mock_client._http.get.call_count == 1
+        assert group.polls_saved == 3
+
+    def test_batched_refresh_uses_list_query(self, mock_client, sample_job_data):
+        started = {**sample_job_data, "status": "started", "result": None}
+        jobs = [Job(mock_client, dict(started, id=f"j{i}"), f"d{i}", ["c1"]) for i in range(3)]
+
+        def fake_get(path, params=None):
+            if path == "/jobs":
+                # j2 is missing from the listing and must fall back to GET /jobs/j2
+                return [dict(sample_job_data, id=i) for i in params["id"] if i != "j2"]
+            return dict(sample_job_data, id=path.rsplit("/", 1)[-1])
+
+        mock_client._http.get.side_effect = fake_get
+        group = JobGroup(jobs=jobs, batch_refresh=True)
+        group.refresh()
+
+        paths = [c.args[0] for c in mock_client._http.get.call_args_list]
+        assert paths == ["/jobs", "/jobs/j2"]
+        assert group.is_done() is True
+        assert [r.job_id for r in group.results()] == ["j0", "j1", "j2"]
+
+    def test_indexed_lookups(self, mock_client):
+        def job(job_id, host, outputs):
+            retval = [
+                {"command": cmd, "stdout": out, "exit_status": 0, "metadata": {"host": host}}
+                for cmd, out in outputs
+            ]
+            data = {"id": job_id, "status": "finished", "result": {"type": 1, "retval": retval}}
+            return Job(mock_client, data, host, [cmd for cmd, _ in outputs])
+
+        group = JobGroup(jobs=[
+            job("1", "d1", [("show ver", "v1"), ("show clock", "")]),
+            job("2", "d2", [("show ver", "v2")]),
+        ])
+
+        assert [r.command for r in group["d1"]] == ["show ver", "show clock"]
+        assert group["missing"] == []
+        assert group.get_result("d2", "show ver").stdout == "v2"
+        assert [r.device_name for r in group.by_command("show ver")] == ["d1", "d2"]
+        assert group.stdout == {"d1": "v1", "d2": "v2"}
+
+        # Accessors return fresh containers; mutating one does not affect the group
+        group.to_dict()["d1"].clear()
+        group.stdout_dict["d1"]["show ver"] = "changed"
+        assert group.stdout is not group.stdout
+        assert [r.command for r in group["d1"]] == ["show ver", "show clock"]
+        assert group.stdout_dict["d1"]["show ver"] == "v1"
+
+        # A new results list (e.g. after refresh) rebuilds the index
+        group._results_cache = None
+        assert group.stdout == {"d1": "v1", "d2": "v2"}
+        assert group._index_cache.results is group.results()
+
+    def test_identical_outputs_are_shared(self, mock_client):
+        config = "".join(f"interface Gi0/{i}\n shutdown\n" for i in range(50))
+
+        def job(host, stdout):
+            retval = [{"command": "show run", "stdout": stdout, "metadata": {"host": host}}]
+            data = {"id": host, "status": "finished", "result": {"type": 1, "retval": retval}}
+            return Job(mock_client, data, host, ["show run"])
+
+        # Separate copies, as decoded from separate JSON responses
+        group = JobGroup(jobs=[
+            job("d1", "".join(config)), job("d2", "".join(config)), job("d3", "drift")
+        ])
+        results = group.results()
+
+        assert results[0].stdout is results[1].stdout
+        # The server payload is not rewritten
+        item = group.jobs[1]._data["result"]["retval"][0]
+        assert item["stdout"] is not results[0].stdout
+        assert "stderr" not in item
+        assert group.group_by_output("show run") == {config: ["d1", "d2"], "drift": ["d3"]}
+        stats = group.dedup_stats()
+        assert stats["results"] == 3
+        assert stats["unique_outputs"] == 2
+        assert stats["saved_bytes"] > len(config)
+
+        # Releasing one holder keeps the output pooled for the other
+        pool = group._outputs
+        group.jobs[0]._release()
+        assert len(pool) == 3  # config, "drift" and the empty stderr
+        held = set()
+        assert pool.intern(held, "".join(config)) is results[1].stdout
+        pool.release(held)
+        group.jobs[1]._release()
+        group.jobs[2]._release()
+        assert len(pool) == 0
+
+    def test_stream_yields_each_job_once_when_done(self, mock_client, sample_job_data):
+        started = {**sample_job_data, "status": "started", "result": None}
+        done = Job(mock_client, dict(sample_job_data, id="j1"), "d1", ["show version"])
+        slow = Job(mock_client, dict(started, id="j2"), "d2", ["show version"])
+        mock_client._http.get.side_effect = [dict(started, id="j2"), dict(sample_job_data, id="j2")]
+        group = JobGroup(jobs=[done, slow])
+
+        with patch("time.sleep"):
+            stream = group.stream()
+            assert next(stream).job_id == "j1"
+            assert mock_client._http.get.call_count == 0
+            assert [r.job_id for r in stream] == ["j2"]
+
+        assert mock_client._http.get.call_count == 2
+
+    def test_to_columns(self, mock_client, sample_job_data):
+        failed = {
+            "id": "j2", "status": "failed", "duration": 0.5,
+            "result": {"type": 2, "retval": None, "error": {"type": "auth", "message": "denied"}},
+        }
+        group = JobGroup(jobs=[
+            Job(mock_client, sample_job_data, "d1", ["show version"]),
+            Job(mock_client, failed, "d2", ["show clock"]),
+        ])
+
+        columns = group.to_columns()
+
+        assert list(columns) == [
+            "job_id", "device_name", "command", "ok", "exit_status", "duration_ms", "stdout", "stderr"
+        ]
+        assert columns["device_name"] == ["10.0.0.1", "d2"]
+        assert columns["ok"] == [True, False]
+        assert columns["duration_ms"][1] == 500
+        assert columns["stderr"][1] == "denied"
+        assert columns["stdout"] == [r.stdout for r in group.results()]
+
+    def test_to_arrow(self, mock_client, sample_job_data):
+        group = JobGroup(jobs=[Job(mock_client, sample_job_data, "d1", ["show version"])])
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match="pyarrow"):
+                group.to_arrow()
+            return
+
+        table = group.to_arrow()
+        assert table.num_rows == 1
+        assert table.column("command").to_pylist() == ["show version"]
+
+    def test_write_ndjson_streams_and_releases(self, mock_client, sample_job_data):
+        import io
+        import json
+
+        started = {**sample_job_data, "status": "started", "result": None}
+        jobs = [
+            Job(mock_client, dict(sample_job_data, id="j1"), "d1", ["show version"]),
+            Job(mock_client, dict(started, id="j2"), "d2", ["show version"]),
+        ]
+        mock_client._http.get.return_value = dict(sample_job_data, id="j2")
+        group = JobGroup(jobs=jobs)
+        jobs[0].results()  # pools j1's outputs
+
+        buf = io.StringIO()
+        with patch("time.sleep"):
+            assert group.write_ndjson(buf, release=True) == 2
+
+        lines = [json.loads(line) for line in buf.getvalue().splitlines()]
+        assert [line["job_id"] for line in lines] == ["j1", "j2"]
+        assert lines[0]["stdout"].startswith("Cisco")
+        assert "result" not in jobs[0]._data
+        assert len(group._outputs) == 0
+        with pytest.raises(RuntimeError, match="released"):
+            jobs[0].results()
+
+        binary = io.BytesIO()
+        fresh = JobGroup(jobs=[Job(mock_client, sample_job_data, "d1", ["show version"])])
+        fresh.write_ndjson(binary)
+        assert json.loads(binary.getvalue()) == fresh.results()[0].to_dict()
+
+    def test_batched_refresh_falls_back_when_id_filter_is_ignored(
+        self, mock_client, sample_job_data
+    ):
+        started = {**sample_job_data, "status": "started", "result": None}
+        jobs = [Job(mock_client, dict(started, id=f"j{i}"), f"d{i}", ["c1"]) for i in range(2)]
+        others = [dict(sample_job_data, id=f"other-{i}") for i in range(5)]
+
+        def fake_get(path, params=None):
+            if path == "/jobs":
+                return others + [dict(sample_job_data, id=j.id) for j in jobs]
+            return dict(sample_job_data, id=path.rsplit("/", 1)[-1])
+
+        mock_client._http.get.side_effect = fake_get
+        mock_client.batch_poll = True
+        group = JobGroup(jobs=jobs, batch_refresh=True)
+        group.refresh()
+
+        paths = [c.args[0] for c in mock_client._http.get.call_args_list]
+        assert paths == ["/jobs", "/jobs/j0", "/jobs/j1"]
+        assert group.is_done() is True
+        assert mock_client.batch_poll is False
+        assert mock_client._fetch_job_data(["j0"]) == {}
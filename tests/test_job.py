@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import patch
-from netpulse_sdk import Job
+from netpulse_sdk import CompactResult, Job
 from netpulse_sdk.error import JobFailedError
 
 class TestJob:
@@ -61,6 +61,25 @@ class TestJob:
         assert job.stdout_dict["c2"] == "out2"
         assert job.parsed["c2"]["v"] == 2
 
+    def test_job_compact_results(self, mock_client, sample_job_data):
+        failed = {
+            "id": "j-fail", "status": "failed",
+            "result": {"type": 2, "retval": None,
+                       "error": {"type": "timeout", "message": "Read timed out"}},
+        }
+        for data, cmds in ((sample_job_data, ["show version"]), (failed, ["c1"])):
+            job = Job(mock_client, data, "d1", cmds)
+            compact = job.results(compact=True)
+
+            assert isinstance(compact[0], CompactResult)
+            assert job.results(compact=True) is compact
+            assert [c.to_result() for c in compact] == job.results()
+            assert [c.to_dict() for c in compact] == [r.to_dict() for r in job.results()]
+
+        assert compact[0].ok is False
+        assert compact[0].error.retryable is True
+        assert compact[0].has_device_error() is True
+
     def test_job_wait_with_backoff(self, mock_client, sample_job_data):
         # Mocking time.sleep to speed up tests
         with patch("time.sleep"):
@@ -213,3 +232,37 @@ class TestJob:
         assert results[0].ok is False
         assert results[0].error.message == "Device timed out"
         assert results[0].error.retryable is True  # timeout is retryable
+
+    def test_status_checks_do_not_build_results(self, mock_client):
+        data = {
+            "id": "j-status", "status": "finished", "duration": 1.0,
+            "result": {
+                "type": 1,
+                "retval": [
+                    {"command": "c1", "stdout": "ok", "exit_status": 0},
+                    {"command": "c2", "stdout": "", "exit_status": 1},
+                ],
+            },
+        }
+        job = Job(mock_client, data, "d1", ["c1", "c2"])
+
+        assert not job
+        assert job.all_ok is False
+        assert job.failed_commands == ["c2"]
+        assert "1/2 FAILED" in job.summary()
+        assert job._results_cache is None
+
+        # Same verdict as the full Result models
+        assert [r.ok for r in job.results()] == [True, False]
+
+    def test_status_checks_without_result_payload(self, mock_client):
+        data = {"id": "j-empty", "status": "failed", "duration": 1.0, "result": None}
+        job = Job(mock_client, data, "d1", ["show ver", "show clock"])
+
+        before = (job.failed_commands, job.summary())
+        assert job.results() == []
+        after = (job.failed_commands, job.summary())
+
+        assert before == after
+        assert before[0] == []
+        assert "0/0" in before[1]
@@ -1,5 +1,7 @@
 from netpulse_sdk import Result
-from netpulse_sdk.result import DetachedTaskLog, DetachedTaskInfo, WorkerInfo, ConnectionTestResult
+from netpulse_sdk.result import (
+    DetachedTaskLog, DetachedTaskInfo, WorkerInfo, ConnectionTestResult, ErrorMatcher
+)
 
 class TestResult:
     def test_result_is_success(self):
@@ -23,6 +25,26 @@ class TestResult:
         assert res.has_device_error() is True
         assert "Invalid" in res.get_error_lines()[0]
 
+    def test_error_matcher_matches_per_line(self):
+        stdout = "ok\r\n  % Invalid input\r\nfoo error: bar\nBad\nIP address\n%Ambiguous"
+        matcher = ErrorMatcher.get()
+        assert matcher is ErrorMatcher.get(None)
+        assert matcher.error_lines(stdout) == ["% Invalid input", "foo error: bar", "%Ambiguous"]
+
+        # Custom patterns whose match would span lines are still matched per line
+        spanning = ErrorMatcher.get([r"Bad\s+IP"])
+        assert spanning.search(stdout) is False
+        assert spanning.search("Bad  IP") is True
+
+    def test_result_custom_error_patterns(self):
+        res = Result(
+            job_id="1", device_id="d1", device_name="n1",
+            command="show run", stdout="line 1\nFAILURE: disk full", ok=True
+        )
+        assert res.has_device_error() is False
+        assert res.has_device_error(patterns=[r"^failure"]) is True
+        assert res.get_error_lines(patterns=[r"^failure"]) == ["FAILURE: disk full"]
+
     def test_result_failed_task(self):
         # Case 3: Task itself failed
         res = Result(
@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+from netpulse_sdk import Job, JobGroup
+from netpulse_sdk.error import NetworkError
+from netpulse_sdk.scheduler import PollScheduler
+
+
+@pytest.fixture
+def scheduler(mock_client):
+    mock_client._poll_scheduler = PollScheduler(mock_client, min_interval=0.01, coalesce_window=1.0)
+    yield mock_client._poll_scheduler
+    mock_client._poll_scheduler.close()
+
+
+def _started(sample_job_data, job_id):
+    return dict(sample_job_data, id=job_id, status="started", result=None)
+
+
+class TestPollScheduler:
+    def test_waiters_share_batched_polls(self, mock_client, sample_job_data, scheduler):
+        calls = []
+
+        def fake_get(path, params=None):
+            calls.append(params["id"])
+            return [dict(sample_job_data, id=i, duration=2.0) for i in params["id"]]
+
+        mock_client._http.get.side_effect = fake_get
+        mock_client.batch_poll = True
+        jobs = [Job(mock_client, _started(sample_job_data, f"j{i}"), f"d{i}") for i in range(3)]
+        scheduler.subscribe(jobs)
+
+        threads = [threading.Thread(target=job.wait, kwargs={"timeout": 5}) for job in jobs[:2]]
+        for t in threads:
+            t.start()
+        JobGroup(jobs).wait(timeout=5)
+        for t in threads:
+            t.join(5)
+
+        assert all(job.is_done() for job in jobs)
+        assert len(calls) == 1
+        assert sorted(calls[0]) == ["j0", "j1", "j2"]
+        assert scheduler.expected_duration == 2.0
+
+    def test_adaptive_interval(self, mock_client, scheduler):
+        from netpulse_sdk.scheduler import _Entry
+
+        scheduler.min_interval, scheduler.max_interval = 0.5, 5.0
+        scheduler.expected_duration = 6.0
+        entry = _Entry("j1", now=100.0)
+
+        assert scheduler._next_interval(entry, "queued", 100.0) == 3.0
+        entry.started_at = 100.0
+        assert scheduler._next_interval(entry, "started", 105.0) == 0.5
+        assert scheduler._next_interval(entry, "started", 120.0) == 5.0
+
+    def test_poll_error_reaches_waiter(self, mock_client, sample_job_data, scheduler):
+        mock_client._http.get.side_effect = NetworkError("connection reset")
+        job = Job(mock_client, _started(sample_job_data, "j1"), "d1")
+
+        with pytest.raises(NetworkError):
+            job.wait(timeout=5)
+
+    def test_poll_error_reaches_every_waiter(self, mock_client, sample_job_data, scheduler):
+        mock_client._http.get.side_effect = NetworkError("connection reset")
+        job = Job(mock_client, _started(sample_job_data, "j1"), "d1")
+        errors = []
+
+        def wait():
+            try:
+                job.wait(timeout=5)
+            except NetworkError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=wait) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+
+        assert not any(t.is_alive() for t in threads)
+        assert len(errors) == 2
+
+    @pytest.mark.parametrize("setting", ["batch_poll", "_batch_poll_supported"])
+    def test_fallback_polls_in_parallel_without_batch_support(
+        self, mock_client, sample_job_data, scheduler, setting
+    ):
+        mock_client.batch_poll = True
+        setattr(mock_client, setting, False)
+        barrier = threading.Barrier(3, timeout=2)
+
+        def fake_get(path, params=None):
+            assert path != "/jobs"
+            barrier.wait()
+            return dict(sample_job_data, id=path.rsplit("/", 1)[-1])
+
+        mock_client._http.get.side_effect = fake_get
+        jobs = [Job(mock_client, _started(sample_job_data, f"j{i}"), f"d{i}") for i in range(3)]
+        JobGroup(jobs).wait(timeout=5)
+
+        assert all(job.is_done() for job in jobs)
+        assert mock_client._http.get.call_count == 3
+
+    def test_closed_scheduler_rejects_subscriptions(self, mock_client, sample_job_data, scheduler):
+        scheduler.close()
+        job = Job(mock_client, _started(sample_job_data, "j1"), "d1")
+
+        with pytest.raises(RuntimeError, match="closed"):
+            scheduler.subscribe([job])
+        assert scheduler._entries == {}
@@ -0,0 +1,79 @@
+import os
+import pytest
+from unittest.mock import patch
+from netpulse_sdk import Job, JobGroup, SpilledResults, SpillStore
+
+
+class TestSpillStore:
+    def test_append_read_and_close(self, tmp_path):
+        store = SpillStore(str(tmp_path))
+        first = store.append(b'{"a":1}')
+        assert store.read(*first) == b'{"a":1}'
+
+        # Appending after the first read grows the segment past the current mapping
+        second = store.append(b"[2]")
+        assert store.read(*second) == b"[2]"
+        assert store.read(*first) == b'{"a":1}'
+        assert store.size == 10
+
+        store.close()
+        assert store.closed and not os.path.exists(store.path)
+        with pytest.raises(ValueError, match="closed"):
+            store.read(*first)
+
+
+class TestSpilledGroup:
+    def test_finished_payloads_move_to_disk(self, mock_client, sample_job_data, tmp_path):
+        started = {**sample_job_data, "status": "started", "result": None}
+        jobs = [
+            Job(mock_client, dict(sample_job_data, id="j1"), "d1", ["show version"]),
+            Job(mock_client, dict(started, id="j2"), "d2", ["show version"]),
+        ]
+        mock_client._http.get.return_value = dict(sample_job_data, id="j2")
+        group = JobGroup(jobs=jobs, spill=SpillStore(str(tmp_path)))
+
+        # Reading state has no side effects; payloads spill once jobs settle
+        assert group.pending == [jobs[1]]
+        assert not group.is_done()
+        assert "result" in jobs[0]._data and group.spill.size == 0
+
+        with patch("time.sleep"):
+            group.wait()
+
+        assert all("result" not in job._data for job in jobs)
+        assert group.spill.size > 0
+
+        results = group.results_view()
+        assert isinstance(results, SpilledResults)
+        assert len(results) == 2
+        assert [r.job_id for r in results] == ["j1", "j2"]
+        assert results[-1].stdout.startswith("Cisco")
+        assert jobs[0].result_type == 1
+        assert group.get_result("10.0.0.1", "show version").job_id == "j2"
+        # The index holds positions, not Result objects
+        assert group._index_cache.by_key[("10.0.0.1", "show version")] == 1
+        assert [r.job_id for r in group.results(compact=True)] == ["j1", "j2"]
+        # results() stays a list in spill mode
+        listed = group.results()
+        listed.sort(key=lambda r: r.job_id, reverse=True)
+        assert [r.job_id for r in listed] == ["j2", "j1"]
+
+    def test_client_spill_dir(self, mock_client, tmp_path):
+        mock_client.spill_dir = str(tmp_path)
+        mock_client._http.post.return_value = {
+            "succeeded": [
+                {"id": "j1", "status": "queued", "connection_args": {"host": "d1"}},
+                {"id": "j2", "status": "queued", "connection_args": {"host": "d2"}},
+            ],
+            "failed": [],
+        }
+
+        group = mock_client.run(devices=["d1", "d2"], command="show clock")
+
+        assert isinstance(group.spill, SpillStore)
+        assert os.path.dirname(group.spill.path) == str(tmp_path)
+
+        with group:
+            assert os.path.exists(group.spill.path)
+        assert group.spill.closed
+        assert not os.path.exists(group.spill.path)
@@ -0,0 +1,466 @@
+import asyncio
+import gzip
+import json
+import threading
+import time
+import httpx
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from netpulse_sdk.error import CircuitOpenError, RequestTimeoutError
+from netpulse_sdk.transport import (
+    AdaptiveConcurrency,
+    AsyncHTTPClient,
+    CircuitBreaker,
+    EndpointPool,
+    HTTPClient,
+    RateLimit,
+    RetryPolicy,
+)
+
+
+def mock_session(client, handler):
+    client.session = httpx.Client(
+        base_url=client.base_url,
+        headers=client.session.headers,
+        timeout=client.timeout,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class TestCompression:
+    def test_large_bodies_are_gzipped(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"succeeded": [], "failed": []})
+
+        client = HTTPClient(
+            base_url="http://api.test", api_key="k", compression="gzip", compression_threshold=1024
+        )
+        mock_session(client, handler)
+
+        devices = [{"host": f"10.0.0.{i}"} for i in range(200)]
+        client.post("/device/bulk", json={"devices": devices})
+        client.post("/device/bulk", json={"devices": devices[:1]})
+
+        large, small = seen
+        assert large.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(large.content))["devices"] == devices
+        assert "Content-Encoding" not in small.headers
+        assert json.loads(small.content)["devices"] == devices[:1]
+
+    def test_responses_are_negotiated_and_decoded(self):
+        body = json.dumps([{"id": f"job-{i}", "status": "finished"} for i in range(100)])
+
+        def handler(request):
+            assert "gzip" in request.headers["Accept-Encoding"]
+            return httpx.Response(
+                200, content=gzip.compress(body.encode()), headers={"Content-Encoding": "gzip"}
+            )
+
+        client = mock_session(HTTPClient(base_url="http://api.test", api_key="k"), handler)
+
+        assert client.get("/jobs") == json.loads(body)
+
+    def test_unknown_compression(self):
+        with pytest.raises(ValueError, match="Unknown compression"):
+            HTTPClient(base_url="http://api.test", api_key="k", compression="br")
+
+
+class TestRateLimit:
+    def test_token_bucket_delays_beyond_burst(self):
+        limit = RateLimit(rate=10, burst=2)
+        assert limit._reserve() == 0
+        assert limit._reserve() == 0
+        assert limit._reserve() == pytest.approx(0.1, abs=0.02)
+        assert limit._reserve() == pytest.approx(0.2, abs=0.02)
+
+    def test_in_flight_cap_applies_per_endpoint_class(self):
+        active = {"GET": 0, "POST": 0}
+        peak = {"GET": 0, "POST": 0}
+        lock = threading.Lock()
+
+        def handler(request):
+            with lock:
+                active[request.method] += 1
+                peak[request.method] = max(peak[request.method], active[request.method])
+            time.sleep(0.05)
+            with lock:
+                active[request.method] -= 1
+            return httpx.Response(200, json={})
+
+        client = HTTPClient(
+            base_url="http://api.test", api_key="k", rate_limits={"poll": {"max_in_flight": 2}}
+        )
+        mock_session(client, handler)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: client.get(f"/jobs/{i}"), range(8)))
+            list(executor.map(lambda i: client.post("/device/exec", json={}), range(8)))
+
+        assert peak["GET"] == 2
+        assert peak["POST"] > 2
+
+    def test_async_slot(self):
+        limit = RateLimit(max_in_flight=1)
+        order = []
+
+        async def task(i):
+            async with limit.async_slot():
+                order.append(("start", i))
+                await asyncio.sleep(0)
+                order.append(("end", i))
+
+        async def scenario():
+            await asyncio.gather(task(1), task(2))
+
+        asyncio.run(scenario())
+        asyncio.run(scenario())  # semaphores are per event loop
+        assert order[:4] == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+    def test_unknown_endpoint_class(self):
+        with pytest.raises(ValueError, match="Unknown endpoint class"):
+            HTTPClient(base_url="http://api.test", api_key="k", rate_limits={"jobs": {"rate": 1}})
+
+
+class TestAdaptiveConcurrency:
+    def test_additive_increase_and_multiplicative_backoff(self):
+        controller = AdaptiveConcurrency(initial=4, max_limit=8)
+
+        for _ in range(40):
+            with controller.slot():
+                pass
+        assert controller.limit == pytest.approx(8)
+
+        # Concurrent failures of one overload episode back off once
+        with pytest.raises(httpx.ReadTimeout):
+            with ExitStack() as stack:
+                for _ in range(3):
+                    stack.enter_context(controller.slot())
+                raise httpx.ReadTimeout("timed out")
+        assert controller.limit == pytest.approx(4)
+        assert controller.in_flight == 0
+
+        # A request sent after the decrease can trigger the next one
+        with pytest.raises(httpx.ReadTimeout):
+            with controller.slot():
+                raise httpx.ReadTimeout("timed out")
+        assert controller.limit == pytest.approx(2)
+
+    def test_server_errors_reduce_http_concurrency(self):
+        statuses = iter([200, 200, 503])
+
+        def handler(request):
+            return httpx.Response(next(statuses), json={})
+
+        client = HTTPClient(
+            base_url="http://api.test", api_key="k", adaptive_concurrency={"initial": 10}
+        )
+        mock_session(client, handler)
+
+        client.get("/jobs")
+        client.get("/jobs")
+        assert client.concurrency.limit > 10
+        with pytest.raises(Exception):
+            client.get("/jobs")
+        assert client.concurrency.limit < 6
+        assert client.fanout_limit(1000) == client.concurrency.max_limit
+
+    def test_slots_block_at_limit(self):
+        controller = AdaptiveConcurrency(initial=1, max_limit=1)
+        order = []
+
+        async def task(i):
+            async with controller.async_slot():
+                order.append(("start", i))
+                await asyncio.sleep(0)
+                order.append(("end", i))
+
+        async def scenario():
+            await asyncio.gather(task(1), task(2))
+
+        asyncio.run(scenario())
+        assert order == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+
+class TestHedging:
+    def test_slow_primary_is_hedged(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                time.sleep(0.3)
+                return httpx.Response(200, json={"id": "j1", "from": "primary"})
+            return httpx.Response(200, json={"id": "j1", "from": "hedge"})
+
+        client = HTTPClient(
+            base_url="http://api.test", api_key="k", hedging={"initial_delay": 0.02}
+        )
+        mock_session(client, handler)
+
+        assert client.get("/jobs/j1")["from"] == "hedge"
+        client.get("/jobs")  # list queries are not hedged
+        stats = client.hedging.stats()
+        assert stats["requests"] == 1
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+        assert calls[:2] == ["/jobs/j1", "/jobs/j1"]
+        client.close()
+
+    def test_local_queueing_does_not_trigger_hedges(self):
+        def handler(request):
+            time.sleep(0.1)
+            return httpx.Response(200, json={"id": "j1"})
+
+        client = HTTPClient(
+            base_url="http://api.test", api_key="k", pool_maxsize=1,
+            hedging={"initial_delay": 0.15},
+        )
+        mock_session(client, handler)
+        threads = [threading.Thread(target=client.get, args=("/jobs/j1",)) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+
+        assert client.hedging.stats()["hedged"] == 0
+        assert client.hedging.stats()["requests"] == 3
+        client.close()
+
+    def test_hedge_pools_are_per_client(self):
+        a = HTTPClient(base_url="http://api.test", api_key="k", hedging=True)
+        b = HTTPClient(base_url="http://api.test", api_key="k", hedging=True)
+        assert a._executor_lock is not b._executor_lock
+        a._start_hedge_pools()
+        # Sized like a refresh fan-out, not to pool_maxsize (200)
+        assert a._executor._max_workers == 50
+        assert a._hedge_pool._max_workers == 5
+        a.close()
+        b.close()
+
+    def test_async_hedge_cancels_loser(self):
+        calls = []
+        cancelled = []
+
+        async def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+            return httpx.Response(200, json={"name": "w1"})
+
+        async def scenario():
+            client = AsyncHTTPClient(
+                base_url="http://api.test", api_key="k", hedging={"initial_delay": 0.02}
+            )
+            client.session = httpx.AsyncClient(
+                base_url=client.base_url, transport=httpx.MockTransport(handler)
+            )
+            try:
+                return await client.get("/workers")
+            finally:
+                await client.close()
+
+        assert asyncio.run(scenario()) == {"name": "w1"}
+        assert len(calls) == 2
+        assert cancelled == [True]
+
+
+class TestEndpointBalancing:
+    URLS = ["http://api-a.test", "http://api-b.test", "http://api-c.test"]
+
+    def test_least_outstanding_requests(self):
+        pool = EndpointPool(self.URLS)
+        busy = pool.pick()
+        picked = {pool.pick().url, pool.pick().url}
+        assert busy.url not in picked
+        assert len(picked) == 2
+
+        pool.release(busy, failed=True)
+        assert not busy.healthy
+        assert all(pool.pick().url != busy.url for _ in range(6))
+        assert pool.due_probes() == []
+
+        busy.probe_at = 0  # ejection expired
+        assert pool.due_probes() == [busy]
+        pool.mark_health(busy, ok=True)
+        assert busy.healthy and busy.failures == 0
+
+    def test_idempotent_requests_fail_over(self):
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            if request.url.host == "api-a.test":
+                raise httpx.ConnectError("connection refused")
+            if request.url.host == "api-b.test":
+                return httpx.Response(503, json={})
+            return httpx.Response(200, json={"host": request.url.host})
+
+        client = mock_session(HTTPClient(base_url=self.URLS, api_key="k"), handler)
+
+        for _ in range(3):
+            assert client.get("/jobs") == {"host": "api-c.test"}
+        assert set(hosts) == {"api-a.test", "api-b.test", "api-c.test"}
+        # Failed replicas are ejected, so later requests go straight to the healthy one
+        assert hosts[-2:] == ["api-c.test", "api-c.test"]
+        stats = {s["url"]: s for s in client.endpoints.stats()}
+        assert not stats["http://api-a.test"]["healthy"]
+        assert not stats["http://api-b.test"]["healthy"]
+
+    def test_post_only_fails_over_before_connecting(self):
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            if request.url.path == "/health":
+                return httpx.Response(200, json={})
+            raise httpx.ReadTimeout("timed out")
+
+        client = HTTPClient(base_url=self.URLS[:2], api_key="k")
+        mock_session(client, handler)
+
+        with pytest.raises(RequestTimeoutError):
+            client.post("/device/exec", json={})
+        assert len(hosts) == 1
+
+        stats = client.check_endpoints()
+        assert all(s["healthy"] for s in stats)
+
+
+class TestCircuitBreaker:
+    def test_opens_on_error_rate_and_recovers_after_trial(self):
+        breaker = CircuitBreaker("api.test", min_requests=4, open_seconds=0.05)
+        for ok in (True, False, True, False):
+            assert breaker.before_request() is False
+            breaker.record(ok)
+        assert breaker.state == "open"
+
+        with pytest.raises(CircuitOpenError) as exc:
+            breaker.before_request()
+        assert exc.value.host == "api.test"
+        assert 0 < exc.value.retry_after <= 0.05
+
+        time.sleep(0.06)
+        assert breaker.before_request() is True  # trial
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()  # only one trial at a time
+        breaker.record(False, trial=True)
+        assert breaker.state == "open"
+
+        time.sleep(0.06)
+        breaker.record(True, trial=breaker.before_request())
+        assert breaker.state == "closed"
+
+    def test_open_circuit_fails_fast(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.host)
+            raise httpx.ConnectTimeout("timed out")
+
+        client = HTTPClient(
+            base_url="http://api.test", api_key="k", circuit_breaker={"min_requests": 3}
+        )
+        mock_session(client, handler)
+
+        for _ in range(3):
+            with pytest.raises(RequestTimeoutError):
+                client.get("/jobs")
+        with pytest.raises(CircuitOpenError):
+            client.get("/jobs")
+        assert len(calls) == 3
+        assert client.breakers.stats()["api.test"]["rejected"] == 1
+
+    def test_balancer_skips_open_replica(self):
+        def handler(request):
+            return httpx.Response(200, json={"host": request.url.host})
+
+        client = HTTPClient(
+            base_url=["http://api-a.test", "http://api-b.test"],
+            api_key="k",
+            circuit_breaker=True,
+        )
+        mock_session(client, handler)
+        client.breakers.get("api-a.test")._open(time.monotonic())
+
+        # A POST may fail over too: the open circuit kept it from being sent
+        assert client.post("/device/exec", json={}) == {"host": "api-b.test"}
+        assert client.get("/jobs") == {"host": "api-b.test"}
+
+
+class TestTimeouts:
+    def test_per_operation_profiles(self):
+        seen = {}
+
+        def handler(request):
+            seen[request.url.path] = request.extensions["timeout"]
+            return httpx.Response(200, json={})
+
+        client = HTTPClient(
+            base_url="http://api.test",
+            api_key="k",
+            timeout={"connect": 3, "read": 30},
+            timeouts={"poll": 5, "template": {"read": 120}},
+        )
+        mock_session(client, handler)
+
+        client.get("/jobs")
+        client.post("/template/render", json={})
+        client.post("/device/exec", json={})
+
+        assert seen["/jobs"] == httpx.Timeout(5).as_dict()
+        assert seen["/template/render"] == {"connect": 3, "read": 120, "write": 30, "pool": 30}
+        assert seen["/device/exec"] == {"connect": 3, "read": 30, "write": 30, "pool": 30}
+
+    def test_invalid_profiles(self):
+        with pytest.raises(ValueError, match="Unknown timeout profile"):
+            HTTPClient(base_url="http://api.test", api_key="k", timeouts={"jobs": 5})
+        with pytest.raises(ValueError, match="Unknown timeout field"):
+            HTTPClient(base_url="http://api.test", api_key="k", timeout={"total": 5})
+
+
+class TestRetryPolicy:
+    def test_jittered_backoff_is_capped(self):
+        policy = RetryPolicy(backoff=1, max_backoff=4)
+        for retry, cap in [(0, 1), (1, 2), (2, 4), (5, 4)]:
+            delays = [policy.backoff_delay(retry) for _ in range(50)]
+            assert all(0 <= d <= cap for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_and_idempotency(self):
+        policy = RetryPolicy(max_retry_after=10)
+        busy = httpx.Response(503, headers={"Retry-After": "3"})
+        assert policy.delay(0, "GET", response=busy) == 3
+        assert policy.delay(0, "POST", response=busy) is None
+        assert policy.delay(0, "POST", {"Idempotency-Key": "k"}, response=busy) == 3
+        assert policy.delay(0, "POST", error=httpx.ConnectError("refused")) is not None
+        too_long = httpx.Response(429, headers={"Retry-After": "60"})
+        assert policy.delay(0, "GET", response=too_long) is None
+        assert policy.delay(0, "GET", response=httpx.Response(500)) is None
+        assert policy.delay(3, "GET", response=busy) is None  # attempts exhausted
+
+    def test_client_retries_with_idempotency_key(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if len(requests) < 3:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"succeeded": [], "failed": []})
+
+        client = HTTPClient(
+            base_url="http://api.test", api_key="k", retry={"idempotency_keys": True}
+        )
+        mock_session(client, handler)
+
+        assert client.post("/device/bulk", json={"devices": []}) == {"succeeded": [], "failed": []}
+        keys = {r.headers["Idempotency-Key"] for r in requests}
+        assert len(requests) == 3 and len(keys) == 1
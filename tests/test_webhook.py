@@ -0,0 +1,124 @@
+import asyncio
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+from netpulse_sdk import AsyncJob, Job, JobGroup, WebhookEvent, WebhookReceiver
+from netpulse_sdk.webhook import TOKEN_HEADER
+
+
+def _event(job_id, **overrides):
+    event = {
+        "id": job_id,
+        "status": "finished",
+        "event_type": "job.completed",
+        "final": True,
+        "timestamp": "2026-01-01T00:00:00Z",
+        "duration": 1.5,
+        "result": {
+            "type": "success",
+            "retval": [{"command": "show version", "stdout": "IOS XE", "exit_status": 0}],
+        },
+    }
+    event.update(overrides)
+    return event
+
+
+def _post(receiver, body, token=None):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{receiver.port}{receiver.path}",
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json", TOKEN_HEADER: token or receiver.token},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=5) as resp:
+        return resp.status
+
+
+@pytest.fixture
+def receiver():
+    with WebhookReceiver(host="127.0.0.1", fallback_interval=5.0) as r:
+        yield r
+
+
+class TestWebhookReceiver:
+    def test_collects_final_events_only(self, receiver):
+        assert _post(receiver, _event("j1", final=False, event_type="detached.log_push")) == 204
+        assert receiver.wait_any(["j1"], timeout=0) == {}
+
+        assert _post(receiver, _event("j1")) == 204
+        events = receiver.wait_any(["j1", "j2"], timeout=1)
+        assert list(events) == ["j1"]
+        assert events["j1"].status == "finished"
+
+    def test_rejects_bad_token_and_payload(self, receiver):
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            _post(receiver, _event("j1"), token="wrong")
+        assert exc.value.code == 403
+
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            _post(receiver, {"id": "j1"})
+        assert exc.value.code == 400
+
+    def test_run_registers_receiver(self, mock_client, sample_job_data, receiver):
+        mock_client._webhook_receiver = receiver
+        mock_client._http.post.return_value = {**sample_job_data, "status": "queued", "result": None}
+
+        job = mock_client.run(devices="10.0.0.1", command="show version")
+
+        payload = mock_client._http.post.call_args[1]["json"]
+        assert payload["webhook"]["url"] == receiver.url
+        assert payload["webhook"]["headers"][TOKEN_HEADER] == receiver.token
+        assert job._receiver is receiver
+
+        # An explicit webhook is left untouched and jobs fall back to polling
+        job = mock_client.run(
+            devices="10.0.0.1", command="show version", webhook={"url": "http://hook"}
+        )
+        assert mock_client._http.post.call_args[1]["json"]["webhook"] == {"url": "http://hook"}
+        assert job._receiver is None
+
+    def test_job_wait_completes_on_push(self, mock_client, sample_job_data, receiver):
+        job = Job(mock_client, {**sample_job_data, "status": "queued", "result": None}, "d1")
+        job._receiver = receiver
+        _post(receiver, _event(job.id))
+
+        job.wait()
+
+        mock_client._http.get.assert_not_called()
+        assert job.status == "finished"
+        assert job.duration == 1.5
+        assert job.all_ok is True
+        assert job.stdout == "IOS XE"
+
+    def test_group_wait_falls_back_to_polling(self, mock_client, sample_job_data):
+        receiver = WebhookReceiver(fallback_interval=0)
+        queued = {**sample_job_data, "status": "queued", "result": None}
+        jobs = [Job(mock_client, dict(queued, id=f"j{i}"), f"d{i}") for i in range(2)]
+        for job in jobs:
+            job._receiver = receiver
+        receiver.deliver(WebhookEvent.model_validate(_event("j0")))
+        mock_client._http.get.side_effect = lambda path: dict(sample_job_data, id="j1")
+
+        group = JobGroup(jobs).wait()
+
+        assert group.is_done() is True
+        assert [c[0][0] for c in mock_client._http.get.call_args_list] == ["/jobs/j1"]
+
+    def test_async_job_wait_completes_on_push(self, mock_async_client, sample_job_data, receiver):
+        job = AsyncJob(
+            mock_async_client, {**sample_job_data, "status": "started", "result": None}, "d1"
+        )
+        job._receiver = receiver
+
+        async def scenario():
+            waiter = asyncio.ensure_future(job.wait())
+            await asyncio.sleep(0.05)
+            await asyncio.get_running_loop().run_in_executor(None, _post, receiver, _event(job.id))
+            return await asyncio.wait_for(waiter, 5)
+
+        asyncio.run(scenario())
+        mock_async_client._http.get.assert_not_called()
+        assert job.status == "finished"
+